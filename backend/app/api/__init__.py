@@ -1,5 +1,5 @@
 """API module."""
 
-from app.api.routes import pitchers_router, leaderboards_router, discover_router, stats_router
+from app.api.routes import pitchers_router, leaderboards_router, discover_router, stats_router, admin_router
 
-__all__ = ["pitchers_router", "leaderboards_router", "discover_router", "stats_router"]
+__all__ = ["pitchers_router", "leaderboards_router", "discover_router", "stats_router", "admin_router"]
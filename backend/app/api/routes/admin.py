@@ -0,0 +1,62 @@
+"""API routes for operators: diagnostics that aren't part of the public API."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.profiling import media_type, profile_store
+from app.core.slow_queries import slow_query_log
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Check X-Admin-Token; without a configured admin_token the routes don't exist."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not settings.admin_token_matches(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/slow-queries")
+async def get_slow_queries():
+    """
+    Get the most recent slow SQL statements, newest first.
+
+    Each entry has the statement, its bound parameters, its duration and
+    the database's query plan. Empty unless SLOW_QUERY_MS is set.
+    """
+    return {
+        "enabled": slow_query_log.enabled,
+        "threshold_ms": slow_query_log.threshold_ms,
+        "entries": slow_query_log.entries(),
+    }
+
+
+@router.delete("/slow-queries", status_code=204)
+async def clear_slow_queries():
+    """Empty the slow-query log."""
+    slow_query_log.clear()
+
+
+@router.get("/profiles")
+async def get_profiles():
+    """
+    List saved request profiles, newest first.
+
+    Profiles are captured with ?profile=svg (or speedscope/folded) or an
+    X-Profile header on any request when PROFILING_ENABLED is set.
+    """
+    return {"enabled": settings.profiling_enabled, "profiles": profile_store.list()}
+
+
+@router.get("/profiles/{name}")
+async def get_profile(name: str):
+    """Get a saved profile (SVG flame graph, speedscope JSON or folded stacks)."""
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type=media_type(name))
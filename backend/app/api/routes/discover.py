@@ -4,7 +4,8 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.core.responses import FastJSONResponse
 from app.services.correlation_service import (
     CorrelationService,
     STAT_CONFIGS,
@@ -13,12 +14,8 @@ from app.services.correlation_service import (
 )
 from app.schemas.discover import (
     StatConfig,
-    RegressionLine,
-    ScatterPoint,
     CorrelationResponse,
-    StickinessEntry,
     StickinessResponse,
-    PredictiveEntry,
     PredictiveResponse,
     TrendPoint,
     TrendsResponse,
@@ -46,52 +43,57 @@ async def get_available_stats():
 
 
 @router.get("/correlations", response_model=CorrelationResponse)
-async def get_correlations(
+def get_correlations(
     stat_x: str = Query(..., description="X-axis statistic"),
     stat_y: str = Query(..., description="Y-axis statistic"),
     year: Optional[int] = Query(None, description="Season year (None for all years)"),
     is_starter: Optional[bool] = Query(None, description="Filter by starter/reliever"),
     min_innings: float = Query(50.0, ge=0, description="Minimum innings pitched"),
-    db: Session = Depends(get_db),
+    include_scatter: bool = Query(True, description="Include scatter plot points"),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get correlation between two statistics with scatter plot data.
 
     Returns Pearson correlation coefficient, R², regression line, and scatter points.
+    With include_scatter=false the scatter data is empty and the fit comes from
+    precomputed moments, independent of the number of pitchers.
     """
     service = CorrelationService(db)
-    result = service.compute_correlation(stat_x, stat_y, year, is_starter, min_innings)
-
-    return CorrelationResponse(
-        stat_x=stat_x,
-        stat_x_name=get_stat_name(stat_x),
-        stat_y=stat_y,
-        stat_y_name=get_stat_name(stat_y),
-        year=year,
-        is_starter=is_starter,
-        min_innings=min_innings,
-        correlation_r=result["correlation_r"],
-        r_squared=result["r_squared"],
-        p_value=result["p_value"],
-        sample_size=result["sample_size"],
-        regression=RegressionLine(
-            slope=result["slope"],
-            intercept=result["intercept"],
-            equation=result["equation"],
-        ),
-        scatter_data=[
-            ScatterPoint(**point) for point in result["scatter_data"]
-        ],
+    result = service.compute_correlation(
+        stat_x, stat_y, year, is_starter, min_innings, include_scatter
     )
 
+    # Scatter data can be thousands of points: build the CorrelationResponse
+    # payload as plain dicts (see app.core.responses)
+    return FastJSONResponse({
+        "stat_x": stat_x,
+        "stat_x_name": get_stat_name(stat_x),
+        "stat_y": stat_y,
+        "stat_y_name": get_stat_name(stat_y),
+        "year": year,
+        "is_starter": is_starter,
+        "min_innings": min_innings,
+        "correlation_r": result["correlation_r"],
+        "r_squared": result["r_squared"],
+        "p_value": result["p_value"],
+        "sample_size": result["sample_size"],
+        "regression": {
+            "slope": result["slope"],
+            "intercept": result["intercept"],
+            "equation": result["equation"],
+        },
+        "scatter_data": result["scatter_data"],
+    })
+
 
 @router.get("/correlation-rankings")
-async def get_correlation_rankings(
+def get_correlation_rankings(
     target_stat: str = Query(..., description="Target statistic (Y-axis)"),
     year: Optional[int] = Query(None, description="Season year (None for all years)"),
     is_starter: Optional[bool] = Query(None, description="Filter by starter/reliever"),
     min_innings: float = Query(50.0, ge=0, description="Minimum innings pitched"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get all stats ranked by their correlation with a target stat.
@@ -101,18 +103,18 @@ async def get_correlation_rankings(
     service = CorrelationService(db)
     results = service.get_correlation_rankings(target_stat, year, is_starter, min_innings)
 
-    return {
+    return FastJSONResponse({
         "target_stat": target_stat,
         "target_stat_name": get_stat_name(target_stat),
         "entries": results,
-    }
+    })
 
 
 @router.get("/stickiness", response_model=StickinessResponse)
-async def get_stickiness(
+def get_stickiness(
     is_starter: Optional[bool] = Query(None, description="Filter by starter/reliever"),
     min_innings: float = Query(50.0, ge=0, description="Minimum innings pitched"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get year-over-year stickiness rankings for all stats.
@@ -123,30 +125,20 @@ async def get_stickiness(
     service = CorrelationService(db)
     results = service.get_all_stickiness_rankings(is_starter, min_innings)
 
-    return StickinessResponse(
-        is_starter=is_starter,
-        min_innings=min_innings,
-        entries=[
-            StickinessEntry(
-                rank=entry["rank"],
-                stat=entry["stat"],
-                stat_name=entry["stat_name"],
-                category=entry["category"],
-                r_squared=entry["r_squared"],
-                sample_size=entry["sample_size"],
-                years_analyzed=entry["years_analyzed"],
-            )
-            for entry in results
-        ],
-    )
+    # Service entries carry exactly the StickinessEntry fields
+    return FastJSONResponse({
+        "is_starter": is_starter,
+        "min_innings": min_innings,
+        "entries": results,
+    })
 
 
 @router.get("/predictive", response_model=PredictiveResponse)
-async def get_predictive_power(
+def get_predictive_power(
     target_stat: str = Query("era", description="Target stat to predict"),
     is_starter: Optional[bool] = Query(None, description="Filter by starter/reliever"),
     min_innings: float = Query(50.0, ge=0, description="Minimum innings pitched"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get predictive power rankings for all stats against a target.
@@ -157,34 +149,23 @@ async def get_predictive_power(
     service = CorrelationService(db)
     results = service.get_all_predictive_rankings(target_stat, is_starter, min_innings)
 
-    return PredictiveResponse(
-        target_stat=target_stat,
-        target_stat_name=get_stat_name(target_stat),
-        is_starter=is_starter,
-        min_innings=min_innings,
-        entries=[
-            PredictiveEntry(
-                rank=entry["rank"],
-                stat=entry["stat"],
-                stat_name=entry["stat_name"],
-                category=entry["category"],
-                stickiness_r2=entry["stickiness_r2"],
-                predictive_r2=entry["predictive_r2"],
-                combined_score=entry["combined_score"],
-                sample_size=entry["sample_size"],
-            )
-            for entry in results
-        ],
-    )
+    # Service entries carry exactly the PredictiveEntry fields
+    return FastJSONResponse({
+        "target_stat": target_stat,
+        "target_stat_name": get_stat_name(target_stat),
+        "is_starter": is_starter,
+        "min_innings": min_innings,
+        "entries": results,
+    })
 
 
 @router.get("/trends", response_model=TrendsResponse)
-async def get_trends(
+def get_trends(
     stat_x: str = Query(..., description="X-axis statistic"),
     stat_y: str = Query(..., description="Y-axis statistic"),
     is_starter: Optional[bool] = Query(None, description="Filter by starter/reliever"),
     min_innings: float = Query(50.0, ge=0, description="Minimum innings pitched"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get correlation trend across years (2015-present).
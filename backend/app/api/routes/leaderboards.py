@@ -2,13 +2,13 @@
 
 from typing import Optional, Literal
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, case, distinct
-from sqlalchemy.orm import Session
+from sqlalchemy import String, case, cast, distinct, func
 
-from app.core.database import get_db
 from app.models.pitcher import Pitcher
 from app.models.pitch import Pitch
+from app.models.flags import PitchFlag, count_flag
 from app.schemas.leaderboard import LeaderboardEntry, LeaderboardResponse
+from app.services.analytics import Analytics, get_analytics
 
 router = APIRouter(prefix="/leaderboards", tags=["leaderboards"])
 
@@ -74,7 +74,7 @@ STAT_CONFIGS = {
 
 
 @router.get("", response_model=LeaderboardResponse)
-async def get_leaderboard(
+def get_leaderboard(
     stat: Literal[
         "velocity", "max_velocity", "spin_rate", "whiff_pct",
         "strikeout_pct", "h_movement", "v_movement", "strike_pct"
@@ -83,7 +83,7 @@ async def get_leaderboard(
     limit: int = Query(25, ge=10, le=50, description="Number of results (10, 25, or 50)"),
     is_starter: Optional[bool] = Query(None, description="Filter by starter (true) or reliever (false)"),
     min_pitches: int = Query(500, ge=100, le=2000, description="Minimum pitch count to qualify"),
-    db: Session = Depends(get_db),
+    analytics: Analytics = Depends(get_analytics),
 ):
     """
     Get leaderboard rankings for a specific statistic.
@@ -91,9 +91,11 @@ async def get_leaderboard(
     Returns pitchers ranked by the selected stat with optional filters
     for starter/reliever and minimum pitch count.
     """
+    db = analytics.db
+
     # If no year specified, get the most recent year with data
     if not year:
-        most_recent = db.query(func.max(Pitch.game_year)).scalar()
+        most_recent = analytics.scalar(db.query(func.max(Pitch.game_year)))
         if not most_recent:
             return LeaderboardResponse(
                 stat=stat,
@@ -123,23 +125,15 @@ async def get_leaderboard(
         stat_expr = func.avg(Pitch.release_spin_rate)
     elif stat == "whiff_pct":
         # Whiff % = swinging strikes / total swings (not total pitches)
-        swings = func.sum(case(
-            (Pitch.description.in_([
-                "swinging_strike", "swinging_strike_blocked",
-                "foul", "foul_tip", "foul_bunt", "hit_into_play"
-            ]), 1),
-            else_=0
-        ))
-        whiffs = func.sum(case(
-            (Pitch.description.in_(["swinging_strike", "swinging_strike_blocked"]), 1),
-            else_=0
-        ))
+        swings = count_flag(PitchFlag.SWING)
+        whiffs = count_flag(PitchFlag.WHIFF)
         stat_expr = (whiffs * 100.0) / func.nullif(swings, 0)
     elif stat == "strikeout_pct":
         # K% = strikeouts / plate appearances (approximated by at-bat endings)
         strikeouts = func.sum(case((Pitch.events == "strikeout", 1), else_=0))
+        # (|| rather than concat(), which SQLite only has from 3.44)
         pas = func.count(distinct(
-            func.concat(Pitch.game_pk, "_", Pitch.at_bat_number)
+            cast(Pitch.game_pk, String).concat("_").concat(cast(Pitch.at_bat_number, String))
         ))
         stat_expr = (strikeouts * 100.0) / func.nullif(pas, 0)
     elif stat == "h_movement":
@@ -181,7 +175,7 @@ async def get_leaderboard(
         query = query.order_by(stat_expr.asc().nullsfirst())
 
     # Limit results
-    results = query.limit(limit).all()
+    results = analytics.all(query.limit(limit))
 
     # Build response
     entries = []
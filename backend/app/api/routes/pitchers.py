@@ -2,12 +2,15 @@
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, distinct, case
+from sqlalchemy import func, distinct, case, and_, or_, false, select
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_read_db
+from app.core.responses import FastJSONResponse
 from app.models.pitcher import Pitcher
 from app.models.pitch import Pitch
+from app.models.flags import PitchFlag, count_flag
+from app.models.pitcher_game import PitcherGame
 from app.schemas.pitcher import (
     PitcherResponse,
     PitcherSearchResult,
@@ -15,20 +18,99 @@ from app.schemas.pitcher import (
     PitcherSeasonStats,
     PitchBase,
     PitchTypeStats,
+    PitcherComparison,
+    PitcherCompareResponse,
     PaginatedResponse,
 )
+from app.services.analytics import Analytics, get_analytics
+from app.services.search_index import search_index
 
 router = APIRouter(prefix="/pitchers", tags=["pitchers"])
 
+# Maximum number of pitchers on the Compare page
+MAX_COMPARE_PITCHERS = 4
+
+# Pitch columns returned by /pitches, selected directly (see app.core.responses)
+PITCH_COLUMNS = [getattr(Pitch, field) for field in PitchBase.model_fields]
+
+# Per pitch type aggregates behind /stats and /compare. Season totals are
+# summed from the pitch type rows, so one grouped query serves both.
+ARSENAL_COLUMNS = [
+    func.min(Pitch.pitch_name).label("pitch_name"),
+    func.count(Pitch.id).label("count"),
+    func.sum(Pitch.release_speed).label("sum_velocity"),
+    func.count(Pitch.release_speed).label("n_velocity"),
+    func.avg(Pitch.release_speed).label("avg_velocity"),
+    func.min(Pitch.release_speed).label("min_velocity"),
+    func.max(Pitch.release_speed).label("max_velocity"),
+    func.avg(Pitch.release_spin_rate).label("avg_spin_rate"),
+    func.avg(Pitch.pfx_x).label("avg_pfx_x"),
+    func.avg(Pitch.pfx_z).label("avg_pfx_z"),
+    func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
+    count_flag(PitchFlag.WHIFF).label("whiffs"),
+    count_flag(PitchFlag.CALLED_STRIKE).label("called_strikes"),
+    func.sum(case((Pitch.type == "B", 1), else_=0)).label("balls"),
+    func.sum(case((Pitch.type == "X", 1), else_=0)).label("in_play"),
+]
+
+
+def _pitch_type_stats(pt, total: int) -> PitchTypeStats:
+    """Build arsenal stats from an aggregated pitch type row."""
+    pt_count = pt.count
+    return PitchTypeStats(
+        pitch_type=pt.pitch_type,
+        pitch_name=pt.pitch_name,
+        count=pt_count,
+        usage_pct=round((pt_count / total) * 100, 1) if total > 0 else 0,
+        avg_velocity=round(pt.avg_velocity, 1) if pt.avg_velocity else None,
+        min_velocity=round(pt.min_velocity, 1) if pt.min_velocity else None,
+        max_velocity=round(pt.max_velocity, 1) if pt.max_velocity else None,
+        avg_spin_rate=round(pt.avg_spin_rate) if pt.avg_spin_rate else None,
+        avg_pfx_x=round(pt.avg_pfx_x, 1) if pt.avg_pfx_x else None,
+        avg_pfx_z=round(pt.avg_pfx_z, 1) if pt.avg_pfx_z else None,
+        whiff_pct=round((pt.whiffs / pt_count) * 100, 1) if pt_count > 0 else None,
+        called_strike_pct=round((pt.called_strikes / pt_count) * 100, 1) if pt_count > 0 else None,
+        ball_pct=round((pt.balls / pt_count) * 100, 1) if pt_count > 0 else None,
+        in_play_pct=round((pt.in_play / pt_count) * 100, 1) if pt_count > 0 else None,
+    )
+
+
+def _season_stats(year: int, rows: list, games: int) -> Optional[PitcherSeasonStats]:
+    """Season summary from a pitcher's ARSENAL_COLUMNS rows (NULL pitch type included)."""
+    total = sum(r.count for r in rows)
+    if total == 0:
+        return None
+
+    n_velocity = sum(r.n_velocity for r in rows)
+    avg_velocity = sum(r.sum_velocity or 0 for r in rows) / n_velocity if n_velocity else None
+    velocities = [r.max_velocity for r in rows if r.max_velocity is not None]
+    max_velocity = max(velocities) if velocities else None
+
+    pitch_type_stats = [_pitch_type_stats(r, total) for r in rows if r.pitch_type is not None]
+    pitch_type_stats.sort(key=lambda x: x.usage_pct, reverse=True)
+
+    return PitcherSeasonStats(
+        year=year,
+        total_pitches=total,
+        games=games,
+        avg_velocity=round(avg_velocity, 1) if avg_velocity else None,
+        max_velocity=round(max_velocity, 1) if max_velocity else None,
+        strike_pct=round((sum(r.strikes for r in rows) / total) * 100, 1),
+        ball_pct=round((sum(r.balls for r in rows) / total) * 100, 1),
+        whiff_pct=round((sum(r.whiffs for r in rows) / total) * 100, 1),
+        in_play_pct=round((sum(r.in_play for r in rows) / total) * 100, 1),
+        pitch_types=pitch_type_stats,
+    )
+
 
 @router.get("", response_model=PaginatedResponse)
-async def list_pitchers(
+def list_pitchers(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     team: Optional[str] = Query(None, description="Filter by team abbreviation"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_starter: Optional[bool] = Query(None, description="Filter starters/relievers"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get a paginated list of all pitchers.
@@ -63,35 +145,108 @@ async def list_pitchers(
 
 
 @router.get("/search", response_model=list[PitcherSearchResult])
-async def search_pitchers(
+def search_pitchers(
     q: str = Query(..., min_length=2, description="Search query (min 2 characters)"),
     limit: int = Query(10, ge=1, le=25, description="Max results to return"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Search pitchers by name for autocomplete.
 
     Returns a list of matching pitchers sorted by relevance.
-    Matches all words in any order (so "robert stock" finds "Stock, Robert").
+    Matches all words in any order (so "robert stock" finds "Stock, Robert"),
+    by prefix, ignoring accents, and tolerates small typos ("otani" finds "Ohtani").
+    Served from an in-memory index that is rebuilt when the pitchers table changes.
     """
-    # Split query into words and require all words to match
-    words = q.strip().split()
+    search_index.ensure_fresh(db)
+    results = search_index.search(q, limit)
 
-    query = db.query(Pitcher)
+    return [PitcherSearchResult(**entry) for entry in results]
 
-    # Each word must appear somewhere in the name
-    for word in words:
-        query = query.filter(Pitcher.name.ilike(f"%{word}%"))
 
-    pitchers = query.order_by(Pitcher.name).limit(limit).all()
+@router.get("/compare", response_model=PitcherCompareResponse)
+def compare_pitchers(
+    ids: str = Query(..., description="Comma-separated pitcher IDs (e.g. 1,2,3)"),
+    year: Optional[int] = Query(None, description="Season year (defaults to each pitcher's most recent)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get season summaries and arsenals for several pitchers at once.
 
-    return [PitcherSearchResult.model_validate(p) for p in pitchers]
+    Replaces the per-pitcher /{id}, /{id}/stats fan-out on the Compare page:
+    all pitchers are aggregated together in one query grouped by pitcher and pitch type.
+    """
+    try:
+        pitcher_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+
+    if not pitcher_ids:
+        raise HTTPException(status_code=400, detail="At least one pitcher ID is required")
+    if len(pitcher_ids) > MAX_COMPARE_PITCHERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Can compare at most {MAX_COMPARE_PITCHERS} pitchers",
+        )
+
+    pitchers = {p.id: p for p in db.query(Pitcher).filter(Pitcher.id.in_(pitcher_ids)).all()}
+    missing = [i for i in pitcher_ids if i not in pitchers]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Pitcher not found: {missing[0]}")
+
+    # Season for each pitcher: the requested year, or their most recent one
+    if year:
+        years = {pitcher_id: year for pitcher_id in pitcher_ids}
+    else:
+        years = dict(
+            db.query(Pitch.pitcher_id, func.max(Pitch.game_year))
+            .filter(Pitch.pitcher_id.in_(pitcher_ids))
+            .group_by(Pitch.pitcher_id)
+            .all()
+        )
+
+    season_filter = or_(*[
+        and_(Pitch.pitcher_id == pitcher_id, Pitch.game_year == season)
+        for pitcher_id, season in years.items()
+    ]) if years else false()
+
+    # One pass over all pitchers' pitches, grouped by pitcher and pitch type.
+    # Rows with a NULL pitch type still count toward the season totals.
+    arsenal_rows = (
+        db.query(Pitch.pitcher_id, Pitch.pitch_type, *ARSENAL_COLUMNS)
+        .filter(season_filter)
+        .group_by(Pitch.pitcher_id, Pitch.pitch_type)
+        .all()
+    )
+
+    games = dict(
+        db.query(Pitch.pitcher_id, func.count(distinct(Pitch.game_pk)))
+        .filter(season_filter)
+        .group_by(Pitch.pitcher_id)
+        .all()
+    )
+
+    rows_by_pitcher: dict[int, list] = {}
+    for row in arsenal_rows:
+        rows_by_pitcher.setdefault(row.pitcher_id, []).append(row)
+
+    comparisons = []
+    for pitcher_id in pitcher_ids:
+        rows = rows_by_pitcher.get(pitcher_id)
+        stats = _season_stats(years[pitcher_id], rows, games.get(pitcher_id, 0)) if rows else None
+
+        comparisons.append(PitcherComparison(
+            pitcher=PitcherResponse.model_validate(pitchers[pitcher_id]),
+            stats=stats,
+        ))
+
+    return PitcherCompareResponse(year=year, pitchers=comparisons)
 
 
 @router.get("/{pitcher_id}", response_model=PitcherDetailResponse)
-async def get_pitcher(
+def get_pitcher(
     pitcher_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get detailed information about a single pitcher.
@@ -119,13 +274,13 @@ async def get_pitcher(
 
 
 @router.get("/{pitcher_id}/pitches", response_model=PaginatedResponse)
-async def get_pitcher_pitches(
+def get_pitcher_pitches(
     pitcher_id: int,
     year: Optional[int] = Query(None, description="Filter by season year"),
     pitch_type: Optional[str] = Query(None, description="Filter by pitch type (FF, SL, etc.)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=500, description="Items per page"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get pitch-by-pitch data for a pitcher.
@@ -138,7 +293,7 @@ async def get_pitcher_pitches(
     if not pitcher:
         raise HTTPException(status_code=404, detail="Pitcher not found")
 
-    query = db.query(Pitch).filter(Pitch.pitcher_id == pitcher_id)
+    query = db.query(*PITCH_COLUMNS).filter(Pitch.pitcher_id == pitcher_id)
 
     # Apply filters
     if year:
@@ -151,178 +306,89 @@ async def get_pitcher_pitches(
 
     # Paginate (ordered by game date and pitch number)
     offset = (page - 1) * page_size
-    pitches = (
+    rows = (
         query.order_by(Pitch.game_date.desc(), Pitch.game_pk, Pitch.pitch_number)
         .offset(offset)
         .limit(page_size)
         .all()
     )
 
-    return PaginatedResponse(
-        items=[PitchBase.model_validate(p) for p in pitches],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=(total + page_size - 1) // page_size,
-    )
+    # Up to 500 rows: serialize the column tuples directly rather than through PitchBase
+    return FastJSONResponse({
+        "items": [row._asdict() for row in rows],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size,
+    })
 
 
 @router.get("/{pitcher_id}/stats", response_model=PitcherSeasonStats)
-async def get_pitcher_stats(
+def get_pitcher_stats(
     pitcher_id: int,
     year: Optional[int] = Query(None, description="Season year (defaults to most recent)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
+    analytics: Analytics = Depends(get_analytics),
 ):
     """
     Get aggregated statistics for a pitcher.
 
     Returns season totals, averages, and pitch arsenal breakdown.
     """
-    # Verify pitcher exists
-    pitcher = db.query(Pitcher).filter(Pitcher.id == pitcher_id).first()
+    # Verify the pitcher exists and find their most recent season in one statement
+    latest_year = (
+        select(func.max(Pitch.game_year)).where(Pitch.pitcher_id == Pitcher.id).scalar_subquery()
+    )
+    pitcher = db.query(Pitcher.id, latest_year.label("latest_year")).filter(Pitcher.id == pitcher_id).first()
     if not pitcher:
         raise HTTPException(status_code=404, detail="Pitcher not found")
 
-    # If no year specified, get the most recent year with data
+    # If no year specified, use the most recent year with data
     if not year:
-        most_recent = (
-            db.query(func.max(Pitch.game_year))
-            .filter(Pitch.pitcher_id == pitcher_id)
-            .scalar()
-        )
-        if not most_recent:
+        if not pitcher.latest_year:
             raise HTTPException(status_code=404, detail="No pitch data found for this pitcher")
-        year = most_recent
-
-    # Base query for this pitcher/year
-    base_query = db.query(Pitch).filter(
-        Pitch.pitcher_id == pitcher_id,
-        Pitch.game_year == year,
+        year = pitcher.latest_year
+
+    # Arsenal rows (plus NULL pitch types for the totals), with the season's
+    # game count as an uncorrelated subquery so it all takes one statement
+    season_filter = and_(Pitch.pitcher_id == pitcher_id, Pitch.game_year == year)
+    games = select(func.count(distinct(Pitch.game_pk))).where(season_filter).correlate(None).scalar_subquery()
+    rows = analytics.all(
+        db.query(Pitch.pitch_type, *ARSENAL_COLUMNS, games.label("games"))
+        .filter(season_filter)
+        .group_by(Pitch.pitch_type)
     )
 
-    total_pitches = base_query.count()
-    if total_pitches == 0:
+    stats = _season_stats(year, rows, rows[0].games) if rows else None
+    if stats is None:
         raise HTTPException(status_code=404, detail=f"No pitch data found for year {year}")
-
-    # Get overall stats
-    overall_stats = db.query(
-        func.count(Pitch.id).label("total"),
-        func.count(distinct(Pitch.game_pk)).label("games"),
-        func.avg(Pitch.release_speed).label("avg_velocity"),
-        func.max(Pitch.release_speed).label("max_velocity"),
-        func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
-        func.sum(case((Pitch.type == "B", 1), else_=0)).label("balls"),
-        func.sum(case((Pitch.description.like("%swinging_strike%"), 1), else_=0)).label("whiffs"),
-        func.sum(case((Pitch.type == "X", 1), else_=0)).label("in_play"),
-    ).filter(
-        Pitch.pitcher_id == pitcher_id,
-        Pitch.game_year == year,
-    ).first()
-
-    # Calculate percentages
-    total = overall_stats.total
-    strike_pct = round((overall_stats.strikes / total) * 100, 1) if total > 0 else None
-    ball_pct = round((overall_stats.balls / total) * 100, 1) if total > 0 else None
-    whiff_pct = round((overall_stats.whiffs / total) * 100, 1) if total > 0 else None
-    in_play_pct = round((overall_stats.in_play / total) * 100, 1) if total > 0 else None
-
-    # Get pitch type breakdown
-    pitch_types_query = db.query(
-        Pitch.pitch_type,
-        func.min(Pitch.pitch_name).label("pitch_name"),
-        func.count(Pitch.id).label("count"),
-        func.avg(Pitch.release_speed).label("avg_velocity"),
-        func.min(Pitch.release_speed).label("min_velocity"),
-        func.max(Pitch.release_speed).label("max_velocity"),
-        func.avg(Pitch.release_spin_rate).label("avg_spin_rate"),
-        func.avg(Pitch.pfx_x).label("avg_pfx_x"),
-        func.avg(Pitch.pfx_z).label("avg_pfx_z"),
-        func.sum(case((Pitch.description.like("%swinging_strike%"), 1), else_=0)).label("whiffs"),
-        func.sum(case((Pitch.description == "called_strike", 1), else_=0)).label("called_strikes"),
-        func.sum(case((Pitch.type == "B", 1), else_=0)).label("balls"),
-        func.sum(case((Pitch.type == "X", 1), else_=0)).label("in_play"),
-    ).filter(
-        Pitch.pitcher_id == pitcher_id,
-        Pitch.game_year == year,
-        Pitch.pitch_type.isnot(None),
-    ).group_by(Pitch.pitch_type).all()
-
-    pitch_type_stats = []
-    for pt in pitch_types_query:
-        pt_count = pt.count
-        pitch_type_stats.append(PitchTypeStats(
-            pitch_type=pt.pitch_type,
-            pitch_name=pt.pitch_name,
-            count=pt_count,
-            usage_pct=round((pt_count / total) * 100, 1) if total > 0 else 0,
-            avg_velocity=round(pt.avg_velocity, 1) if pt.avg_velocity else None,
-            min_velocity=round(pt.min_velocity, 1) if pt.min_velocity else None,
-            max_velocity=round(pt.max_velocity, 1) if pt.max_velocity else None,
-            avg_spin_rate=round(pt.avg_spin_rate) if pt.avg_spin_rate else None,
-            avg_pfx_x=round(pt.avg_pfx_x, 1) if pt.avg_pfx_x else None,
-            avg_pfx_z=round(pt.avg_pfx_z, 1) if pt.avg_pfx_z else None,
-            whiff_pct=round((pt.whiffs / pt_count) * 100, 1) if pt_count > 0 else None,
-            called_strike_pct=round((pt.called_strikes / pt_count) * 100, 1) if pt_count > 0 else None,
-            ball_pct=round((pt.balls / pt_count) * 100, 1) if pt_count > 0 else None,
-            in_play_pct=round((pt.in_play / pt_count) * 100, 1) if pt_count > 0 else None,
-        ))
-
-    # Sort by usage
-    pitch_type_stats.sort(key=lambda x: x.usage_pct, reverse=True)
-
-    return PitcherSeasonStats(
-        year=year,
-        total_pitches=total,
-        games=overall_stats.games,
-        avg_velocity=round(overall_stats.avg_velocity, 1) if overall_stats.avg_velocity else None,
-        max_velocity=round(overall_stats.max_velocity, 1) if overall_stats.max_velocity else None,
-        strike_pct=strike_pct,
-        ball_pct=ball_pct,
-        whiff_pct=whiff_pct,
-        in_play_pct=in_play_pct,
-        pitch_types=pitch_type_stats,
-    )
+    return stats
 
 
 @router.get("/{pitcher_id}/games")
-async def get_pitcher_games(
+def get_pitcher_games(
     pitcher_id: int,
     year: Optional[int] = Query(None, description="Season year"),
     limit: int = Query(30, ge=1, le=50, description="Max games to return"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get game log for a pitcher.
 
-    Returns a list of games with pitch counts and basic stats.
+    Returns a pitching line per game (IP, H, BB, K, HR, batters faced,
+    pitch counts and pitch mix), read from the pre-aggregated pitcher_games table.
     """
     # Verify pitcher exists
     pitcher = db.query(Pitcher).filter(Pitcher.id == pitcher_id).first()
     if not pitcher:
         raise HTTPException(status_code=404, detail="Pitcher not found")
 
-    # Build query for games with pitch summaries
-    query = db.query(
-        Pitch.game_pk,
-        Pitch.game_date,
-        func.count(Pitch.id).label("total_pitches"),
-        func.count(distinct(Pitch.inning)).label("innings_pitched"),
-        func.avg(Pitch.release_speed).label("avg_velocity"),
-        func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
-        func.sum(case((Pitch.description.like("%swinging_strike%"), 1), else_=0)).label("whiffs"),
-        func.sum(case((Pitch.events == "strikeout", 1), else_=0)).label("strikeouts"),
-        func.sum(case((Pitch.events == "walk", 1), else_=0)).label("walks"),
-    ).filter(Pitch.pitcher_id == pitcher_id)
+    query = db.query(PitcherGame).filter(PitcherGame.pitcher_id == pitcher_id)
 
     if year:
-        query = query.filter(Pitch.game_year == year)
+        query = query.filter(PitcherGame.game_year == year)
 
-    games = (
-        query.group_by(Pitch.game_pk, Pitch.game_date)
-        .order_by(Pitch.game_date.desc())
-        .limit(limit)
-        .all()
-    )
+    games = query.order_by(PitcherGame.game_date.desc()).limit(limit).all()
 
     return [
         {
@@ -330,11 +396,17 @@ async def get_pitcher_games(
             "date": g.game_date.isoformat(),
             "total_pitches": g.total_pitches,
             "innings_pitched": g.innings_pitched,
-            "avg_velocity": round(g.avg_velocity, 1) if g.avg_velocity else None,
+            "outs": g.outs,
+            "batters_faced": g.batters_faced,
+            "hits": g.hits,
+            "home_runs": g.home_runs,
+            "walks": g.walks,
+            "hit_by_pitch": g.hit_by_pitch,
+            "strikeouts": g.strikeouts,
+            "avg_velocity": g.avg_velocity,
             "strikes": g.strikes,
             "whiffs": g.whiffs,
-            "strikeouts": g.strikeouts,
-            "walks": g.walks,
+            "pitch_mix": g.pitch_mix or {},
         }
         for g in games
     ]
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_read_db, pool_metrics
 from app.models.pitcher import Pitcher
 from app.models.pitch import Pitch
 from app.models.game import Game
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/database")
-async def get_database_stats(db: Session = Depends(get_db)):
+def get_database_stats(db: Session = Depends(get_read_db)):
     """
     Get overall database statistics for the dashboard.
 
@@ -45,3 +45,14 @@ async def get_database_stats(db: Session = Depends(get_db)):
         "years": year_list,
         "last_updated": max_date.isoformat() if max_date else None,
     }
+
+
+@router.get("/pools")
+async def get_pool_stats():
+    """
+    Get connection pool metrics for the read and write engines.
+
+    Returns pool sizing (where the pool class exposes it) and lifetime
+    connect/checkout/checkin counters.
+    """
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
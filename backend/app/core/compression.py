@@ -0,0 +1,191 @@
+"""Brotli/gzip compression for API responses.
+
+Pitch pages, scatter data and game logs repeat the same keys and strings
+hundreds of times and shrink 15-20x compressed. CompressionMiddleware picks
+br (when the brotli package is installed) or gzip from Accept-Encoding and
+compresses JSON and text bodies of at least minimum_size bytes; smaller ones
+aren't worth the CPU or the extra headers.
+
+Responses carrying an ETag from HTTPCacheMiddleware have the same bytes until
+the next data version bump, so they are compressed once at a high level and
+the compressed body is kept in a small LRU cache. The cache is keyed on a
+hash of the body rather than the ETag, so a load that forgot to bump the
+version can't serve stale bytes; hashing costs far less than compressing.
+Everything else is compressed at a fast level. Compression runs in a worker
+thread so a large body doesn't stall the event loop.
+
+A compressed body is a different representation of the same resource, so the
+ETag is sent weak (W/"...", as nginx does) to clients that accept an encoding,
+on 200s and 304s alike. If-None-Match uses weak comparison, so revalidation
+works either way.
+"""
+
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# (fast, cached) levels per encoding
+LEVELS = {"br": (4, 9), "gzip": (6, 9)}
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best supported encoding in an Accept-Encoding header, or None."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for coding in ("br", "gzip"):
+        if coding == "br" and brotli is None:
+            continue
+        if accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressedBodyCache:
+    """LRU of compressed bodies, bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: tuple, body: bytes):
+        if len(body) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+def _vary_accept_encoding(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+
+def _weaken_etag(headers: MutableHeaders):
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """Compress response bodies of at least minimum_size bytes.
+
+    Add it outside HTTPCacheMiddleware so it sees the ETag of cached
+    responses. cache_bytes bounds the compressed body cache (0 disables it).
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, cache_bytes: int = 64 * 1024 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = CompressedBodyCache(cache_bytes) if cache_bytes > 0 else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        if scope["method"] == "HEAD":
+            encoding = None
+
+        start: Optional[Message] = None
+        passthrough = False
+        chunks: list[bytes] = []
+
+        async def send_compressed(message: Message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if start is None:
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                if message["status"] == 304:
+                    _vary_accept_encoding(headers)
+                    if encoding is not None:
+                        _weaken_etag(headers)
+                if (
+                    message["status"] != 200
+                    or "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            headers = MutableHeaders(scope=start)
+            _vary_accept_encoding(headers)
+            body = b"".join(chunks)
+            if encoding is not None and len(body) >= self.minimum_size:
+                body = await self._compress(body, encoding, headers.get("etag"))
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(body))
+            if encoding is not None:
+                _weaken_etag(headers)
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compress(self, body: bytes, encoding: str, etag: Optional[str]) -> bytes:
+        fast, cached = LEVELS[encoding]
+        if etag is None or self.cache is None:
+            return await anyio.to_thread.run_sync(compress, body, encoding, fast)
+
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = await anyio.to_thread.run_sync(compress, body, encoding, cached)
+            self.cache.put(key, compressed)
+        return compressed
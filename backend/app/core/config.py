@@ -1,4 +1,6 @@
+import hmac
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -9,18 +11,89 @@ class Settings(BaseSettings):
     # Set DATABASE_URL env var to use PostgreSQL in production
     database_url: str = ""
 
+    # SQLite tuning, applied to every connection (ignored for PostgreSQL).
+    # WAL lets API reads proceed while a loader is writing.
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # bytes
+    sqlite_cache_size: int = -64 * 1024  # negative = KiB, so 64 MB
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout: int = 5000  # ms to wait on a locked database
+
+    # Bulk load profile used by the loader/aggregation scripts
+    sqlite_bulk_synchronous: str = "OFF"
+    sqlite_bulk_cache_size: int = -512 * 1024  # 512 MB
+
+    # Connection pools (PostgreSQL). API reads use a separate read-only pool.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
+
+    # PostgreSQL: pitches is range-partitioned by game_year, one partition per
+    # season from this year through next season (later years land in default)
+    pitches_partition_first_year: int = 2015
+
     # Environment
     environment: str = "development"
 
     # API
     api_prefix: str = "/api"
 
+    # Aggregate queries (leaderboards, pitcher stats, season aggregation):
+    # "sqlalchemy" runs them on the main database, "duckdb" on a columnar
+    # snapshot rebuilt by the loaders (duckdb_path defaults to backend/analytics.duckdb)
+    analytics_backend: str = "sqlalchemy"
+    duckdb_path: str = ""
+
+    # HTTP caching: ETags follow a data version the loaders bump in the
+    # data_version table, re-read at most every data_version_check_seconds,
+    # and the app build (build_id, e.g. the deployed commit; defaults to a hash
+    # of the app code). data_version_path keeps the version in a file instead
+    # (tests and throwaway databases).
+    data_version_path: str = ""
+    data_version_check_seconds: float = 2.0
+    build_id: str = ""
+
+    # Response compression (br/gzip): bodies smaller than this go out as-is.
+    # Compressed bodies of ETag'd responses are cached up to compression_cache_mb.
+    compression_min_size: int = 1024  # bytes
+    compression_cache_mb: int = 64
+
+    # Per-request metrics: Server-Timing header and Prometheus text at /metrics
+    metrics_enabled: bool = True
+
+    # Slow-query log: statements taking at least slow_query_ms (0 = off) are
+    # logged with their query plan and kept for GET /api/admin/slow-queries
+    slow_query_ms: float = 0
+    slow_query_log_size: int = 100
+
+    # Profiling: with profiling_enabled, a request with ?profile=svg (or an
+    # X-Profile header) is sampled every profile_interval_ms and its flame
+    # graph saved in profile_dir (defaults to backend/profiles), keeping the
+    # newest profile_keep. See app/core/profiling.py.
+    profiling_enabled: bool = False
+    profile_dir: str = ""
+    profile_interval_ms: float = 1.0
+    profile_keep: int = 50
+
+    # Required in the X-Admin-Token header of /api/admin routes and profiled
+    # requests. While unset, those are disabled (404, profile switch ignored).
+    admin_token: str = ""
+
+    # Pitcher search index - how often (seconds) to check the pitchers table for changes
+    search_index_refresh_seconds: int = 60
+
     class Config:
         env_file = ".env"
         extra = "ignore"
         # Allow both DATABASE_URL and database_url
         populate_by_name = True
 
+    def admin_token_matches(self, token: Optional[str]) -> bool:
+        """Whether a token unlocks the admin features (never while admin_token is unset)."""
+        return bool(self.admin_token) and token is not None and hmac.compare_digest(token, self.admin_token)
+
     def get_database_url(self) -> str:
         """Get database URL, defaulting to SQLite if not set."""
         if self.database_url:
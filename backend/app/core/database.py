@@ -1,4 +1,8 @@
-from sqlalchemy import create_engine
+from pathlib import Path
+from threading import Lock
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
@@ -6,19 +10,149 @@ from app.core.config import settings
 # Get database URL (defaults to SQLite if not configured)
 database_url = settings.get_database_url()
 
-# SQLite needs special connect_args
-connect_args = {}
-if database_url.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
 
-engine = create_engine(database_url, connect_args=connect_args)
+def sqlite_pragmas(profile: str = "default") -> dict:
+    """PRAGMA settings for a connection profile.
+
+    "default" is tuned for the API: WAL so reads never wait on a running
+    loader, synchronous=NORMAL (safe with WAL), a large page cache and mmap.
+    "bulk" is for the loader scripts: same WAL database, but skips fsyncs and
+    uses a much bigger cache while inserting millions of rows.
+    "read" is for read-only connections, which can't change the journal mode
+    or durability settings.
+    """
+    pragmas = {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        "temp_store": settings.sqlite_temp_store,
+        "busy_timeout": settings.sqlite_busy_timeout,
+    }
+    if profile == "bulk":
+        pragmas["synchronous"] = settings.sqlite_bulk_synchronous
+        pragmas["cache_size"] = settings.sqlite_bulk_cache_size
+    elif profile == "read":
+        del pragmas["journal_mode"]
+        del pragmas["synchronous"]
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict):
+    """Run the given PRAGMAs on every new connection from the engine."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def read_only_url(url: str) -> str:
+    """Get a read-only variant of a database URL.
+
+    File-backed SQLite databases are opened through a mode=ro URI; other
+    URLs are unchanged (PostgreSQL read-only-ness is set per connection).
+    """
+    if url.startswith("sqlite:///") and ":memory:" not in url:
+        path = url[len("sqlite:///"):]
+        return f"sqlite:///file:{path}?mode=ro&uri=true"
+    return url
+
+
+class PoolMetrics:
+    """Counts connection pool activity for an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self._lock = Lock()
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, *_):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, *_):
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, *_):
+        with self._lock:
+            self.checkins += 1
+
+    def snapshot(self) -> dict:
+        """Current pool state plus lifetime counters."""
+        pool = self.engine.pool
+        data = {
+            "pool": type(pool).__name__,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+        }
+        # QueuePool exposes live sizing; other pool classes may not
+        for name in ["size", "checkedin", "checkedout", "overflow"]:
+            method = getattr(pool, name, None)
+            if callable(method):
+                data[name] = method()
+        return data
+
+
+def create_db_engine(url: str = database_url, profile: str = "default") -> Engine:
+    """Create an engine, applying the SQLite tuning profile when applicable."""
+    connect_args = {}
+    engine_args = {}
+
+    if url.startswith("sqlite"):
+        # SQLite needs special connect_args
+        connect_args["check_same_thread"] = False
+    else:
+        engine_args = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": True,
+        }
+        if profile == "read" and url.startswith("postgresql"):
+            connect_args["options"] = "-c default_transaction_read_only=on"
+
+    db_engine = create_engine(url, connect_args=connect_args, **engine_args)
+
+    if url.startswith("sqlite"):
+        apply_sqlite_pragmas(db_engine, sqlite_pragmas(profile))
+
+    return db_engine
+
+
+# Writer engine: schema creation and anything that modifies data
+engine = create_db_engine(database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only engine for API GET routes, so reads never contend with writers
+read_engine = create_db_engine(read_only_url(database_url), profile="read")
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Engine/session for loader and aggregation scripts (bulk load profile)
+bulk_engine = create_db_engine(database_url, profile="bulk")
+BulkSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=bulk_engine)
+
+pool_metrics = {
+    "write": PoolMetrics(engine),
+    "read": PoolMetrics(read_engine),
+}
+
 Base = declarative_base()
 
 
 def get_db():
-    """Dependency for getting database sessions."""
+    """Dependency for getting read-write database sessions."""
     db = SessionLocal()
     try:
         yield db
@@ -26,6 +160,45 @@ def get_db():
         db.close()
 
 
-def create_tables():
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+def get_read_db():
+    """Dependency for getting read-only database sessions (GET routes)."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def run_migrations(revision: str = "head", bind: Engine = None):
+    """Bring the database schema up to date with Alembic (alembic upgrade).
+
+    This is the only supported way to create or change the schema of a real
+    database; the API itself never touches the schema at startup.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    backend_dir = Path(__file__).resolve().parent.parent.parent
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(backend_dir / "migrations"))
+    if bind is None:
+        command.upgrade(config, revision)
+        return
+    with bind.connect() as connection:
+        config.attributes["connection"] = connection
+        config.attributes["configure_logger"] = False
+        command.upgrade(config, revision)
+
+
+def create_tables(bind: Engine = engine):
+    """Create all tables directly from the models (tests and throwaway databases).
+
+    pitches is created separately so PostgreSQL gets the year-partitioned
+    layout (see app/models/partitions.py); everything else uses create_all.
+    Real databases are created and upgraded with run_migrations() instead.
+    """
+    from app.models.partitions import create_pitches_table
+
+    others = [table for table in Base.metadata.sorted_tables if table.name != "pitches"]
+    Base.metadata.create_all(bind=bind, tables=others)
+    create_pitches_table(bind)
@@ -0,0 +1,232 @@
+"""HTTP caching for API GETs, keyed on a global data version.
+
+Every response body is a function of the request, the data in the database
+and the code serving it, and the data only changes when a loader or
+aggregation script runs. Those scripts bump the data version
+(bump_data_version), and the ETag of a GET is a hash of that version, the
+app build and the normalized path and query. The ETag is therefore known
+before the route runs: a request whose If-None-Match matches is answered
+with 304 without calling the route, and a bump or a deploy changes every
+ETag at once.
+
+The version lives in the database's one-row data_version table, so a loader
+run from any machine against DATABASE_URL is seen by every API worker. Each
+worker re-reads it at most every data_version_check_seconds (in the
+threadpool, off the event loop), so revalidations between checks don't
+touch the database. For tests and throwaway databases, data_version_path
+points it at a file instead.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+
+class DataVersion:
+    """Integer data version stored in a file, cached until the file changes."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._stamp: Optional[tuple] = None
+        self._value = 0
+        self._lock = Lock()
+
+    def is_fresh(self) -> bool:
+        """Whether current() can answer without I/O beyond a stat()."""
+        return True
+
+    def _read(self) -> int:
+        try:
+            return int(self.path.read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def current(self) -> int:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return 0
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            with self._lock:
+                self._value = self._read()
+                self._stamp = stamp
+        return self._value
+
+    def bump(self) -> int:
+        """Publish a new version (unique even if two loaders bump at once)."""
+        version = max(self._read() + 1, time.time_ns())
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(str(version))
+        os.replace(tmp_path, self.path)
+        return version
+
+
+class DatabaseDataVersion:
+    """Integer data version in the data_version table, re-read every check_seconds.
+
+    Reads go through the read-only engine and bumps through the main one
+    unless an engine is given. A database without the table (not yet
+    migrated) reads as version 0.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, check_seconds: Optional[float] = None):
+        self._engine = engine
+        self.check_seconds = settings.data_version_check_seconds if check_seconds is None else check_seconds
+        self._value = 0
+        self._checked_at: Optional[float] = None
+        self._lock = Lock()
+
+    def _engines(self) -> tuple[Engine, Engine]:
+        if self._engine is not None:
+            return self._engine, self._engine
+        from app.core.database import engine, read_engine
+
+        return read_engine, engine
+
+    def is_fresh(self) -> bool:
+        return self._checked_at is not None and time.monotonic() - self._checked_at < self.check_seconds
+
+    def current(self) -> int:
+        if self.is_fresh():
+            return self._value
+        with self._lock:
+            if not self.is_fresh():
+                try:
+                    with self._engines()[0].connect() as conn:
+                        self._value = conn.execute(
+                            text("SELECT version FROM data_version WHERE id = 1")
+                        ).scalar() or 0
+                except SQLAlchemyError as exc:
+                    logger.warning("Could not read the data version, keeping %s: %s", self._value, exc)
+                self._checked_at = time.monotonic()
+        return self._value
+
+    def bump(self) -> int:
+        """Publish a new version (unique even if two loaders bump at once)."""
+        now = time.time_ns()
+        with self._engines()[1].begin() as conn:
+            updated = conn.execute(text(
+                "UPDATE data_version SET version = CASE WHEN version < :now THEN :now ELSE version + 1 END "
+                "WHERE id = 1"
+            ), {"now": now})
+            if updated.rowcount == 0:
+                conn.execute(text("INSERT INTO data_version (id, version) VALUES (1, :now)"), {"now": now})
+            version = conn.execute(text("SELECT version FROM data_version WHERE id = 1")).scalar()
+        self._checked_at = None
+        return version
+
+
+def make_data_version():
+    if settings.data_version_path:
+        return DataVersion(Path(settings.data_version_path))
+    return DatabaseDataVersion()
+
+
+data_version = make_data_version()
+
+
+def bump_data_version() -> int:
+    """Mark the data as changed so API caches revalidate. Called by loaders."""
+    return data_version.bump()
+
+
+@lru_cache(maxsize=1)
+def build_version() -> str:
+    """Identifies the code serving responses: settings.build_id, else a hash of app/."""
+    if settings.build_id:
+        return settings.build_id
+    digest = hashlib.sha1()
+    for path in sorted(APP_DIR.rglob("*.py")):
+        digest.update(path.relative_to(APP_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def compute_etag(version: int, path: str, query_string: str, build: str = "") -> str:
+    """Strong ETag for a GET, independent of query parameter order."""
+    query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+    digest = hashlib.sha1(f"{build}|{path}?{query}".encode()).hexdigest()[:16]
+    return f'"{version:x}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 specifies for it)."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class HTTPCacheMiddleware:
+    """ETag / Cache-Control for GET and HEAD requests, per path prefix.
+
+    policies maps a path prefix (e.g. "/api/leaderboards") to the
+    Cache-Control value for its successful responses; other paths are left
+    alone.
+    """
+
+    def __init__(self, app: ASGIApp, policies: dict[str, str], version: Optional[DataVersion] = None):
+        self.app = app
+        # Longest prefix first, so "/api/pitchers/search" can override "/api/pitchers"
+        self.policies = sorted(policies.items(), key=lambda item: len(item[0]), reverse=True)
+        self.version = version
+
+    def _policy(self, path: str) -> Optional[str]:
+        for prefix, cache_control in self.policies:
+            if path == prefix or path.startswith(prefix + "/"):
+                return cache_control
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = self._policy(scope["path"])
+        if cache_control is None:
+            await self.app(scope, receive, send)
+            return
+
+        source = self.version or data_version
+        version = source.current() if source.is_fresh() else await run_in_threadpool(source.current)
+        etag = compute_etag(version, scope["path"], scope["query_string"].decode("latin-1"), build_version())
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode()),
+                    (b"cache-control", cache_control.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers.setdefault("etag", etag)
+                headers.setdefault("cache-control", cache_control)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,246 @@
+"""Per-request performance metrics: wall time, database time, statements, rows.
+
+MetricsMiddleware gives each request a RequestStats in a context variable.
+SQLAlchemy event hooks (installed on every Engine, so test engines are
+covered too) add each statement's execution time, and count result rows as
+they are fetched from the DBAPI cursor; DuckDB analytics queries report theirs via record_query().
+The context is copied into the threadpool with the route handler, so
+queries from sync handlers land on the right request.
+
+Every response gets a Server-Timing header (visible in the browser's
+network panel), and per-route histograms are rendered in the Prometheus
+text format at /metrics. An N+1 pattern shows up as a jump in
+api_db_statements for its route. Histograms are per worker process.
+"""
+
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestStats:
+    """Database work done while handling one request."""
+
+    __slots__ = ("statements", "db_seconds", "rows")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """Stats of the request being handled, or None outside a request."""
+    return _current.get()
+
+
+def record_query(seconds: float, rows: int = 0):
+    """Count a query run outside SQLAlchemy (e.g. on the DuckDB snapshot)."""
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += seconds
+        stats.rows += rows
+
+
+class _RowCountingCursor:
+    """DBAPI cursor proxy that adds the rows fetched through it to a request.
+
+    Rows are counted as SQLAlchemy fetches them, so results are never
+    buffered just to be measured and streamed results are counted too.
+    """
+
+    __slots__ = ("_cursor", "_stats")
+
+    def __init__(self, cursor, stats: RequestStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    starts = conn.info.get("query_start")
+    if stats is not None and starts:
+        stats.statements += 1
+        stats.db_seconds += time.perf_counter() - starts.pop()
+        if cursor.description is not None and context is not None and context.cursor is cursor:
+            # The result is built from context.cursor after this hook returns
+            context.cursor = _RowCountingCursor(cursor, stats)
+
+
+@event.listens_for(Engine, "handle_error")
+def _on_error(context):
+    starts = context.connection.info.get("query_start") if context.connection is not None else None
+    if starts:
+        starts.pop()
+
+
+# Histogram bucket upper bounds
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+ROW_BUCKETS = (0, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram, one series per label set."""
+
+    def __init__(self, name: str, help_text: str, buckets: tuple):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # labels -> [bucket counts, sum, count]
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self, label_names: tuple) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            label_text = ",".join(f'{name}="{value}"' for name, value in zip(label_names, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Request histograms labelled by method, route template and status."""
+
+    LABELS = ("method", "route", "status")
+
+    def __init__(self):
+        self._lock = Lock()
+        self.histograms = {
+            "duration": Histogram("api_request_duration_seconds", "Request wall time.", SECONDS_BUCKETS),
+            "db": Histogram("api_db_duration_seconds", "Database time per request.", SECONDS_BUCKETS),
+            "statements": Histogram("api_db_statements", "SQL statements per request.", STATEMENT_BUCKETS),
+            "rows": Histogram("api_db_rows", "Rows fetched per request.", ROW_BUCKETS),
+        }
+
+    def observe(self, labels: tuple, duration: float, stats: RequestStats):
+        with self._lock:
+            self.histograms["duration"].observe(labels, duration)
+            self.histograms["db"].observe(labels, stats.db_seconds)
+            self.histograms["statements"].observe(labels, stats.statements)
+            self.histograms["rows"].observe(labels, stats.rows)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = []
+            for histogram in self.histograms.values():
+                lines.extend(histogram.render(self.LABELS))
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram._series.clear()
+
+
+registry = MetricsRegistry()
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route as a template (/api/pitchers/{pitcher_id}), for labels.
+
+    Built from the request path and path_params rather than route.path,
+    which lacks the prefixes of included routers.
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+    segments = scope["path"].split("/")
+    for name, value in scope.get("path_params", {}).items():
+        for i in range(len(segments) - 1, -1, -1):
+            if segments[i] == str(value):
+                segments[i] = f"{{{name}}}"
+                break
+    return "/".join(segments)
+
+
+def server_timing(duration: float, stats: RequestStats) -> str:
+    return (
+        f"app;dur={duration * 1000:.1f}, "
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries, {stats.rows} rows"'
+    )
+
+
+class MetricsMiddleware:
+    """Record per-request metrics and add a Server-Timing header.
+
+    Add it outside the caching and compression middleware so their work
+    (and their 304s) are part of the measured request.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(
+                    "server-timing", server_timing(time.perf_counter() - start, stats)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            labels = (scope["method"], route_template(scope), str(status))
+            (self.metrics or registry).observe(labels, time.perf_counter() - start, stats)
@@ -0,0 +1,387 @@
+"""Opt-in profiling of single requests and scripts.
+
+With settings.profiling_enabled and an admin_token set, a request carrying
+?profile=<format> or an X-Profile: <format> header (plus X-Admin-Token) is
+profiled while it runs through the whole middleware stack and whichever
+router handles it. The flame graph is saved in settings.profile_dir (default backend/profiles) and named in the
+response's X-Profile header; GET /api/admin/profiles lists the saved
+profiles and serves them. Formats:
+
+- svg (or 1/true): a self-contained flame graph, open it in a browser
+- speedscope: JSON for https://www.speedscope.app (runs locally in the page)
+- folded: "frame;frame;frame count" lines for flamegraph.pl and friends
+- view: saves an SVG and returns it instead of the normal response
+
+Sync route handlers run in the threadpool, where cProfile or pyinstrument
+(both per-thread) wouldn't see them. StackSampler instead polls
+sys._current_frames() every profile_interval_ms from its own thread and
+keeps the stacks of every thread that is running code from the app
+package, so the event loop's middleware and the worker thread's handler
+both show up. Concurrent requests would be sampled too, and profiled
+requests are run one at a time, so this is meant for reproducing a slow
+request locally rather than for production traffic.
+
+scripts/profile_script.py uses the same sampler (or cProfile) for the
+loader and aggregation scripts.
+"""
+
+import asyncio
+import html
+import json
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+APP_DIR = str(Path(__file__).resolve().parent.parent)
+BACKEND_DIR = Path(APP_DIR).parent
+
+# (function, file, first line); a stack runs from the thread's root to the leaf
+Frame = tuple[str, str, int]
+
+FORMATS = {
+    "svg": ("svg", "image/svg+xml"),
+    "speedscope": ("speedscope.json", "application/json"),
+    "folded": ("folded.txt", "text/plain; charset=utf-8"),
+}
+FORMAT_ALIASES = {"1": "svg", "true": "svg", "": "svg", "view": "svg"}
+
+
+def short_path(filename: str) -> str:
+    """A file path relative to the backend or to site-packages."""
+    path = filename.replace("\\", "/")
+    for marker in ("/site-packages/", "/dist-packages/"):
+        if marker in path:
+            return path.split(marker, 1)[1]
+    backend = BACKEND_DIR.as_posix() + "/"
+    if path.startswith(backend):
+        return path[len(backend):]
+    return path.rsplit("/", 1)[-1]
+
+
+def frame_label(frame: Frame) -> str:
+    name, filename, line = frame
+    return f"{name} ({short_path(filename)}:{line})" if filename else name
+
+
+class StackSampler:
+    """Sample the Python stacks of running threads from a background thread.
+
+    include is a path prefix: only stacks with a frame from a file under it
+    are kept (None keeps every thread's stack). Each kept stack starts with
+    a pseudo-frame naming its thread.
+    """
+
+    def __init__(self, interval: float = 0.001, include: Optional[str] = None):
+        self.interval = interval
+        self.include = include
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.seconds = 0.0
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._started
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._stack(frame)
+                if stack is not None:
+                    self.samples[((names.get(ident, f"thread {ident}"), "", 0),) + stack] += 1
+            self.sample_count += 1
+
+    def _stack(self, frame) -> Optional[tuple[Frame, ...]]:
+        stack = []
+        included = self.include is None
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            if not included and code.co_filename.startswith(self.include):
+                included = True
+            frame = frame.f_back
+        if not included:
+            return None
+        stack.reverse()
+        return tuple(stack)
+
+    # Output formats -----------------------------------------------------
+
+    def render(self, fmt: str, title: str) -> str:
+        if fmt == "speedscope":
+            return self.to_speedscope(title)
+        if fmt == "folded":
+            return self.to_folded()
+        return self.to_svg(title)
+
+    def to_folded(self) -> str:
+        return "".join(
+            ";".join(frame_label(frame) for frame in stack) + f" {count}\n"
+            for stack, count in sorted(self.samples.items())
+        )
+
+    def to_speedscope(self, title: str) -> str:
+        frames: dict[Frame, int] = {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+            weights.append(count * self.interval * 1000)
+        return json.dumps({
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": title,
+            "exporter": "app.core.profiling",
+            "shared": {"frames": [
+                {"name": name, "file": short_path(filename), "line": line} if filename else {"name": name}
+                for name, filename, line in frames
+            ]},
+            "profiles": [{
+                "type": "sampled",
+                "name": title,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        })
+
+    def to_svg(self, title: str, width: int = 1200, row_height: int = 16) -> str:
+        """A flame graph: the root at the bottom, callees stacked above."""
+        root: dict = {"count": 0, "children": {}}
+        for stack, count in self.samples.items():
+            root["count"] += count
+            node = root
+            for frame in stack:
+                node = node["children"].setdefault(frame, {"count": 0, "children": {}})
+                node["count"] += count
+
+        total = root["count"] or 1
+        rects = []
+
+        def layout(children: dict, x: float, depth: int):
+            for frame, node in sorted(children.items(), key=lambda item: frame_label(item[0])):
+                w = node["count"] / total * (width - 20)
+                if w >= 0.5:
+                    rects.append((frame, node["count"], x, depth, w))
+                    layout(node["children"], x, depth + 1)
+                x += w
+
+        layout(root["children"], 10.0, 0)
+        depth = max((rect[3] for rect in rects), default=0) + 1
+        height = depth * row_height + 60
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'font-family="Verdana, sans-serif" font-size="11">',
+            f'<rect width="100%" height="100%" fill="#f8f8f8"/>',
+            f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="15">{html.escape(title)}</text>',
+            f'<text x="10" y="40" fill="#555">{self.sample_count} samples every '
+            f'{self.interval * 1000:g} ms over {self.seconds * 1000:.0f} ms. '
+            f'Blue frames are app code; hover a frame for its share.</text>',
+        ]
+        for frame, count, x, level, w in rects:
+            y = height - (level + 1) * row_height - 5
+            label = frame_label(frame)
+            share = 100 * count / total
+            parts.append(
+                f'<g><title>{html.escape(label)}: {count} samples ({share:.1f}%)</title>'
+                f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row_height - 1}" '
+                f'fill="{_color(frame)}" rx="2"/>'
+            )
+            chars = int((w - 6) / 7)
+            if chars >= 3:
+                text = label if len(label) <= chars else label[:chars - 2] + ".."
+                parts.append(f'<text x="{x + 3:.1f}" y="{y + row_height - 4}">{html.escape(text)}</text>')
+            parts.append("</g>")
+        parts.append("</svg>")
+        return "\n".join(parts)
+
+
+def _color(frame: Frame) -> str:
+    """Warm colours for library code, blue for the app, grey for threads."""
+    name, filename, _ = frame
+    if not filename:
+        return "rgb(190,190,190)"
+    shade = zlib.crc32(name.encode()) % 55
+    if filename.startswith(APP_DIR):
+        return f"rgb({80 + shade},{150 + shade},{220})"
+    return f"rgb(230,{110 + shade * 2},{50 + shade})"
+
+
+class ProfileStore:
+    """Saved profiles in a directory, keeping the newest `keep`."""
+
+    def __init__(self, directory: Path, keep: int = 50):
+        self.directory = Path(directory)
+        self.keep = keep
+
+    def new_name(self, label: str, extension: str) -> str:
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")[:-3]
+        slug = "-".join("".join(c if c.isalnum() else " " for c in label).split())[:80]
+        return f"{stamp}-{slug}.{extension}"
+
+    def save(self, name: str, content: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        for old in self.list()[self.keep:]:
+            (self.directory / old["name"]).unlink(missing_ok=True)
+        return path
+
+    def list(self) -> list[dict]:
+        """Saved profiles, newest first."""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.iterdir():
+            if path.is_file():
+                stat = path.stat()
+                entries.append({
+                    "name": path.name,
+                    "bytes": stat.st_size,
+                    "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+                })
+        return sorted(entries, key=lambda entry: entry["name"], reverse=True)
+
+    def path(self, name: str) -> Optional[Path]:
+        """Path of a saved profile, or None for unknown (or unsafe) names."""
+        if "/" in name or "\\" in name or name.startswith("."):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+
+def media_type(name: str) -> str:
+    for extension, media in FORMATS.values():
+        if name.endswith("." + extension):
+            return media
+    return "application/octet-stream"
+
+
+def profile_dir() -> Path:
+    if settings.profile_dir:
+        return Path(settings.profile_dir)
+    return BACKEND_DIR / "profiles"
+
+
+profile_store = ProfileStore(profile_dir(), settings.profile_keep)
+
+
+class ProfilingMiddleware:
+    """Profile requests that ask for it with ?profile= or X-Profile."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[ProfileStore] = None,
+        interval_ms: Optional[float] = None,
+        include: str = APP_DIR,
+    ):
+        self.app = app
+        self.store = store
+        self.include = include
+        self.interval = (interval_ms or settings.profile_interval_ms) / 1000
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def requested(scope: Scope) -> Optional[str]:
+        """The requested format (or "view"), or None if not profiling."""
+        value = Headers(scope=scope).get("x-profile")
+        if value is None:
+            values = parse_qs(scope["query_string"].decode("latin-1"), keep_blank_values=True).get("profile")
+            if not values:
+                return None
+            value = values[0]
+        value = value.strip().lower()
+        return value if value in FORMATS or value == "view" else FORMAT_ALIASES.get(value)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Without an admin token nobody may profile: the switch is ignored
+        mode = self.requested(scope) if scope["type"] == "http" and settings.admin_token else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not settings.admin_token_matches(Headers(scope=scope).get("x-admin-token")):
+            await _send_text(send, 403, json.dumps({"detail": "Invalid admin token"}), "application/json")
+            return
+
+        # Always run the handler: drop validators that would turn it into a 304
+        scope = dict(scope)
+        scope["headers"] = [
+            (key, value) for key, value in scope["headers"]
+            if key not in (b"if-none-match", b"if-modified-since")
+        ]
+
+        store = self.store or profile_store
+        fmt = FORMAT_ALIASES.get(mode, mode)
+        title = f"{scope['method']} {scope['path']}"
+        if scope["query_string"]:
+            title += "?" + scope["query_string"].decode("latin-1")
+        name = store.new_name(f"{scope['method']} {scope['path']}", FORMATS[fmt][0])
+
+        async def send_with_header(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["x-profile"] = name
+                headers["cache-control"] = "no-store"
+            if mode != "view":
+                await send(message)
+
+        async with self._lock:
+            sampler = StackSampler(self.interval, include=self.include)
+            sampler.start()
+            try:
+                await self.app(scope, receive, send_with_header)
+            finally:
+                sampler.stop()
+                content = sampler.render(fmt, title)
+                store.save(name, content)
+
+        if mode == "view":
+            await _send_text(send, 200, content, FORMATS["svg"][1], [(b"x-profile", name.encode())])
+
+
+async def _send_text(send: Send, status: int, text: str, content_type: str, headers: Optional[list] = None):
+    body = text.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+            (b"cache-control", b"no-store"),
+            *(headers or []),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,41 @@
+"""orjson-backed JSON responses for the high-volume routes.
+
+Pitch lists, scatter plots and rankings build their payload as plain dicts
+straight from query rows and return a FastJSONResponse themselves. That
+skips building a Pydantic model per row and FastAPI validating it again
+against response_model. The response_model stays on those routes for the
+OpenAPI docs, and the dicts carry exactly its fields.
+
+orjson serializes dicts, dates and NumPy values several times faster than
+the json module, and writes NaN as null instead of invalid JSON. Without
+orjson the response falls back to JSONResponse's encoder. It is not the app's
+default response class: for routes that return models, FastAPI's default
+path already serializes straight to JSON bytes with Pydantic.
+"""
+
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is available."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        try:
+            return orjson.dumps(content, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Pydantic models and other types orjson doesn't know
+            return orjson.dumps(jsonable_encoder(content), option=_ORJSON_OPTIONS)
@@ -0,0 +1,138 @@
+"""Opt-in slow-query log with query plans.
+
+With settings.slow_query_ms > 0, every SQL statement that takes at least
+that long is logged (logger "app.slow_queries") together with its bound
+parameters and the database's plan for it, and kept in a ring buffer of the
+last slow_query_log_size entries, served by GET /api/admin/slow-queries.
+
+The plan is captured right after the statement, on a separate DBAPI cursor
+of the same connection (so it sees the same transaction and doesn't fire
+the engine events again):
+
+- SQLite: EXPLAIN QUERY PLAN
+- PostgreSQL: EXPLAIN (ANALYZE, BUFFERS) for SELECTs, which runs the query
+  a second time to get real row counts and buffer hits; plain EXPLAIN for
+  anything else, so writes are never repeated
+
+Capturing a plan adds the cost of the EXPLAIN to the slow request, which is
+why the recorder is off by default.
+"""
+
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.slow_queries")
+
+
+def explain_prefix(dialect_name: str, statement: str) -> Optional[str]:
+    """EXPLAIN prefix for a statement on a dialect, or None if it has no plan."""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword not in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"):
+        return None
+    if dialect_name == "sqlite":
+        return "EXPLAIN QUERY PLAN "
+    if dialect_name == "postgresql":
+        if keyword in ("SELECT", "WITH"):
+            return "EXPLAIN (ANALYZE, BUFFERS) "
+        return "EXPLAIN "
+    return None
+
+
+def format_plan(dialect_name: str, rows: list) -> list[str]:
+    """Plan rows as text lines (SQLite rows are (id, parent, notused, detail))."""
+    if dialect_name == "sqlite":
+        return [str(row[-1]) for row in rows]
+    return [str(row[0]) for row in rows]
+
+
+def capture_plan(conn, statement: str, parameters) -> Optional[list[str]]:
+    """Run EXPLAIN for a statement on the connection it just ran on."""
+    dialect_name = conn.dialect.name
+    prefix = explain_prefix(dialect_name, statement)
+    if prefix is None:
+        return None
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return format_plan(dialect_name, cursor.fetchall())
+    except Exception as exc:  # the plan is best effort; never fail the request
+        return [f"EXPLAIN failed: {exc}"]
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    """Ring buffer of the most recent slow statements."""
+
+    def __init__(self, threshold_ms: float, size: int = 100):
+        self.threshold_ms = threshold_ms
+        self._entries: deque = deque(maxlen=size)
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def record(self, entry: dict):
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> list[dict]:
+        """Recorded statements, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    def after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("slow_query_start")
+        if not self.enabled or not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        plan = None if executemany else capture_plan(conn, statement, parameters)
+        entry = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "database": conn.dialect.name,
+            "statement": statement,
+            "parameters": repr(parameters),
+            "executemany": executemany,
+            "plan": plan,
+        }
+        self.record(entry)
+        logger.warning(
+            "Slow query (%.1f ms): %s\n  parameters: %s\n  plan:\n    %s",
+            duration_ms, statement, entry["parameters"], "\n    ".join(plan or ["(none)"]),
+        )
+
+    def on_error(self, context):
+        conn = context.connection
+        starts = conn.info.get("slow_query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+slow_query_log = SlowQueryLog(settings.slow_query_ms, settings.slow_query_log_size)
+
+# Installed on every Engine; the listeners return at once while disabled
+event.listen(Engine, "before_cursor_execute", slow_query_log.before_execute)
+event.listen(Engine, "after_cursor_execute", slow_query_log.after_execute)
+event.listen(Engine, "handle_error", slow_query_log.on_error)
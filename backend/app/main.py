@@ -1,10 +1,17 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import pitchers_router, leaderboards_router, discover_router, stats_router
-from app.core.database import create_tables
+from app.api import pitchers_router, leaderboards_router, discover_router, stats_router, admin_router
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.database import ReadSessionLocal
+from app.core.http_cache import HTTPCacheMiddleware
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.profiling import ProfilingMiddleware
 # Import models to register them with SQLAlchemy
-from app.models import Pitcher, Game, Pitch, SeasonStats  # noqa: F401
+from app.models import Pitcher, Game, Pitch, SeasonStats, PitcherGame, StatMoments  # noqa: F401
+from app.services.search_index import search_index
 
 app = FastAPI(
     title="Vibe-Coded Baseball API",
@@ -12,12 +19,49 @@ app = FastAPI(
     version="0.1.0",
 )
 
-# Create database tables on startup
+# The schema is managed by Alembic (alembic upgrade head), never at startup
 @app.on_event("startup")
 async def startup_event():
-    create_tables()
+    # Build the pitcher search index in the background so the first keystroke
+    # is fast without holding up the worker's startup
+    search_index.warm(ReadSessionLocal)
+
+# HTTP caching for GETs. ETags follow the data version the loaders bump, so a
+# client revalidating unchanged data gets an empty 304 without a database hit.
+# Data only changes on a load, hence the day of stale-while-revalidate.
+app.add_middleware(
+    HTTPCacheMiddleware,
+    policies={
+        "/api/leaderboards": "public, max-age=300, stale-while-revalidate=86400",
+        "/api/discover": "public, max-age=3600, stale-while-revalidate=86400",
+        "/api/pitchers": "public, max-age=300, stale-while-revalidate=86400",
+        "/api/pitchers/search": "public, max-age=60, stale-while-revalidate=3600",
+    },
+)
+
+# br/gzip for JSON bodies over the size threshold. It wraps the cache
+# middleware so cached responses (known by ETag) are compressed only once.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_min_size,
+    cache_bytes=settings.compression_cache_mb * 1024 * 1024,
+)
+
+# Per-request wall/database time, statement and row counts: Server-Timing
+# header plus histograms at /metrics. Outside the cache and compression
+# middleware so their work is part of the measured request.
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# On-demand profiling of single requests (?profile=svg or X-Profile, with
+# X-Admin-Token), off unless PROFILING_ENABLED and ADMIN_TOKEN are set.
+# Outside the metrics middleware so the profile covers the whole stack
+# below CORS.
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
 
 # CORS configuration - allow all origins for local development
+# (added last so it wraps the other middleware and 304s get CORS headers too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allow all origins in development
@@ -33,6 +77,13 @@ async def health_check():
     return {"status": "healthy", "service": "vibe-coded-baseball-api"}
 
 
+if settings.metrics_enabled:
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics():
+        """Request metrics in the Prometheus text format."""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -48,3 +99,4 @@ app.include_router(pitchers_router, prefix="/api")
 app.include_router(leaderboards_router, prefix="/api")
 app.include_router(discover_router, prefix="/api")
 app.include_router(stats_router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
@@ -2,5 +2,8 @@ from app.models.pitcher import Pitcher
 from app.models.game import Game
 from app.models.pitch import Pitch
 from app.models.season_stats import SeasonStats
+from app.models.pitcher_game import PitcherGame
+from app.models.stat_moments import StatMoments
+from app.models.data_version import DataVersionRow
 
-__all__ = ["Pitcher", "Game", "Pitch", "SeasonStats"]
+__all__ = ["Pitcher", "Game", "Pitch", "SeasonStats", "PitcherGame", "StatMoments", "DataVersionRow"]
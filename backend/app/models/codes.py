@@ -0,0 +1,187 @@
+"""Dictionary encoding for categorical Statcast pitch columns.
+
+Columns like description and events hold one of a few dozen strings, repeated
+on every one of millions of pitch rows. They are stored as SmallInteger codes
+and converted transparently by the CodedString column type, so ORM code keeps
+comparing against strings while the database compares integers.
+
+Codes are list position + 1. Vocabularies are append-only: never reorder or
+remove entries, only add new values at the end so existing codes stay valid.
+Writing a value missing from its vocabulary raises UnknownCodeError rather
+than losing it to NULL; the loader checks a whole batch up front and names
+every new value, so the vocabulary can be extended before the load is rerun.
+"""
+
+from typing import Optional
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+DESCRIPTIONS = (
+    "ball",
+    "blocked_ball",
+    "called_strike",
+    "foul",
+    "foul_bunt",
+    "foul_tip",
+    "foul_pitchout",
+    "bunt_foul_tip",
+    "hit_by_pitch",
+    "hit_into_play",
+    "hit_into_play_no_out",
+    "hit_into_play_score",
+    "missed_bunt",
+    "pitchout",
+    "swinging_pitchout",
+    "swinging_strike",
+    "swinging_strike_blocked",
+    "intent_ball",
+    "automatic_ball",
+    "automatic_strike",
+)
+
+EVENTS = (
+    "single",
+    "double",
+    "triple",
+    "home_run",
+    "field_out",
+    "strikeout",
+    "strikeout_double_play",
+    "walk",
+    "intent_walk",
+    "hit_by_pitch",
+    "force_out",
+    "grounded_into_double_play",
+    "double_play",
+    "triple_play",
+    "fielders_choice",
+    "fielders_choice_out",
+    "field_error",
+    "sac_fly",
+    "sac_bunt",
+    "sac_fly_double_play",
+    "sac_bunt_double_play",
+    "catcher_interf",
+    "batter_interference",
+    "fan_interference",
+    "caught_stealing_2b",
+    "caught_stealing_3b",
+    "caught_stealing_home",
+    "pickoff_1b",
+    "pickoff_2b",
+    "pickoff_3b",
+    "pickoff_caught_stealing_2b",
+    "pickoff_caught_stealing_3b",
+    "pickoff_caught_stealing_home",
+    "stolen_base_2b",
+    "stolen_base_3b",
+    "stolen_base_home",
+    "wild_pitch",
+    "passed_ball",
+    "balk",
+    "other_out",
+    "other_advance",
+    "runner_double_play",
+    "game_advisory",
+    "truncated_pa",
+    "ejection",
+)
+
+PITCH_NAMES = (
+    "4-Seam Fastball",
+    "Sinker",
+    "Cutter",
+    "Slider",
+    "Sweeper",
+    "Slurve",
+    "Curveball",
+    "Knuckle Curve",
+    "Slow Curve",
+    "Changeup",
+    "Split-Finger",
+    "Forkball",
+    "Screwball",
+    "Knuckleball",
+    "Eephus",
+    "Other",
+    "Pitch Out",
+    "Intentional Ball",
+    "2-Seam Fastball",
+    "Fastball",
+)
+
+BB_TYPES = (
+    "ground_ball",
+    "line_drive",
+    "fly_ball",
+    "popup",
+)
+
+INNING_HALVES = (
+    "Top",
+    "Bot",
+)
+
+# Value groups used by the aggregations and pitch flags
+WHIFF_DESCRIPTIONS = ["swinging_strike", "swinging_strike_blocked"]
+SWING_DESCRIPTIONS = WHIFF_DESCRIPTIONS + ["foul", "foul_tip", "foul_bunt", "hit_into_play"]
+
+# Events that end a runner's play rather than the batter's plate appearance
+NON_PA_EVENTS = [
+    "caught_stealing_2b", "caught_stealing_3b", "caught_stealing_home",
+    "pickoff_1b", "pickoff_2b", "pickoff_3b",
+    "pickoff_caught_stealing_2b", "pickoff_caught_stealing_3b", "pickoff_caught_stealing_home",
+    "stolen_base_2b", "stolen_base_3b", "stolen_base_home",
+    "wild_pitch", "passed_ball", "balk", "other_advance", "game_advisory",
+]
+
+
+class UnknownCodeError(ValueError):
+    """A categorical value that isn't in its column's vocabulary."""
+
+
+class CodedString(TypeDecorator):
+    """String column stored as a SmallInteger code from a fixed vocabulary."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: tuple):
+        super().__init__()
+        self.values = values
+        self.codes = {value: code for code, value in enumerate(values, start=1)}
+
+    def encode(self, value: Optional[str]) -> Optional[int]:
+        """Code for a value (None if missing); unknown values raise UnknownCodeError."""
+        if value is None:
+            return None
+        code = self.codes.get(value)
+        if code is None:
+            raise UnknownCodeError(f"{value!r} is not in the vocabulary; add it to app/models/codes.py")
+        return code
+
+    def unknown(self, values) -> list[str]:
+        """The values (None aside) that aren't in the vocabulary, sorted."""
+        return sorted({value for value in values if value is not None} - self.codes.keys())
+
+    def decode(self, code: Optional[int]) -> Optional[str]:
+        """Value for a code (None if missing or out of range)."""
+        if code is None or not 1 <= code <= len(self.values):
+            return None
+        return self.values[code - 1]
+
+    def process_bind_param(self, value, dialect):
+        return self.encode(value)
+
+    def process_result_value(self, value, dialect):
+        return self.decode(value)
+
+    def process_literal_param(self, value, dialect):
+        code = self.encode(value)
+        return "NULL" if code is None else str(code)
+
+    @property
+    def python_type(self):
+        return str
@@ -0,0 +1,18 @@
+"""The data version behind the API's ETags (see app.core.http_cache)."""
+
+from sqlalchemy import Column, Integer, BigInteger
+
+from app.core.database import Base
+
+
+class DataVersionRow(Base):
+    """Single row (id 1) holding the version the loaders bump after a change.
+
+    It lives in the database rather than on the API host so that a loader
+    run from anywhere against DATABASE_URL is seen by every API worker.
+    """
+
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
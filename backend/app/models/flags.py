@@ -0,0 +1,124 @@
+"""Per-pitch outcome flags packed into the pitches.flags column.
+
+Whiff%, zone%, chase%, CSW and first-pitch-strike all classify each pitch by
+its description, zone, count and pitch type. The loader derives those
+classifications once at ingest (compute_flags) and stores them as bits, so
+aggregations are SUMs over bit tests (count_flag) instead of repeated
+description IN (...) and zone range checks inside CASE expressions.
+
+Bits are append-only like the code vocabularies: never renumber a flag, and
+ship a migration that recomputes the column after changing how one is
+derived (0005_pitch_flags did the first backfill).
+"""
+
+from enum import IntFlag
+from typing import Optional
+
+from sqlalchemy import case, func, literal
+
+from app.models.codes import NON_PA_EVENTS, SWING_DESCRIPTIONS, WHIFF_DESCRIPTIONS
+from app.models.pitch import Pitch
+
+
+class PitchFlag(IntFlag):
+    SWING = 1
+    WHIFF = 2
+    IN_ZONE = 4
+    CALLED_STRIKE = 8
+    FIRST_PITCH = 16
+    PA_END = 32
+    FASTBALL = 64
+    BREAKING = 128
+    OUT_OF_ZONE = 256
+
+
+FASTBALL_TYPES = ["FF", "SI", "FC", "FT"]
+# Breaking balls, the pitches h_movement averages over
+BREAKING_TYPES = ["SL", "CU", "KC", "SV"]
+IN_ZONE = range(1, 10)      # zones 1-9 are the strike zone
+OUT_OF_ZONE = range(11, 15)  # zones 11-14 surround it
+
+_SWINGS = frozenset(SWING_DESCRIPTIONS)
+_WHIFFS = frozenset(WHIFF_DESCRIPTIONS)
+_NON_PA = frozenset(NON_PA_EVENTS)
+_FASTBALLS = frozenset(FASTBALL_TYPES)
+_BREAKING = frozenset(BREAKING_TYPES)
+
+
+def compute_flags(
+    description: Optional[str],
+    zone: Optional[int],
+    balls: Optional[int],
+    strikes: Optional[int],
+    events: Optional[str],
+    pitch_type: Optional[str],
+) -> int:
+    """Flags for one pitch, from its raw Statcast values."""
+    flags = 0
+    if description in _SWINGS:
+        flags |= PitchFlag.SWING
+    if description in _WHIFFS:
+        flags |= PitchFlag.WHIFF
+    if description == "called_strike":
+        flags |= PitchFlag.CALLED_STRIKE
+    if zone in IN_ZONE:
+        flags |= PitchFlag.IN_ZONE
+    elif zone in OUT_OF_ZONE:
+        flags |= PitchFlag.OUT_OF_ZONE
+    if balls == 0 and strikes == 0:
+        flags |= PitchFlag.FIRST_PITCH
+    if events is not None and events not in _NON_PA:
+        flags |= PitchFlag.PA_END
+    if pitch_type in _FASTBALLS:
+        flags |= PitchFlag.FASTBALL
+    elif pitch_type in _BREAKING:
+        flags |= PitchFlag.BREAKING
+    return int(flags)
+
+
+def flags_expression():
+    """SQL equivalent of compute_flags over the pitches columns (for backfills)."""
+    conditions = [
+        (PitchFlag.SWING, Pitch.description.in_(SWING_DESCRIPTIONS)),
+        (PitchFlag.WHIFF, Pitch.description.in_(WHIFF_DESCRIPTIONS)),
+        (PitchFlag.CALLED_STRIKE, Pitch.description == "called_strike"),
+        (PitchFlag.IN_ZONE, Pitch.zone.between(IN_ZONE.start, IN_ZONE.stop - 1)),
+        (PitchFlag.OUT_OF_ZONE, Pitch.zone.between(OUT_OF_ZONE.start, OUT_OF_ZONE.stop - 1)),
+        (PitchFlag.FIRST_PITCH, (Pitch.balls == 0) & (Pitch.strikes == 0)),
+        (PitchFlag.PA_END, Pitch.events.isnot(None) & Pitch.events.notin_(NON_PA_EVENTS)),
+        (PitchFlag.FASTBALL, Pitch.pitch_type.in_(FASTBALL_TYPES)),
+        (PitchFlag.BREAKING, Pitch.pitch_type.in_(BREAKING_TYPES)),
+    ]
+    expr = literal(0)
+    for flag, condition in conditions:
+        expr = expr + case((condition, int(flag)), else_=0)
+    return expr
+
+
+def has_flag(flag: PitchFlag):
+    """True where every bit in flag is set."""
+    return Pitch.flags.op("&")(int(flag)) == int(flag)
+
+
+def has_any_flag(flag: PitchFlag):
+    """True where at least one bit in flag is set (e.g. CSW)."""
+    return Pitch.flags.op("&")(int(flag)) != 0
+
+
+def count_flag(flag: PitchFlag, any_bit: bool = False):
+    """SUM of pitches carrying flag, for use in aggregate queries."""
+    test = has_any_flag(flag) if any_bit else has_flag(flag)
+    return func.sum(case((test, 1), else_=0))
+
+
+def refresh_pitch_flags(session, game_pks=None) -> int:
+    """Recompute stored flags for the given games (or every pitch).
+
+    Returns the number of pitch rows updated.
+    """
+    query = session.query(Pitch)
+    if game_pks is not None:
+        query = query.filter(Pitch.game_pk.in_(list(game_pks)))
+    updated = query.update({Pitch.flags: flags_expression()}, synchronize_session=False)
+    session.commit()
+    return updated
@@ -0,0 +1,165 @@
+"""Year partitioning of the pitches table on PostgreSQL.
+
+Nearly every query filters on game_year, so on PostgreSQL pitches is created
+as a declaratively partitioned table (PARTITION BY RANGE (game_year)) with
+one partition per season, letting the planner prune leaderboards and season
+aggregations to a single partition, and letting finished seasons be
+VACUUM FREEZEd once and left cold. A DEFAULT partition catches any year
+without its own partition.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+partitioned table's primary key is (id, game_year). The ORM model keeps
+id as its identity (ids stay unique through the shared sequence), and
+SQLite keeps the plain single-table layout.
+"""
+
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.config import settings
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+
+
+def is_postgres(bind) -> bool:
+    return bind.dialect.name == "postgresql"
+
+
+def partition_name(year: int) -> str:
+    return f"pitches_y{year}"
+
+
+def default_partition_years() -> range:
+    """Seasons that get a partition when the table is first created."""
+    return range(settings.pitches_partition_first_year, date.today().year + 2)
+
+
+def partitioned_pitches_table() -> Table:
+    """Copy of the pitches table with the PostgreSQL partitioning layout."""
+    metadata = MetaData()
+    Pitcher.__table__.to_metadata(metadata)  # foreign key target
+    table = Pitch.__table__.to_metadata(metadata)
+    table.dialect_options["postgresql"]["partition_by"] = "RANGE (game_year)"
+    table.c.game_year.primary_key = True
+    table.append_constraint(PrimaryKeyConstraint(table.c.id, table.c.game_year))
+    table.c.id.autoincrement = True
+    return table
+
+
+def partition_ddl(year: int) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(year)} PARTITION OF pitches "
+        f"FOR VALUES FROM ({year}) TO ({year + 1})"
+    )
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """Whether pitches already exists as a partitioned table."""
+    return bool(conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'pitches' AND c.relnamespace = to_regnamespace(current_schema())"
+    )).scalar())
+
+
+def existing_partition_years(conn: Connection) -> set[int]:
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'pitches'"
+    ))
+    prefix = partition_name(0)[:-1]
+    return {int(name[len(prefix):]) for (name,) in rows if name[len(prefix):].isdigit()}
+
+
+def create_partitioned_pitches(conn: Connection, years: Iterable[int] = None):
+    """Create the partitioned pitches table, its indexes and partitions."""
+    table = partitioned_pitches_table()
+    dialect = conn.dialect
+    conn.execute(text(str(CreateTable(table).compile(dialect=dialect))))
+    # Indexes on the parent are created on every partition, current and future
+    for index in table.indexes:
+        conn.execute(text(str(CreateIndex(index).compile(dialect=dialect))))
+
+    for year in years if years is not None else default_partition_years():
+        conn.execute(text(partition_ddl(year)))
+    conn.execute(text("CREATE TABLE IF NOT EXISTS pitches_default PARTITION OF pitches DEFAULT"))
+
+
+def convert_to_partitioned(conn: Connection) -> bool:
+    """Rebuild an existing heap pitches table as a partitioned one.
+
+    Renames the heap aside, creates the partitioned table with a partition
+    per season present (plus the default range and DEFAULT), copies rows
+    season by season, carries the id sequence forward and drops the heap.
+    Returns False if pitches is already partitioned.
+    """
+    if is_partitioned(conn):
+        return False
+
+    columns = ", ".join(column.name for column in Pitch.__table__.columns)
+    years = [y for (y,) in conn.execute(text("SELECT DISTINCT game_year FROM pitches"))]
+    years = sorted(set(years) | set(default_partition_years()))
+
+    conn.execute(text("ALTER TABLE pitches RENAME TO pitches_heap"))
+    conn.execute(text("ALTER TABLE pitches_heap RENAME CONSTRAINT pitches_pkey TO pitches_heap_pkey"))
+    # Index names are schema-wide; free them for the partitioned table
+    for (name,) in conn.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'pitches_heap' "
+        "AND indexname <> 'pitches_heap_pkey'"
+    )).fetchall():
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+    create_partitioned_pitches(conn, years)
+    for year in years:
+        conn.execute(text(
+            f"INSERT INTO pitches ({columns}) SELECT {columns} FROM pitches_heap WHERE game_year = :year"
+        ), {"year": year})
+
+    # The old sequence is owned by (and dropped with) the heap
+    conn.execute(text(
+        "SELECT setval(pg_get_serial_sequence('pitches', 'id'), "
+        "COALESCE((SELECT max(id) FROM pitches), 0) + 1, false)"
+    ))
+    conn.execute(text("DROP TABLE pitches_heap"))
+    return True
+
+
+def ensure_year_partitions(bind: Engine, years: Iterable[int]):
+    """Create missing season partitions before loading data for those years.
+
+    No-op on SQLite or when pitches isn't partitioned. PostgreSQL won't attach
+    a partition while the DEFAULT partition holds rows for its range, so any
+    such rows are moved into the new partition in the same transaction.
+    """
+    if not is_postgres(bind):
+        return
+    with bind.begin() as conn:
+        if not is_partitioned(conn):
+            return
+        missing = set(years) - existing_partition_years(conn)
+        for year in sorted(missing):
+            params = {"year": year}
+            conn.execute(text(
+                "CREATE TEMP TABLE pitches_moved ON COMMIT DROP AS "
+                "SELECT * FROM pitches_default WHERE game_year = :year"
+            ), params)
+            conn.execute(text("DELETE FROM pitches_default WHERE game_year = :year"), params)
+            conn.execute(text(partition_ddl(year)))
+            conn.execute(text("INSERT INTO pitches SELECT * FROM pitches_moved"))
+            conn.execute(text("DROP TABLE pitches_moved"))
+
+
+def create_pitches_table(bind: Engine):
+    """Create pitches with the right layout for the database (if missing)."""
+    if inspect(bind).has_table("pitches"):
+        return
+    if is_postgres(bind):
+        with bind.begin() as conn:
+            create_partitioned_pitches(conn)
+    else:
+        Pitch.__table__.create(bind)
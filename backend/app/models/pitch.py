@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Index
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.codes import CodedString, DESCRIPTIONS, EVENTS, PITCH_NAMES, BB_TYPES, INNING_HALVES
 
 
 class Pitch(Base):
@@ -9,23 +10,23 @@ class Pitch(Base):
 
     __tablename__ = "pitches"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     # Foreign keys
-    pitcher_id = Column(Integer, ForeignKey("pitchers.id"), index=True)
+    pitcher_id = Column(Integer, ForeignKey("pitchers.id"))
 
     # Game context
-    game_pk = Column(Integer, index=True, nullable=False)
+    game_pk = Column(Integer, nullable=False)
     game_date = Column(Date, index=True, nullable=False)
-    game_year = Column(Integer, index=True, nullable=False)
+    game_year = Column(Integer, nullable=False)
 
     # Pitch identification
-    pitch_type = Column(String(10), index=True)  # FF, SL, CU, CH, etc.
-    pitch_name = Column(String(50))  # Full name: 4-Seam Fastball, Slider, etc.
+    pitch_type = Column(String(10))  # FF, SL, CU, CH, etc.
+    pitch_name = Column(CodedString(PITCH_NAMES))  # Full name: 4-Seam Fastball, Slider, etc.
 
     # Pitcher/Batter info
-    pitcher_mlbam_id = Column(Integer, index=True)
-    batter_mlbam_id = Column(Integer, index=True)
+    pitcher_mlbam_id = Column(Integer)
+    batter_mlbam_id = Column(Integer)
     batter_stand = Column(String(1))  # L or R
     p_throws = Column(String(1))  # L or R
 
@@ -34,7 +35,7 @@ class Pitch(Base):
     strikes = Column(Integer)
     outs_when_up = Column(Integer)
     inning = Column(Integer)
-    inning_topbot = Column(String(10))  # Top or Bot
+    inning_topbot = Column(CodedString(INNING_HALVES))  # Top or Bot
     at_bat_number = Column(Integer)
     pitch_number = Column(Integer)
 
@@ -70,14 +71,15 @@ class Pitch(Base):
 
     # Result
     type = Column(String(1))  # B=Ball, S=Strike, X=In play
-    description = Column(String(100))  # called_strike, swinging_strike, ball, hit_into_play, etc.
-    events = Column(String(50))  # single, double, strikeout, walk, etc.
+    description = Column(CodedString(DESCRIPTIONS))  # called_strike, swinging_strike, ball, hit_into_play, etc.
+    events = Column(CodedString(EVENTS))  # single, double, strikeout, walk, etc.
+    flags = Column(SmallInteger, nullable=False, default=0, server_default="0")  # PitchFlag bits, see flags.py
 
     # Batted ball data (only populated if ball in play)
     launch_speed = Column(Float)  # Exit velocity (mph)
     launch_angle = Column(Float)  # Launch angle (degrees)
     hit_distance_sc = Column(Float)  # Hit distance (feet)
-    bb_type = Column(String(20))  # ground_ball, line_drive, fly_ball, popup
+    bb_type = Column(CodedString(BB_TYPES))  # ground_ball, line_drive, fly_ball, popup
     hc_x = Column(Float)  # Hit coordinate X
     hc_y = Column(Float)  # Hit coordinate Y
 
@@ -98,7 +100,12 @@ class Pitch(Base):
         return f"<Pitch {self.pitch_type} {self.release_speed}mph>"
 
 
-# Create indexes for common queries
-Index("ix_pitches_pitcher_year", Pitch.pitcher_mlbam_id, Pitch.game_year)
+# Indexes matched to the actual query shapes (see migration 0003_pitch_index_plan).
+# Every API route filters on pitcher_id, never pitcher_mlbam_id.
+
+# Pitcher pages: /pitchers/{id}/stats, /pitches, seasons list, compare
+Index("ix_pitches_pitcher_year_type", Pitch.pitcher_id, Pitch.game_year, Pitch.pitch_type)
+# Leaderboards, season aggregation, max(game_year): filter by year, group by pitcher
+Index("ix_pitches_year_pitcher", Pitch.game_year, Pitch.pitcher_id)
+# Game log rebuilds at load time: filter by game_pk
 Index("ix_pitches_game", Pitch.game_pk, Pitch.pitch_number)
-Index("ix_pitches_type_year", Pitch.pitch_type, Pitch.game_year)
@@ -0,0 +1,55 @@
+"""Per-pitcher, per-game box score lines (game logs)."""
+
+from sqlalchemy import Column, Integer, Float, Date, JSON, ForeignKey, Index
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class PitcherGame(Base):
+    """Pre-aggregated pitching line for each pitcher-game combination.
+
+    Built from the pitches table at load time (see app.services.game_log)
+    so the pitcher game log endpoint is a direct indexed read.
+    """
+
+    __tablename__ = "pitcher_games"
+
+    id = Column(Integer, primary_key=True, index=True)
+    pitcher_id = Column(Integer, ForeignKey("pitchers.id"), nullable=False)
+    game_pk = Column(Integer, nullable=False)
+    game_date = Column(Date, nullable=False)
+    game_year = Column(Integer, nullable=False)
+
+    # Pitching line
+    outs = Column(Integer, default=0)           # Outs recorded (IP = outs / 3)
+    batters_faced = Column(Integer, default=0)
+    hits = Column(Integer, default=0)
+    home_runs = Column(Integer, default=0)
+    walks = Column(Integer, default=0)          # Includes intentional walks
+    hit_by_pitch = Column(Integer, default=0)
+    strikeouts = Column(Integer, default=0)
+
+    # Pitch-level summary
+    total_pitches = Column(Integer, default=0)
+    strikes = Column(Integer, default=0)
+    whiffs = Column(Integer, default=0)
+    avg_velocity = Column(Float)
+    pitch_mix = Column(JSON)                    # {"FF": 42, "SL": 20, ...}
+
+    # Relationships
+    pitcher = relationship("Pitcher")
+
+    __table_args__ = (
+        Index("ix_pitcher_games_pitcher_game", "pitcher_id", "game_pk", unique=True),
+        Index("ix_pitcher_games_pitcher_date", "pitcher_id", "game_date"),
+    )
+
+    @property
+    def innings_pitched(self) -> float:
+        """Innings pitched in baseball notation (6.1 = six and one-third)."""
+        outs = self.outs or 0
+        return outs // 3 + (outs % 3) / 10
+
+    def __repr__(self):
+        return f"<PitcherGame pitcher_id={self.pitcher_id} game_pk={self.game_pk}>"
@@ -0,0 +1,40 @@
+"""Sufficient statistics for correlating pairs of season stats."""
+
+from sqlalchemy import Column, Integer, Float, String, Boolean, Index
+
+from app.core.database import Base
+
+
+class StatMoments(Base):
+    """Sums needed to correlate one pair of season stats within a group.
+
+    One row per (year, is_starter, innings bucket, stat pair), rebuilt from
+    season_stats whenever it changes (see app.services.stat_moments). Pearson
+    r and the regression line for any Discover filter that lines up with the
+    buckets are then a SUM over a few of these rows, however many pitchers
+    there are.
+    """
+
+    __tablename__ = "stat_moments"
+
+    id = Column(Integer, primary_key=True)
+    year = Column(Integer, nullable=False)
+    is_starter = Column(Boolean)                # Pitcher.is_starter (may be NULL)
+    innings_bucket = Column(Integer)            # Lower bound; NULL when innings_pitched is
+    stat_x = Column(String(30), nullable=False)
+    stat_y = Column(String(30), nullable=False)
+
+    # Over seasons where both stats are present
+    n = Column(Integer, nullable=False)
+    sum_x = Column(Float, nullable=False)
+    sum_y = Column(Float, nullable=False)
+    sum_xx = Column(Float, nullable=False)
+    sum_yy = Column(Float, nullable=False)
+    sum_xy = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_stat_moments_pair_year", "stat_x", "stat_y", "year"),
+    )
+
+    def __repr__(self):
+        return f"<StatMoments {self.stat_x}/{self.stat_y} year={self.year} bucket={self.innings_bucket}>"
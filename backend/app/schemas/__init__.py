@@ -8,6 +8,8 @@ from app.schemas.pitcher import (
     PitcherSeasonStats,
     PitchBase,
     PitchTypeStats,
+    PitcherComparison,
+    PitcherCompareResponse,
     PaginatedResponse,
 )
 from app.schemas.leaderboard import (
@@ -35,6 +37,8 @@ __all__ = [
     "PitcherSeasonStats",
     "PitchBase",
     "PitchTypeStats",
+    "PitcherComparison",
+    "PitcherCompareResponse",
     "PaginatedResponse",
     "LeaderboardEntry",
     "LeaderboardResponse",
@@ -137,6 +137,20 @@ class PitcherDetailResponse(PitcherResponse):
     career_stats: Optional[PitcherSeasonStats] = None
 
 
+class PitcherComparison(BaseModel):
+    """One pitcher's metadata and season summary in a comparison."""
+
+    pitcher: PitcherResponse
+    stats: Optional[PitcherSeasonStats] = None
+
+
+class PitcherCompareResponse(BaseModel):
+    """Side-by-side season summaries for several pitchers."""
+
+    year: Optional[int] = None
+    pitchers: list[PitcherComparison] = []
+
+
 class PaginatedResponse(BaseModel):
     """Generic paginated response wrapper."""
 
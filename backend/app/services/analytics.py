@@ -0,0 +1,225 @@
+"""Optional DuckDB backend for aggregation-heavy queries.
+
+Leaderboards, pitcher season stats and season aggregation scan a handful of
+the pitches columns across whole seasons, which a columnar engine does far
+faster than SQLite's row store. When settings.analytics_backend is "duckdb",
+those queries run against a DuckDB snapshot of the pitches and pitchers
+tables (build_snapshot, refreshed by the loaders) instead of the main
+database.
+
+Routes build their queries with SQLAlchemy exactly as before and hand them
+to an Analytics object (all/first/scalar). With the default "sqlalchemy"
+backend, or when no snapshot exists yet, the query runs on its own session.
+With DuckDB, the statement is compiled with the PostgreSQL dialect (which
+DuckDB's SQL accepts) and executed against the snapshot. Coded columns and
+flags are copied as raw integers, so literal codes in the compiled SQL match.
+
+The snapshot lags the main database until the next refresh; writes always
+go to the main database.
+"""
+
+import os
+import time
+from decimal import Decimal
+from pathlib import Path
+from threading import Lock
+from types import SimpleNamespace
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import Float, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.types import TypeDecorator
+
+from app.core.config import settings
+from app.core.database import Base, get_read_db
+from app.core.metrics import record_query
+
+# Tables copied into the snapshot (everything the routed queries touch)
+SNAPSHOT_TABLES = ["pitchers", "pitches"]
+SNAPSHOT_CHUNK_ROWS = 250_000
+
+_dialect = postgresql.dialect()
+
+
+def compile_query(query) -> tuple[str, list]:
+    """Render a Query/select as literal SQL for DuckDB.
+
+    Also returns per-column result converters, so coded columns selected
+    from the snapshot come back decoded like they do through the ORM.
+    """
+    statement = query.statement if isinstance(query, Query) else query
+    sql = str(statement.compile(dialect=_dialect, compile_kwargs={"literal_binds": True}))
+    converters = [
+        column.type.process_result_value if isinstance(column.type, TypeDecorator) else None
+        for column in statement.selected_columns
+    ]
+    return sql, converters
+
+
+def _value(value):
+    # DuckDB returns DECIMAL for expressions like x * 100.0
+    return float(value) if isinstance(value, Decimal) else value
+
+
+class DuckDBSnapshot:
+    """Read-only connection to the DuckDB snapshot file, reopened when it is rebuilt."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._connection = None
+        self._version: Optional[tuple] = None
+        self._lock = Lock()
+
+    def available(self) -> bool:
+        return self.path.exists()
+
+    def _cursor(self):
+        import duckdb
+
+        stat = self.path.stat()
+        version = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            if self._connection is None or version != self._version:
+                if self._connection is not None:
+                    self._connection.close()
+                self._connection = duckdb.connect(str(self.path), read_only=True)
+                self._version = version
+            # Each cursor is an independent connection, safe per thread
+            return self._connection.cursor()
+
+    def execute(self, sql: str, converters: Optional[list] = None) -> list[SimpleNamespace]:
+        cursor = self._cursor()
+        try:
+            start = time.perf_counter()
+            cursor.execute(sql)
+            rows = cursor.fetchall()
+            record_query(time.perf_counter() - start, len(rows))
+            names = [column[0] for column in cursor.description]
+            converters = converters or [None] * len(names)
+            return [
+                SimpleNamespace(**{
+                    name: convert(value, _dialect) if convert else _value(value)
+                    for name, value, convert in zip(names, row, converters)
+                })
+                for row in rows
+            ]
+        finally:
+            cursor.close()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def snapshot_path() -> Path:
+    if settings.duckdb_path:
+        return Path(settings.duckdb_path)
+    backend_dir = Path(__file__).resolve().parent.parent.parent
+    return backend_dir / "analytics.duckdb"
+
+
+def _duckdb_type(column) -> str:
+    """DuckDB column type for a model column (coded columns stay integers)."""
+    column_type = column.type
+    if isinstance(column_type, TypeDecorator):
+        column_type = column_type.impl_instance
+    if isinstance(column_type, Float):
+        return "DOUBLE"  # DuckDB FLOAT is single precision
+    return column_type.compile(dialect=_dialect)
+
+
+def build_snapshot(bind: Engine, path: Optional[Path] = None) -> int:
+    """Copy the snapshot tables from the main database into a new DuckDB file.
+
+    Raw column values are read (no CodedString decoding) in chunks into
+    tables typed from the models, and the finished file atomically replaces
+    the previous snapshot. Returns the number of pitch rows copied.
+    """
+    import duckdb
+    import pandas as pd
+
+    path = Path(path or snapshot_path())
+    tmp_path = path.with_suffix(".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    pitches = 0
+    duck = duckdb.connect(str(tmp_path))
+    try:
+        with bind.connect() as conn:
+            for name in SNAPSHOT_TABLES:
+                table = Base.metadata.tables[name]
+                columns = ", ".join(column.name for column in table.columns)
+                duck.execute(f"CREATE TABLE {name} (" + ", ".join(
+                    f"{column.name} {_duckdb_type(column)}" for column in table.columns
+                ) + ")")
+
+                chunks = pd.read_sql(text(f"SELECT {columns} FROM {name}"), conn, chunksize=SNAPSHOT_CHUNK_ROWS)
+                for chunk in chunks:
+                    duck.register("chunk", chunk)
+                    duck.execute(f"INSERT INTO {name} SELECT * FROM chunk")
+                    duck.unregister("chunk")
+                    if name == "pitches":
+                        pitches += len(chunk)
+        duck.execute("CHECKPOINT")
+    finally:
+        duck.close()
+
+    os.replace(tmp_path, path)
+    return pitches
+
+
+class Analytics:
+    """Runs aggregate queries on DuckDB when enabled, else on the given session."""
+
+    def __init__(self, db: Session, snapshot: Optional[DuckDBSnapshot] = None):
+        self.db = db
+        self.snapshot = snapshot if snapshot is not None and snapshot.available() else None
+
+    @property
+    def backend(self) -> str:
+        return "duckdb" if self.snapshot else "sqlalchemy"
+
+    def all(self, query: Query) -> list:
+        if self.snapshot:
+            return self.snapshot.execute(*compile_query(query))
+        return query.all()
+
+    def first(self, query: Query):
+        if self.snapshot:
+            rows = self.snapshot.execute(*compile_query(query.limit(1)))
+            return rows[0] if rows else None
+        return query.first()
+
+    def scalar(self, query: Query):
+        if self.snapshot:
+            row = self.first(query)
+            return next(iter(vars(row).values())) if row else None
+        return query.scalar()
+
+
+duckdb_snapshot = DuckDBSnapshot(snapshot_path())
+
+
+def analytics_for(db: Session) -> Analytics:
+    """Analytics for a session, routed per settings.analytics_backend."""
+    if settings.analytics_backend == "duckdb":
+        return Analytics(db, duckdb_snapshot)
+    return Analytics(db)
+
+
+def get_analytics(db: Session = Depends(get_read_db)) -> Analytics:
+    """Dependency for aggregate queries in API routes."""
+    return analytics_for(db)
+
+
+def refresh_snapshot(bind: Engine) -> Optional[int]:
+    """Rebuild the snapshot after a load, if the DuckDB backend is enabled."""
+    if settings.analytics_backend != "duckdb":
+        return None
+    return build_snapshot(bind, duckdb_snapshot.path)
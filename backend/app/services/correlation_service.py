@@ -1,11 +1,12 @@
 """Service for computing statistical correlations and analysis.
 
-Uses scipy.stats for statistical calculations.
+Correlations come from the NumPy kernel in app.services.stats_kernel, which
+fits every stat in a ranking at once. NumPy is imported inside the methods
+that need it, so API workers that never serve a Discover request don't pay
+for it at startup.
 """
 
 from typing import Optional
-import numpy as np
-from scipy import stats
 from sqlalchemy.orm import Session
 
 from app.models.season_stats import SeasonStats
@@ -149,6 +150,40 @@ def get_stat_category(stat_id: str) -> str:
     return STAT_CONFIGS.get(stat_id, {}).get("category", "Other")
 
 
+def _correlation_result(fit: dict, points: list) -> dict:
+    """compute_correlation() response for a stats_kernel fit."""
+    if fit["n"] < 3:
+        # Not enough data for correlation
+        return {
+            "correlation_r": 0.0,
+            "r_squared": 0.0,
+            "p_value": 1.0,
+            "sample_size": fit["n"],
+            "slope": 0.0,
+            "intercept": 0.0,
+            "equation": "Insufficient data",
+            "scatter_data": points,
+        }
+
+    r, p_value = fit["r"], fit["p_value"]
+    slope, intercept = fit["slope"], fit["intercept"]
+
+    # Build equation string
+    sign = "+" if intercept >= 0 else "-"
+    equation = f"y = {slope:.3f}x {sign} {abs(intercept):.2f}"
+
+    return {
+        "correlation_r": round(r, 4),
+        "r_squared": round(r ** 2, 4),
+        "p_value": round(p_value, 6),
+        "sample_size": fit["n"],
+        "slope": round(slope, 4),
+        "intercept": round(intercept, 4),
+        "equation": equation,
+        "scatter_data": points,
+    }
+
+
 class CorrelationService:
     """Service for computing statistical correlations."""
 
@@ -185,12 +220,24 @@ class CorrelationService:
         year: Optional[int] = None,
         is_starter: Optional[bool] = None,
         min_innings: float = 50.0,
+        include_scatter: bool = True,
     ) -> dict:
         """
         Compute correlation between two stats.
 
         Returns correlation coefficient, R², p-value, regression line, and scatter data.
+        Without scatter data, the fit is summed from precomputed moments when
+        the filter allows it.
         """
+        if not include_scatter:
+            from app.services.stat_moments import moment_fits
+
+            fits = moment_fits(
+                self.db, [(stat_x, stat_y)], [year] if year else None, is_starter, min_innings
+            )
+            if fits is not None:
+                return _correlation_result(fits.get((stat_x, stat_y), {"n": 0}), [])
+
         data = self._get_season_data(year, is_starter, min_innings)
 
         # Extract values
@@ -205,64 +252,29 @@ class CorrelationService:
             if x is not None and y is not None:
                 x_values.append(x)
                 y_values.append(y)
-                points.append({
-                    "pitcher_id": pitcher.id,
-                    "name": pitcher.name,
-                    "team": pitcher.team,
-                    "x": round(x, 3) if x else None,
-                    "y": round(y, 3) if y else None,
-                })
+                if include_scatter:
+                    points.append({
+                        "pitcher_id": pitcher.id,
+                        "name": pitcher.name,
+                        "team": pitcher.team,
+                        "x": round(x, 3) if x else None,
+                        "y": round(y, 3) if y else None,
+                    })
 
         if len(x_values) < 3:
-            # Not enough data for correlation
-            return {
-                "correlation_r": 0,
-                "r_squared": 0,
-                "p_value": 1.0,
-                "sample_size": len(x_values),
-                "slope": 0,
-                "intercept": 0,
-                "equation": "Insufficient data",
-                "scatter_data": points,
-            }
-
-        # Convert to numpy arrays
-        x = np.array(x_values)
-        y = np.array(y_values)
-
-        # Compute correlation
-        r, p_value = stats.pearsonr(x, y)
+            return _correlation_result({"n": len(x_values)}, points)
 
-        # Linear regression
-        slope, intercept, _, _, _ = stats.linregress(x, y)
+        from app.services.stats_kernel import regress
 
-        # Build equation string
-        sign = "+" if intercept >= 0 else "-"
-        equation = f"y = {slope:.3f}x {sign} {abs(intercept):.2f}"
+        # Correlation and regression line from the same sums
+        return _correlation_result(regress(x_values, y_values), points)
 
-        return {
-            "correlation_r": round(r, 4),
-            "r_squared": round(r ** 2, 4),
-            "p_value": round(p_value, 6),
-            "sample_size": len(x_values),
-            "slope": round(slope, 4),
-            "intercept": round(intercept, 4),
-            "equation": equation,
-            "scatter_data": points,
-        }
-
-    def compute_stickiness(
+    def _consecutive_seasons(
         self,
-        stat: str,
         is_starter: Optional[bool] = None,
         min_innings: float = 50.0,
-    ) -> dict:
-        """
-        Compute year-over-year stickiness for a stat.
-
-        Correlates stat in Year N with stat in Year N+1 for the same pitcher.
-        """
-        # Get all season data
+    ) -> list[tuple]:
+        """(Year N, Year N+1) SeasonStats pairs for the same pitcher."""
         query = (
             self.db.query(SeasonStats, Pitcher)
             .join(Pitcher, SeasonStats.pitcher_id == Pitcher.id)
@@ -279,44 +291,92 @@ class CorrelationService:
         # Group by pitcher
         by_pitcher = {}
         for season_stat, pitcher in all_data:
-            if pitcher.id not in by_pitcher:
-                by_pitcher[pitcher.id] = {}
-            by_pitcher[pitcher.id][season_stat.year] = getattr(season_stat, stat, None)
-
-        # Build year-over-year pairs
-        year_n = []
-        year_n1 = []
-        years_found = set()
-
-        for pitcher_id, years in by_pitcher.items():
-            sorted_years = sorted(years.keys())
-            for i in range(len(sorted_years) - 1):
-                y1 = sorted_years[i]
-                y2 = sorted_years[i + 1]
-                if y2 == y1 + 1:  # Consecutive years only
-                    val1 = years[y1]
-                    val2 = years[y2]
-                    if val1 is not None and val2 is not None:
-                        year_n.append(val1)
-                        year_n1.append(val2)
-                        years_found.add(y1)
-                        years_found.add(y2)
-
-        if len(year_n) < 3:
-            return {
-                "r_squared": 0,
-                "sample_size": len(year_n),
-                "years_analyzed": 0,
+            by_pitcher.setdefault(pitcher.id, {})[season_stat.year] = season_stat
+
+        pairs = []
+        for years in by_pitcher.values():
+            for year, season_stat in sorted(years.items()):
+                following = years.get(year + 1)  # Consecutive years only
+                if following is not None:
+                    pairs.append((season_stat, following))
+
+        return pairs
+
+    @staticmethod
+    def _stickiness(pairs: list[tuple], stat_ids: list[str]) -> dict[str, dict]:
+        """Year N vs Year N+1 correlation of each stat over season pairs."""
+        import numpy as np
+        from app.services.stats_kernel import moments, regression
+
+        shape = (len(pairs), len(stat_ids))
+        year_n = np.array(
+            [[getattr(earlier, stat, None) for stat in stat_ids] for earlier, _ in pairs], dtype=float
+        ).reshape(shape)
+        year_n1 = np.array(
+            [[getattr(later, stat, None) for stat in stat_ids] for _, later in pairs], dtype=float
+        ).reshape(shape)
+        first_years = np.array([earlier.year for earlier, _ in pairs], dtype=int)
+        fit = regression(moments(year_n, year_n1))
+
+        results = {}
+        for i, stat in enumerate(stat_ids):
+            sample_size = int(fit["n"][i])
+            if sample_size < 3:
+                results[stat] = {
+                    "r_squared": 0,
+                    "sample_size": sample_size,
+                    "years_analyzed": 0,
+                }
+                continue
+
+            valid = ~(np.isnan(year_n[:, i]) | np.isnan(year_n1[:, i]))
+            years_found = set(first_years[valid].tolist())
+            years_found |= {year + 1 for year in years_found}
+            results[stat] = {
+                "r_squared": round(float(fit["r"][i]) ** 2, 4),
+                "sample_size": sample_size,
+                "years_analyzed": len(years_found),
             }
 
-        # Compute correlation
-        r, _ = stats.pearsonr(np.array(year_n), np.array(year_n1))
+        return results
 
-        return {
-            "r_squared": round(r ** 2, 4),
-            "sample_size": len(year_n),
-            "years_analyzed": len(years_found),
-        }
+    @staticmethod
+    def _predictive_power(pairs: list[tuple], predictors: list[str], target_stat: str) -> dict[str, dict]:
+        """Correlation of each predictor in Year N with target_stat in Year N+1."""
+        import numpy as np
+        from app.services.stats_kernel import moments, regression
+
+        predictor_values = np.array(
+            [[getattr(earlier, stat, None) for stat in predictors] for earlier, _ in pairs], dtype=float
+        ).reshape(len(pairs), len(predictors))
+        target_values = np.array(
+            [getattr(later, target_stat, None) for _, later in pairs], dtype=float
+        )
+        fit = regression(moments(predictor_values, target_values))
+
+        results = {}
+        for i, stat in enumerate(predictors):
+            sample_size = int(fit["n"][i])
+            results[stat] = {
+                "r_squared": round(float(fit["r"][i]) ** 2, 4) if sample_size >= 3 else 0,
+                "sample_size": sample_size,
+            }
+
+        return results
+
+    def compute_stickiness(
+        self,
+        stat: str,
+        is_starter: Optional[bool] = None,
+        min_innings: float = 50.0,
+    ) -> dict:
+        """
+        Compute year-over-year stickiness for a stat.
+
+        Correlates stat in Year N with stat in Year N+1 for the same pitcher.
+        """
+        pairs = self._consecutive_seasons(is_starter, min_innings)
+        return self._stickiness(pairs, [stat])[stat]
 
     def compute_predictive_power(
         self,
@@ -330,59 +390,8 @@ class CorrelationService:
 
         Correlates predictor_stat in Year N with target_stat in Year N+1.
         """
-        # Get all season data
-        query = (
-            self.db.query(SeasonStats, Pitcher)
-            .join(Pitcher, SeasonStats.pitcher_id == Pitcher.id)
-        )
-
-        if is_starter is not None:
-            query = query.filter(Pitcher.is_starter == is_starter)
-
-        if min_innings > 0:
-            query = query.filter(SeasonStats.innings_pitched >= min_innings)
-
-        all_data = query.order_by(SeasonStats.pitcher_id, SeasonStats.year).all()
-
-        # Group by pitcher
-        by_pitcher = {}
-        for season_stat, pitcher in all_data:
-            if pitcher.id not in by_pitcher:
-                by_pitcher[pitcher.id] = {}
-            by_pitcher[pitcher.id][season_stat.year] = {
-                "predictor": getattr(season_stat, predictor_stat, None),
-                "target": getattr(season_stat, target_stat, None),
-            }
-
-        # Build prediction pairs
-        predictor_values = []
-        target_values = []
-
-        for pitcher_id, years in by_pitcher.items():
-            sorted_years = sorted(years.keys())
-            for i in range(len(sorted_years) - 1):
-                y1 = sorted_years[i]
-                y2 = sorted_years[i + 1]
-                if y2 == y1 + 1:  # Consecutive years only
-                    pred = years[y1].get("predictor")
-                    targ = years[y2].get("target")
-                    if pred is not None and targ is not None:
-                        predictor_values.append(pred)
-                        target_values.append(targ)
-
-        if len(predictor_values) < 3:
-            return {
-                "r_squared": 0,
-                "sample_size": len(predictor_values),
-            }
-
-        # Compute correlation
-        r, _ = stats.pearsonr(np.array(predictor_values), np.array(target_values))
-
-        return {
-            "r_squared": round(r ** 2, 4),
-            "sample_size": len(predictor_values),
-        }
+        pairs = self._consecutive_seasons(is_starter, min_innings)
+        return self._predictive_power(pairs, [predictor_stat], target_stat)[predictor_stat]
 
     def compute_trend(
         self,
@@ -397,10 +406,29 @@ class CorrelationService:
         Compute correlation trend across multiple years.
 
         Returns list of {year, r_squared, correlation_r, sample_size} for each year.
+        Summed from precomputed moments when the filter allows it.
         """
+        from app.services.stat_moments import moment_fits
+        from app.services.stats_kernel import regress
+
+        years = range(start_year, end_year + 1)
+        fits = moment_fits(self.db, [(stat_x, stat_y)], years, is_starter, min_innings, by_year=True)
+        if fits is not None:
+            results = []
+            for year in years:
+                fit = fits.get((stat_x, stat_y, year))
+                if fit and fit["n"] >= 3:
+                    results.append({
+                        "year": year,
+                        "r_squared": round(fit["r"] ** 2, 4),
+                        "correlation_r": round(fit["r"], 4),
+                        "sample_size": fit["n"],
+                    })
+            return results
+
         results = []
 
-        for year in range(start_year, end_year + 1):
+        for year in years:
             data = self._get_season_data(year, is_starter, min_innings)
 
             x_values = []
@@ -414,7 +442,7 @@ class CorrelationService:
                     y_values.append(y)
 
             if len(x_values) >= 3:
-                r, _ = stats.pearsonr(np.array(x_values), np.array(y_values))
+                r = regress(x_values, y_values)["r"]
                 results.append({
                     "year": year,
                     "r_squared": round(r ** 2, 4),
@@ -430,10 +458,11 @@ class CorrelationService:
         min_innings: float = 50.0,
     ) -> list:
         """Compute stickiness for all stats and return sorted rankings."""
+        pairs = self._consecutive_seasons(is_starter, min_innings)
+        all_stickiness = self._stickiness(pairs, list(STAT_CONFIGS))
         results = []
 
-        for stat_id in STAT_CONFIGS.keys():
-            stickiness = self.compute_stickiness(stat_id, is_starter, min_innings)
+        for stat_id, stickiness in all_stickiness.items():
             if stickiness["sample_size"] >= 10:
                 results.append({
                     "stat": stat_id,
@@ -451,6 +480,34 @@ class CorrelationService:
 
         return results
 
+    def _scan_fits(
+        self,
+        stat_pairs: list[tuple[str, str]],
+        year: Optional[int] = None,
+        is_starter: Optional[bool] = None,
+        min_innings: float = 50.0,
+    ) -> dict:
+        """Fits for stat pairs from one season_stats query (moment_fits' fallback)."""
+        import numpy as np
+        from app.services.stats_kernel import moments, regression
+
+        data = self._get_season_data(year, is_starter, min_innings)
+        shape = (len(data), len(stat_pairs))
+        x = np.array(
+            [[getattr(season_stat, stat_x, None) for stat_x, _ in stat_pairs] for season_stat, _ in data],
+            dtype=float,
+        ).reshape(shape)
+        y = np.array(
+            [[getattr(season_stat, stat_y, None) for _, stat_y in stat_pairs] for season_stat, _ in data],
+            dtype=float,
+        ).reshape(shape)
+        fit = regression(moments(x, y))
+
+        return {
+            pair: {name: values[i].item() for name, values in fit.items()}
+            for i, pair in enumerate(stat_pairs)
+        }
+
     def get_correlation_rankings(
         self,
         target_stat: str,
@@ -459,24 +516,29 @@ class CorrelationService:
         min_innings: float = 50.0,
     ) -> list:
         """Get all stats ranked by correlation with a target stat."""
-        results = []
+        from app.services.stat_moments import moment_fits
 
-        for stat_id in STAT_CONFIGS.keys():
-            if stat_id == target_stat:
-                continue
+        stat_ids = [stat_id for stat_id in STAT_CONFIGS if stat_id != target_stat]
+        pairs = [(stat_id, target_stat) for stat_id in stat_ids]
 
-            correlation = self.compute_correlation(
-                stat_id, target_stat, year, is_starter, min_innings
-            )
+        fits = moment_fits(self.db, pairs, [year] if year else None, is_starter, min_innings)
+        if fits is None:
+            fits = self._scan_fits(pairs, year, is_starter, min_innings)
 
-            if correlation["sample_size"] >= 10:
+        results = []
+        for pair in pairs:
+            fit = fits.get(pair, {"n": 0})
+            sample_size = fit["n"]
+            if sample_size >= 10:
+                stat_id = pair[0]
+                r = fit["r"]
                 results.append({
                     "stat": stat_id,
                     "stat_name": get_stat_name(stat_id),
                     "category": get_stat_category(stat_id),
-                    "correlation_r": correlation["correlation_r"],
-                    "r_squared": correlation["r_squared"],
-                    "sample_size": correlation["sample_size"],
+                    "correlation_r": round(r, 4),
+                    "r_squared": round(r ** 2, 4),
+                    "sample_size": sample_size,
                 })
 
         # Sort by absolute correlation (strongest relationships first)
@@ -495,16 +557,15 @@ class CorrelationService:
         min_innings: float = 50.0,
     ) -> list:
         """Compute predictive power for all stats against a target."""
+        stat_ids = [stat_id for stat_id in STAT_CONFIGS if stat_id != target_stat]
+        pairs = self._consecutive_seasons(is_starter, min_innings)
+        all_stickiness = self._stickiness(pairs, stat_ids)
+        all_predictive = self._predictive_power(pairs, stat_ids, target_stat)
         results = []
 
-        for stat_id in STAT_CONFIGS.keys():
-            if stat_id == target_stat:
-                continue
-
-            stickiness = self.compute_stickiness(stat_id, is_starter, min_innings)
-            predictive = self.compute_predictive_power(
-                stat_id, target_stat, is_starter, min_innings
-            )
+        for stat_id in stat_ids:
+            stickiness = all_stickiness[stat_id]
+            predictive = all_predictive[stat_id]
 
             if stickiness["sample_size"] >= 10 and predictive["sample_size"] >= 10:
                 combined = (stickiness["r_squared"] + predictive["r_squared"]) / 2
@@ -0,0 +1,143 @@
+"""Build per-pitcher game logs from pitch-level data.
+
+Each game line (outs, hits, walks, strikeouts, home runs, batters faced and
+pitch mix) is computed in a single pass over the pitches table, grouped by
+pitcher, game and pitch type, then rolled up per game and stored in the
+pitcher_games table.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import func, case
+from sqlalchemy.orm import Session
+
+from app.models.pitch import Pitch
+from app.models.flags import PitchFlag, count_flag
+from app.models.pitcher_game import PitcherGame
+
+
+# Outs recorded on the play for each Statcast event
+OUTS_BY_EVENT = {
+    "strikeout": 1,
+    "field_out": 1,
+    "force_out": 1,
+    "fielders_choice_out": 1,
+    "sac_fly": 1,
+    "sac_bunt": 1,
+    "other_out": 1,
+    "caught_stealing_2b": 1,
+    "caught_stealing_3b": 1,
+    "caught_stealing_home": 1,
+    "pickoff_1b": 1,
+    "pickoff_2b": 1,
+    "pickoff_3b": 1,
+    "pickoff_caught_stealing_2b": 1,
+    "pickoff_caught_stealing_3b": 1,
+    "pickoff_caught_stealing_home": 1,
+    "grounded_into_double_play": 2,
+    "double_play": 2,
+    "strikeout_double_play": 2,
+    "sac_fly_double_play": 2,
+    "sac_bunt_double_play": 2,
+    "triple_play": 3,
+}
+
+HIT_EVENTS = ["single", "double", "triple", "home_run"]
+WALK_EVENTS = ["walk", "intent_walk"]
+STRIKEOUT_EVENTS = ["strikeout", "strikeout_double_play"]
+
+
+def _game_line_query(session: Session):
+    """Aggregate pitches grouped by pitcher, game and pitch type."""
+    outs_expr = case(
+        *[(Pitch.events == event, outs) for event, outs in OUTS_BY_EVENT.items()],
+        else_=0,
+    )
+
+    return session.query(
+        Pitch.pitcher_id,
+        Pitch.game_pk,
+        func.min(Pitch.game_date).label("game_date"),
+        func.min(Pitch.game_year).label("game_year"),
+        Pitch.pitch_type,
+        func.count(Pitch.id).label("pitches"),
+        func.sum(Pitch.release_speed).label("sum_velocity"),
+        func.count(Pitch.release_speed).label("n_velocity"),
+        func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
+        count_flag(PitchFlag.WHIFF).label("whiffs"),
+        func.sum(outs_expr).label("outs"),
+        count_flag(PitchFlag.PA_END).label("batters_faced"),
+        func.sum(case((Pitch.events.in_(HIT_EVENTS), 1), else_=0)).label("hits"),
+        func.sum(case((Pitch.events == "home_run", 1), else_=0)).label("home_runs"),
+        func.sum(case((Pitch.events.in_(WALK_EVENTS), 1), else_=0)).label("walks"),
+        func.sum(case((Pitch.events == "hit_by_pitch", 1), else_=0)).label("hit_by_pitch"),
+        func.sum(case((Pitch.events.in_(STRIKEOUT_EVENTS), 1), else_=0)).label("strikeouts"),
+    ).filter(Pitch.pitcher_id.isnot(None))
+
+
+def build_game_lines(session: Session, game_pks: Optional[Iterable[int]] = None) -> list[dict]:
+    """Compute game lines for the given games (or every game)."""
+    query = _game_line_query(session)
+    if game_pks is not None:
+        query = query.filter(Pitch.game_pk.in_(list(game_pks)))
+
+    rows = query.group_by(Pitch.pitcher_id, Pitch.game_pk, Pitch.pitch_type).all()
+
+    counters = [
+        "strikes", "whiffs", "outs", "batters_faced", "hits",
+        "home_runs", "walks", "hit_by_pitch", "strikeouts",
+    ]
+
+    lines: dict[tuple, dict] = {}
+    for row in rows:
+        key = (row.pitcher_id, row.game_pk)
+        line = lines.get(key)
+        if line is None:
+            line = lines[key] = {
+                "pitcher_id": row.pitcher_id,
+                "game_pk": row.game_pk,
+                "game_date": row.game_date,
+                "game_year": row.game_year,
+                "total_pitches": 0,
+                "sum_velocity": 0.0,
+                "n_velocity": 0,
+                "pitch_mix": {},
+                **{name: 0 for name in counters},
+            }
+
+        line["total_pitches"] += row.pitches
+        line["sum_velocity"] += row.sum_velocity or 0
+        line["n_velocity"] += row.n_velocity
+        for name in counters:
+            line[name] += getattr(row, name) or 0
+        if row.pitch_type:
+            line["pitch_mix"][row.pitch_type] = row.pitches
+
+    for line in lines.values():
+        sum_velocity = line.pop("sum_velocity")
+        n_velocity = line.pop("n_velocity")
+        line["avg_velocity"] = round(sum_velocity / n_velocity, 1) if n_velocity else None
+
+    return list(lines.values())
+
+
+def refresh_pitcher_games(session: Session, game_pks: Optional[Iterable[int]] = None) -> int:
+    """Rebuild stored game lines for the given games (or every game).
+
+    Returns the number of pitcher-game rows written.
+    """
+    if game_pks is not None:
+        game_pks = list(game_pks)
+        if not game_pks:
+            return 0
+
+    lines = build_game_lines(session, game_pks)
+
+    delete_query = session.query(PitcherGame)
+    if game_pks is not None:
+        delete_query = delete_query.filter(PitcherGame.game_pk.in_(game_pks))
+    delete_query.delete(synchronize_session=False)
+
+    session.bulk_insert_mappings(PitcherGame, lines)
+    session.commit()
+    return len(lines)
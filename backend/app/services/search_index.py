@@ -0,0 +1,255 @@
+"""In-memory search index for pitcher name autocomplete.
+
+Names are normalized (accent folding, lowercase, punctuation stripped) and
+split into tokens. Each query word is matched against a prefix trie of those
+tokens; words with no prefix match fall back to trigram similarity so typos
+like "Otani" still find "Ohtani". Results are ranked by match quality and
+then by pitch volume in the most recent season.
+"""
+
+import threading
+import time
+import unicodedata
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.pitcher import Pitcher
+from app.models.pitch import Pitch
+
+
+# Match scores per query word
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+
+# Minimum trigram similarity (Jaccard) for a fuzzy token match
+TRIGRAM_THRESHOLD = 0.3
+
+
+def normalize(text: str) -> str:
+    """Fold accents, lowercase, and replace punctuation with spaces."""
+    folded = unicodedata.normalize("NFKD", text)
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return "".join(c if c.isalnum() else " " for c in folded.lower())
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized tokens."""
+    return normalize(text).split()
+
+
+def trigrams(token: str) -> set[str]:
+    """Get padded trigrams for a token (same padding scheme as pg_trgm)."""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    """Prefix trie node holding the ids of every pitcher below it."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.ids: set[int] = set()
+
+
+class _IndexData:
+    """One immutable build of the index; searches read a single instance."""
+
+    __slots__ = ("entries", "volume", "root", "token_ids", "trigram_tokens")
+
+    def __init__(self):
+        self.entries: dict[int, dict] = {}
+        self.volume: dict[int, int] = {}
+        self.root = _TrieNode()
+        self.token_ids: dict[str, set[int]] = {}
+        self.trigram_tokens: dict[str, set[str]] = {}
+
+    def add_token(self, token: str, pitcher_id: int):
+        node = self.root
+        for char in token:
+            node = node.children.setdefault(char, _TrieNode())
+            node.ids.add(pitcher_id)
+
+        if token not in self.token_ids:
+            self.token_ids[token] = set()
+            for gram in trigrams(token):
+                self.trigram_tokens.setdefault(gram, set()).add(token)
+        self.token_ids[token].add(pitcher_id)
+
+
+class PitcherSearchIndex:
+    """Prefix trie plus trigram index over pitcher names.
+
+    A rebuild fills a new _IndexData and swaps it in with one assignment,
+    so searches running in other threads see either the old index or the
+    new one, never a half-built one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signature: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._data = _IndexData()
+
+    @staticmethod
+    def _pitcher_rows(db: Session) -> list:
+        return db.query(
+            Pitcher.id, Pitcher.mlbam_id, Pitcher.name, Pitcher.team, Pitcher.throws
+        ).order_by(Pitcher.id).all()
+
+    @staticmethod
+    def _signature_of(db: Session, rows: list) -> tuple:
+        """Fingerprint of the indexed columns, so renames and trades count too."""
+        return (id(db.get_bind()), len(rows), hash(tuple(tuple(row) for row in rows)))
+
+    def rebuild(self, db: Session, rows: Optional[list] = None):
+        """Rebuild the index from the pitchers table."""
+        with self._lock:
+            if rows is None:
+                rows = self._pitcher_rows(db)
+            data = _IndexData()
+
+            for p in rows:
+                data.entries[p.id] = {
+                    "id": p.id,
+                    "mlbam_id": p.mlbam_id,
+                    "name": p.name,
+                    "team": p.team,
+                    "throws": p.throws,
+                }
+                for token in tokenize(p.name or ""):
+                    data.add_token(token, p.id)
+
+            # Pitch volume in the most recent season, used as a ranking tiebreaker
+            latest_year = db.query(func.max(Pitch.game_year)).scalar()
+            if latest_year:
+                data.volume = dict(
+                    db.query(Pitch.pitcher_id, func.count(Pitch.id))
+                    .filter(Pitch.game_year == latest_year, Pitch.pitcher_id.isnot(None))
+                    .group_by(Pitch.pitcher_id)
+                    .all()
+                )
+
+            self._data = data
+            self._signature = self._signature_of(db, rows)
+            self._checked_at = time.monotonic()
+
+    def warm(self, session_factory):
+        """Rebuild the index in a background thread.
+
+        Used at startup so a worker can serve requests while the index (and
+        its pitch-volume query) is still being built.
+        """
+        def _build():
+            db = session_factory()
+            try:
+                self.rebuild(db)
+            finally:
+                db.close()
+
+        threading.Thread(target=_build, name="search-index-warm", daemon=True).start()
+
+    def invalidate(self):
+        """Force a rebuild on the next search."""
+        with self._lock:
+            self._signature = None
+
+    def ensure_fresh(self, db: Session):
+        """Rebuild the index if the pitchers table has changed.
+
+        The change check is itself throttled to once per
+        ``settings.search_index_refresh_seconds`` so autocomplete keystrokes
+        don't hit the database.
+        """
+        if self._signature is None:
+            # A warm-up may be building the index; wait for it rather than
+            # starting a second rebuild
+            with self._lock:
+                pass
+
+        now = time.monotonic()
+        if (
+            self._signature is not None
+            and now - self._checked_at < settings.search_index_refresh_seconds
+        ):
+            return
+
+        rows = self._pitcher_rows(db)
+        if self._signature != self._signature_of(db, rows):
+            self.rebuild(db, rows)
+        else:
+            self._checked_at = now
+
+    @staticmethod
+    def _word_scores(data: _IndexData, word: str) -> dict[int, float]:
+        """Score every pitcher matching a single query word."""
+        scores: dict[int, float] = {}
+
+        # Prefix match via the trie
+        node = data.root
+        for char in word:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            for pitcher_id in node.ids:
+                scores[pitcher_id] = PREFIX_SCORE
+            for pitcher_id in data.token_ids.get(word, ()):
+                scores[pitcher_id] = EXACT_SCORE
+            return scores
+
+        # Trigram fallback for typos
+        word_grams = trigrams(word)
+        candidates: set[str] = set()
+        for gram in word_grams:
+            candidates |= data.trigram_tokens.get(gram, set())
+
+        for token in candidates:
+            token_grams = trigrams(token)
+            similarity = len(word_grams & token_grams) / len(word_grams | token_grams)
+            if similarity < TRIGRAM_THRESHOLD:
+                continue
+            for pitcher_id in data.token_ids[token]:
+                if similarity > scores.get(pitcher_id, 0):
+                    scores[pitcher_id] = similarity
+
+        return scores
+
+    def search(self, q: str, limit: int = 10) -> list[dict]:
+        """Find pitchers matching every word of the query, best matches first."""
+        words = tokenize(q)
+        if not words:
+            return []
+
+        data = self._data  # one build for the whole search
+        totals: Optional[dict[int, float]] = None
+        for word in words:
+            scores = self._word_scores(data, word)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {
+                    pitcher_id: total + scores[pitcher_id]
+                    for pitcher_id, total in totals.items()
+                    if pitcher_id in scores
+                }
+            if not totals:
+                return []
+
+        ranked = sorted(
+            totals.items(),
+            key=lambda item: (
+                -item[1],
+                -data.volume.get(item[0], 0),
+                data.entries[item[0]]["name"],
+            ),
+        )
+        return [data.entries[pitcher_id] for pitcher_id, _ in ranked[:limit]]
+
+
+# Shared index used by the API process
+search_index = PitcherSearchIndex()
@@ -0,0 +1,172 @@
+"""Precomputed correlation moments (n, Σx, Σy, Σx², Σy², Σxy) per stat pair.
+
+refresh_stat_moments() groups season_stats by (year, is_starter, innings
+bucket) and stores the sufficient statistics of every pair of Discover stats
+in each group (see app.models.stat_moments). A Discover filter whose
+min_innings is a bucket boundary selects whole groups, so its correlation
+is the SUM of those rows fed to the stats kernel. The cost depends on the
+number of years and buckets, not on the number of pitchers.
+
+The table is rebuilt by the scripts that write season_stats. Filters that
+don't line up with the buckets, and anything that needs the scatter points,
+still scan season_stats.
+"""
+
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.models.pitcher import Pitcher
+from app.models.season_stats import SeasonStats
+from app.models.stat_moments import StatMoments
+from app.services.correlation_service import STAT_CONFIGS
+from app.services.stats_kernel import regression
+
+# Lower bounds of the innings_pitched buckets. A min_innings filter can be
+# answered from moments when it is 0 or one of these values.
+INNINGS_BUCKETS = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 120, 140, 160, 180, 200]
+
+# Discover stats stored in season_stats, in pair order (stat_x before stat_y)
+MOMENT_STATS = [stat for stat in STAT_CONFIGS if stat in SeasonStats.__table__.columns]
+_STAT_ORDER = {stat: i for i, stat in enumerate(MOMENT_STATS)}
+
+_SUMS = ["n", "sum_x", "sum_y", "sum_xx", "sum_yy", "sum_xy"]
+
+
+def innings_bucket(innings_pitched: Optional[float]) -> Optional[int]:
+    """Bucket (lower bound) for an innings_pitched value."""
+    if innings_pitched is None:
+        return None
+    return INNINGS_BUCKETS[max(bisect_right(INNINGS_BUCKETS, innings_pitched) - 1, 0)]
+
+
+def build_stat_moments(session: Session) -> list[dict]:
+    """Compute the moment rows for every group of season_stats."""
+    rows = (
+        session.query(
+            SeasonStats.year,
+            Pitcher.is_starter,
+            SeasonStats.innings_pitched,
+            *[getattr(SeasonStats, stat) for stat in MOMENT_STATS],
+        )
+        .join(Pitcher, SeasonStats.pitcher_id == Pitcher.id)
+        .all()
+    )
+
+    groups: dict[tuple, list] = {}
+    for row in rows:
+        key = (row.year, row.is_starter, innings_bucket(row.innings_pitched))
+        groups.setdefault(key, []).append(row[3:])
+
+    first, second = np.triu_indices(len(MOMENT_STATS), k=1)
+    moments = []
+    for (year, is_starter, bucket), values in groups.items():
+        x = np.array(values, dtype=float)
+        valid = ~np.isnan(x)
+        present = valid.astype(float)
+        x = np.where(valid, x, 0.0)
+
+        # [a, b] sums over the seasons where both stat a and stat b are present
+        n = present.T @ present
+        sums = x.T @ present
+        squares = (x * x).T @ present
+        products = x.T @ x
+
+        for a, b in zip(first.tolist(), second.tolist()):
+            if n[a, b] == 0:
+                continue
+            moments.append({
+                "year": year,
+                "is_starter": is_starter,
+                "innings_bucket": bucket,
+                "stat_x": MOMENT_STATS[a],
+                "stat_y": MOMENT_STATS[b],
+                "n": int(n[a, b]),
+                "sum_x": float(sums[a, b]),
+                "sum_y": float(sums[b, a]),
+                "sum_xx": float(squares[a, b]),
+                "sum_yy": float(squares[b, a]),
+                "sum_xy": float(products[a, b]),
+            })
+
+    return moments
+
+
+def refresh_stat_moments(session: Session) -> int:
+    """Rebuild stat_moments from season_stats. Returns the number of rows written."""
+    moments = build_stat_moments(session)
+    session.query(StatMoments).delete(synchronize_session=False)
+    session.bulk_insert_mappings(StatMoments, moments)
+    session.commit()
+    return len(moments)
+
+
+def moment_fits(
+    session: Session,
+    stat_pairs: list[tuple[str, str]],
+    years: Optional[Iterable[int]] = None,
+    is_starter: Optional[bool] = None,
+    min_innings: float = 50.0,
+    by_year: bool = False,
+) -> Optional[dict]:
+    """Correlation fits for stat pairs under a Discover filter, from moments.
+
+    Returns {(stat_x, stat_y): fit}, or {(stat_x, stat_y, year): fit} with
+    by_year, where fit is a stats_kernel.regression() result as floats.
+    Pairs with no matching seasons are left out. Returns None when the
+    moments can't answer the request (unknown stat, min_innings between
+    buckets, or stat_moments not built yet); callers fall back to a scan.
+    """
+    if min_innings > 0 and min_innings not in INNINGS_BUCKETS:
+        return None
+    if any(x not in _STAT_ORDER or y not in _STAT_ORDER or x == y for x, y in stat_pairs):
+        return None
+    if session.query(StatMoments.id).first() is None:
+        return None
+
+    # Stored pairs are ordered by MOMENT_STATS; swapped ones are flipped below
+    stored = {
+        (x, y) if _STAT_ORDER[x] < _STAT_ORDER[y] else (y, x): (x, y)
+        for x, y in stat_pairs
+    }
+    group = [StatMoments.stat_x, StatMoments.stat_y] + ([StatMoments.year] if by_year else [])
+    query = (
+        session.query(*group, *[func.sum(getattr(StatMoments, name)) for name in _SUMS])
+        .filter(or_(*[
+            and_(StatMoments.stat_x == x, StatMoments.stat_y == y) for x, y in stored
+        ]))
+    )
+
+    if years is not None:
+        query = query.filter(StatMoments.year.in_(list(years)))
+
+    if is_starter is not None:
+        query = query.filter(StatMoments.is_starter == is_starter)
+
+    if min_innings > 0:
+        query = query.filter(StatMoments.innings_bucket >= min_innings)
+
+    rows = query.group_by(*group).all()
+    if not rows:
+        return {}
+
+    keys = []
+    sums = {name: [] for name in _SUMS}
+    for row in rows:
+        x, y = stored[(row[0], row[1])]
+        swapped = (x, y) != (row[0], row[1])
+        keys.append((x, y, row[2]) if by_year else (x, y))
+        n, sum_x, sum_y, sum_xx, sum_yy, sum_xy = row[len(group):]
+        if swapped:
+            sum_x, sum_y, sum_xx, sum_yy = sum_y, sum_x, sum_yy, sum_xx
+        for name, value in zip(_SUMS, [n, sum_x, sum_y, sum_xx, sum_yy, sum_xy]):
+            sums[name].append(value)
+
+    fit = regression(sums)
+    return {
+        key: {name: values[i].item() for name, values in fit.items()}
+        for i, key in enumerate(keys)
+    }
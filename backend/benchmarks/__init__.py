@@ -0,0 +1 @@
+"""pytest-benchmark suite for the Vibe-Coded Baseball API (see conftest.py)."""
@@ -0,0 +1,83 @@
+"""Aggregation: the post-load rebuilds and the season aggregation query.
+
+Each benchmark works on a private copy of the scale's synthetic database.
+The rebuilds replace their tables wholesale, so repeated rounds do the same
+work as the first.
+"""
+
+import contextlib
+import io
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import create_db_engine
+from app.models.flags import refresh_pitch_flags
+from app.services.analytics import Analytics, DuckDBSnapshot, build_snapshot
+from app.services.game_log import refresh_pitcher_games
+from app.services.stat_moments import refresh_stat_moments
+from scripts.aggregate_season_stats import aggregate_statcast_stats
+from scripts.populate_season_stats import populate_season_stats
+
+pytestmark = pytest.mark.benchmark(group="aggregation")
+
+YEAR = 2024
+
+
+@pytest.fixture(scope="session")
+def work_engine(work_db):
+    engine = create_db_engine(f"sqlite:///{work_db.as_posix()}", profile="bulk")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(work_engine, private_data_version):
+    session = sessionmaker(bind=work_engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def snapshot(work_engine, tmp_path_factory):
+    path = tmp_path_factory.mktemp("duckdb") / "analytics.duckdb"
+    build_snapshot(work_engine, path)
+    snapshot = DuckDBSnapshot(path)
+    yield snapshot
+    snapshot.close()
+
+
+def quietly(function, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+def test_refresh_pitch_flags(benchmark, session):
+    benchmark.extra_info["pitches"] = benchmark.pedantic(refresh_pitch_flags, args=(session,), rounds=3)
+
+
+def test_refresh_pitcher_games(benchmark, session):
+    benchmark.extra_info["game_lines"] = benchmark.pedantic(refresh_pitcher_games, args=(session,), rounds=3)
+
+
+def test_populate_season_stats(benchmark, session):
+    benchmark.pedantic(quietly, args=(populate_season_stats, session), rounds=3)
+
+
+def test_refresh_stat_moments(benchmark, session):
+    benchmark.extra_info["moments"] = benchmark.pedantic(refresh_stat_moments, args=(session,), rounds=5)
+
+
+@pytest.mark.parametrize("backend", ["sqlalchemy", "duckdb"])
+def test_aggregate_statcast_stats(benchmark, session, snapshot, backend):
+    analytics = Analytics(session, snapshot if backend == "duckdb" else None)
+    assert analytics.backend == backend
+
+    stats = benchmark(quietly, aggregate_statcast_stats, session, YEAR, analytics)
+    benchmark.extra_info["pitchers"] = len(stats)
+    assert stats
+
+
+def test_build_snapshot(benchmark, work_engine, tmp_path):
+    pitches = benchmark.pedantic(build_snapshot, args=(work_engine, tmp_path / "snapshot.duckdb"), rounds=3)
+    benchmark.extra_info["pitches"] = pitches
@@ -0,0 +1,115 @@
+"""API: every route through the full middleware stack.
+
+Requests go through TestClient against the scale's synthetic database, with
+no If-None-Match (so the HTTP cache never short-circuits) and an identity
+Accept-Encoding (so compression is measured by test_compressed_response
+only). The discover and leaderboard thresholds are lowered to the smallest
+values the routes allow, so the small scales have rows to rank.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core.database import create_db_engine, get_db, get_read_db
+from app.models import Pitch, Pitcher
+from app.services.search_index import search_index
+
+pytestmark = pytest.mark.benchmark(group="api")
+
+ROUTES = {
+    "health": "/health",
+    "pitchers_list": "/api/pitchers?page=2&page_size=50&is_active=true",
+    "pitchers_search": "/api/pitchers/search?q={search}",
+    "pitchers_compare": "/api/pitchers/compare?ids={compare_ids}",
+    "pitcher_detail": "/api/pitchers/{pitcher_id}",
+    "pitcher_pitches": "/api/pitchers/{pitcher_id}/pitches?page_size=500",
+    "pitcher_pitches_filtered": "/api/pitchers/{pitcher_id}/pitches?year={year}&pitch_type=FF",
+    "pitcher_stats": "/api/pitchers/{pitcher_id}/stats",
+    "pitcher_games": "/api/pitchers/{pitcher_id}/games?limit=50",
+    "leaderboard": "/api/leaderboards?stat=velocity&min_pitches=100",
+    "leaderboard_strikeouts_starters": "/api/leaderboards?stat=strikeout_pct&is_starter=true&limit=50&min_pitches=100",
+    "leaderboard_stats": "/api/leaderboards/stats",
+    "discover_stats": "/api/discover/stats",
+    "discover_correlations": "/api/discover/correlations?stat_x=avg_velocity&stat_y=era&min_innings=10",
+    "discover_correlation_rankings": "/api/discover/correlation-rankings?target_stat=era&min_innings=10",
+    "discover_stickiness": "/api/discover/stickiness?min_innings=10",
+    "discover_predictive": "/api/discover/predictive?target_stat=era&min_innings=10",
+    "discover_trends": "/api/discover/trends?stat_x=whiff_pct&stat_y=k_per_9&min_innings=10",
+    "stats_database": "/api/stats/database",
+    "stats_pools": "/api/stats/pools",
+    "admin_slow_queries": "/api/admin/slow-queries",
+}
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+@pytest.fixture(scope="session")
+def api(synthetic_db, private_data_version):
+    """(client, URL parameters) for the scale's database."""
+    engine = create_db_engine(f"sqlite:///{synthetic_db.as_posix()}")
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    busiest = (
+        db.query(Pitch.pitcher_id)
+        .group_by(Pitch.pitcher_id)
+        .order_by(func.count(Pitch.id).desc())
+        .limit(3)
+        .all()
+    )
+    pitcher = db.get(Pitcher, busiest[0].pitcher_id)
+    params = {
+        "pitcher_id": pitcher.id,
+        "compare_ids": ",".join(str(row.pitcher_id) for row in busiest),
+        "search": pitcher.last_name[:4].lower(),
+        "year": db.query(func.max(Pitch.game_year)).scalar(),
+    }
+    db.close()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    search_index.invalidate()
+
+    yield TestClient(app), params
+
+    app.dependency_overrides.clear()
+    search_index.invalidate()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("route", list(ROUTES))
+def test_route(benchmark, api, route):
+    client, params = api
+    url = ROUTES[route].format(**params)
+
+    def get():
+        response = client.get(url, headers=IDENTITY)
+        assert response.status_code == 200, response.text
+        return response
+
+    get()  # warm-up: search index, DuckDB connection, first-query caches
+    response = benchmark(get)
+    benchmark.extra_info["bytes"] = len(response.content)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_compressed_response(benchmark, api, encoding):
+    """A large pitch page with compression (the body cache keeps repeats cheap)."""
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    client, params = api
+    url = ROUTES["pitcher_pitches"].format(**params)
+
+    response = benchmark(client.get, url, headers={"Accept-Encoding": encoding})
+    assert response.headers["content-encoding"] == encoding
+    benchmark.extra_info["bytes"] = int(response.headers.get("content-length", 0))
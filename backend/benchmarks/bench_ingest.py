@@ -0,0 +1,45 @@
+"""Ingest: loading a Statcast frame through the real loader.
+
+pybaseball.statcast() is replaced by the synthetic frame for the scale, so
+the benchmark covers everything load_range() does after the download: the
+per-row conversion and inserts, the index drop and rebuild of bulk load
+mode and the game log rebuild. Each round loads into a fresh database.
+"""
+
+import contextlib
+import io
+import itertools
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, create_db_engine
+from scripts.load_statcast import bulk_load_indexes, load_statcast_range
+
+pytestmark = pytest.mark.benchmark(group="ingest")
+
+
+@pytest.mark.parametrize("bulk", [True, False], ids=["bulk", "incremental"])
+def test_load_statcast(benchmark, scale, statcast_frame, bulk, tmp_path, monkeypatch):
+    import pybaseball
+
+    monkeypatch.setattr(pybaseball, "statcast", lambda start_dt, end_dt: statcast_frame)
+    rounds = itertools.count()
+
+    def fresh_database():
+        path = tmp_path / f"ingest-{next(rounds)}.db"
+        engine = create_db_engine(f"sqlite:///{path.as_posix()}", profile="bulk")
+        Base.metadata.create_all(engine)
+        return (sessionmaker(bind=engine)(),), {}
+
+    def load(session):
+        with contextlib.redirect_stdout(io.StringIO()):
+            with bulk_load_indexes(session, enabled=bulk) as deferred_games:
+                pitches = load_statcast_range("2021-04-01", "2024-09-30", session, deferred_games)
+        session.close()
+        session.get_bind().dispose()
+        return pitches
+
+    pitches = benchmark.pedantic(load, setup=fresh_database, rounds=3)
+    benchmark.extra_info["pitches"] = pitches
+    assert pitches == len(statcast_frame)
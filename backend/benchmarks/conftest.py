@@ -0,0 +1,70 @@
+"""Fixtures for the pytest-benchmark suite.
+
+Every benchmark runs once per data scale in BENCH_SCALES (pitch counts,
+comma separated, default "20k,200k"). The synthetic database for a scale is
+built once by scripts/synthetic_statcast.py and cached in benchmarks/.data,
+keyed on the scale, seed, generator version and schema, so later runs start
+straight away.
+
+The files are named bench_*.py so the regular test run never collects them;
+run them with scripts/run_benchmarks.py.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR / ".data"
+SEED = 42
+
+
+def bench_scales() -> list[int]:
+    from scripts.synthetic_statcast import parse_scale
+
+    return [parse_scale(scale) for scale in os.environ.get("BENCH_SCALES", "20k,200k").split(",") if scale.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    from scripts.synthetic_statcast import scale_label
+
+    if "scale" in metafunc.fixturenames:
+        scales = bench_scales()
+        metafunc.parametrize("scale", scales, ids=[scale_label(s) for s in scales], scope="session")
+
+
+@pytest.fixture(scope="session")
+def statcast_frame(scale):
+    """The scale's synthetic pitches as a pybaseball.statcast() frame."""
+    from scripts.synthetic_statcast import SyntheticStatcast
+
+    return SyntheticStatcast(scale, seed=SEED).statcast()
+
+
+@pytest.fixture(scope="session")
+def synthetic_db(scale) -> Path:
+    """Path of a complete synthetic database for the scale (read-only: copy to modify)."""
+    from scripts.synthetic_statcast import cached_database
+
+    return cached_database(scale, seed=SEED, cache_dir=DATA_DIR)
+
+
+@pytest.fixture(scope="session")
+def work_db(synthetic_db, tmp_path_factory) -> Path:
+    """A private copy of the synthetic database for benchmarks that write."""
+    path = tmp_path_factory.mktemp("work") / synthetic_db.name
+    shutil.copyfile(synthetic_db, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def private_data_version(tmp_path_factory):
+    """Keep loaders and aggregation from bumping the repo's data version file."""
+    from app.core import http_cache
+
+    original = http_cache.data_version
+    http_cache.data_version = http_cache.DataVersion(tmp_path_factory.mktemp("version") / "data_version")
+    yield http_cache.data_version
+    http_cache.data_version = original
@@ -0,0 +1,69 @@
+"""Alembic environment: migrates the database configured in app settings."""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.core.database import Base, create_db_engine, database_url
+import app.models  # noqa: F401  (register every table on Base.metadata)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # Season partitions are managed by app.models.partitions, not the models
+    if type_ == "table" and reflected and compare_to is None and name.startswith("pitches_"):
+        return False
+    return True
+
+
+def run_migrations_offline():
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url") or database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        include_object=include_object,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # Tests and scripts may pass in a connection; otherwise use the app's URL
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    url = config.get_main_option("sqlalchemy.url") or database_url
+    engine = create_db_engine(url, profile="bulk")
+    try:
+        with engine.connect() as connection:
+            _run(connection)
+    finally:
+        engine.dispose()
+
+
+def _run(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # Each revision commits on its own, as CONCURRENTLY/VACUUM steps require
+        transaction_per_migration=True,
+        # SQLite can't ALTER most things; batch mode rebuilds the table instead
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,144 @@
+"""Baseline schema (pitchers, games, pitches, season_stats)
+
+The schema as create_all() used to build it, before migrations existed.
+Databases created that way already have these tables, so each one is only
+created if missing; running `alembic upgrade head` on such a database then
+applies the later revisions to it.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    if not _has_table("pitchers"):
+        op.create_table(
+            "pitchers",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("mlbam_id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("first_name", sa.String(50)),
+            sa.Column("last_name", sa.String(50)),
+            sa.Column("team", sa.String(10)),
+            sa.Column("throws", sa.String(1)),
+            sa.Column("is_starter", sa.Boolean()),
+            sa.Column("is_active", sa.Boolean()),
+        )
+        op.create_index("ix_pitchers_id", "pitchers", ["id"])
+        op.create_index("ix_pitchers_mlbam_id", "pitchers", ["mlbam_id"], unique=True)
+        op.create_index("ix_pitchers_name", "pitchers", ["name"])
+
+    if not _has_table("games"):
+        op.create_table(
+            "games",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("game_pk", sa.Integer(), nullable=False),
+            sa.Column("game_date", sa.Date(), nullable=False),
+            sa.Column("game_year", sa.Integer(), nullable=False),
+            sa.Column("game_type", sa.String(10)),
+            sa.Column("home_team", sa.String(10)),
+            sa.Column("away_team", sa.String(10)),
+        )
+        op.create_index("ix_games_id", "games", ["id"])
+        op.create_index("ix_games_game_pk", "games", ["game_pk"], unique=True)
+        op.create_index("ix_games_game_date", "games", ["game_date"])
+        op.create_index("ix_games_game_year", "games", ["game_year"])
+        op.create_index("ix_games_home_team", "games", ["home_team"])
+        op.create_index("ix_games_away_team", "games", ["away_team"])
+
+    if not _has_table("pitches"):
+        op.create_table(
+            "pitches",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("pitcher_id", sa.Integer(), sa.ForeignKey("pitchers.id")),
+            sa.Column("game_pk", sa.Integer(), nullable=False),
+            sa.Column("game_date", sa.Date(), nullable=False),
+            sa.Column("game_year", sa.Integer(), nullable=False),
+            sa.Column("pitch_type", sa.String(10)),
+            sa.Column("pitch_name", sa.String(50)),
+            sa.Column("pitcher_mlbam_id", sa.Integer()),
+            sa.Column("batter_mlbam_id", sa.Integer()),
+            sa.Column("batter_stand", sa.String(1)),
+            sa.Column("p_throws", sa.String(1)),
+            sa.Column("balls", sa.Integer()),
+            sa.Column("strikes", sa.Integer()),
+            sa.Column("outs_when_up", sa.Integer()),
+            sa.Column("inning", sa.Integer()),
+            sa.Column("inning_topbot", sa.String(10)),
+            sa.Column("at_bat_number", sa.Integer()),
+            sa.Column("pitch_number", sa.Integer()),
+            *[sa.Column(name, sa.Float()) for name in [
+                "release_speed", "release_spin_rate", "spin_axis",
+                "release_pos_x", "release_pos_y", "release_pos_z", "release_extension",
+                "pfx_x", "pfx_z", "plate_x", "plate_z",
+            ]],
+            sa.Column("zone", sa.Integer()),
+            *[sa.Column(name, sa.Float()) for name in [
+                "sz_top", "sz_bot", "vx0", "vy0", "vz0", "ax", "ay", "az",
+            ]],
+            sa.Column("type", sa.String(1)),
+            sa.Column("description", sa.String(100)),
+            sa.Column("events", sa.String(50)),
+            sa.Column("launch_speed", sa.Float()),
+            sa.Column("launch_angle", sa.Float()),
+            sa.Column("hit_distance_sc", sa.Float()),
+            sa.Column("bb_type", sa.String(20)),
+            *[sa.Column(name, sa.Float()) for name in [
+                "hc_x", "hc_y",
+                "estimated_ba_using_speedangle", "estimated_woba_using_speedangle",
+                "woba_value", "babip_value", "iso_value", "delta_run_exp",
+            ]],
+        )
+        for name, columns in [
+            ("ix_pitches_id", ["id"]),
+            ("ix_pitches_pitcher_id", ["pitcher_id"]),
+            ("ix_pitches_game_pk", ["game_pk"]),
+            ("ix_pitches_game_date", ["game_date"]),
+            ("ix_pitches_game_year", ["game_year"]),
+            ("ix_pitches_pitch_type", ["pitch_type"]),
+            ("ix_pitches_pitcher_mlbam_id", ["pitcher_mlbam_id"]),
+            ("ix_pitches_batter_mlbam_id", ["batter_mlbam_id"]),
+            ("ix_pitches_pitcher_year", ["pitcher_mlbam_id", "game_year"]),
+            ("ix_pitches_game", ["game_pk", "pitch_number"]),
+            ("ix_pitches_type_year", ["pitch_type", "game_year"]),
+        ]:
+            op.create_index(name, "pitches", columns)
+
+    if not _has_table("season_stats"):
+        op.create_table(
+            "season_stats",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("pitcher_id", sa.Integer(), sa.ForeignKey("pitchers.id"), nullable=False),
+            sa.Column("year", sa.Integer(), nullable=False),
+            sa.Column("total_pitches", sa.Integer()),
+            sa.Column("games", sa.Integer()),
+            *[sa.Column(name, sa.Float()) for name in [
+                "innings_pitched",
+                "avg_velocity", "max_velocity", "avg_spin_rate", "whiff_pct", "strike_pct",
+                "zone_pct", "chase_pct", "h_movement", "v_movement", "first_strike_pct",
+                "era", "fip", "xfip", "siera", "whip", "k_per_9", "bb_per_9", "hr_per_9", "war",
+                "gb_pct", "fb_pct", "ld_pct", "hard_hit_pct", "barrel_pct",
+            ]],
+        )
+        op.create_index("ix_season_stats_id", "season_stats", ["id"])
+        op.create_index("ix_season_stats_year", "season_stats", ["year"])
+        op.create_index("ix_season_stats_pitcher_year", "season_stats", ["pitcher_id", "year"], unique=True)
+
+
+def downgrade():
+    for table in ["season_stats", "pitches", "games", "pitchers"]:
+        op.drop_table(table)
@@ -0,0 +1,45 @@
+"""Add pitcher_games (pre-aggregated game logs)
+
+The table starts empty; it is filled by 0005 once pitch flags exist, and
+kept up to date by the loaders after that.
+
+Revision ID: 0002_pitcher_games
+Revises: 0001_baseline
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_pitcher_games"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table("pitcher_games"):
+        return
+
+    op.create_table(
+        "pitcher_games",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("pitcher_id", sa.Integer(), sa.ForeignKey("pitchers.id"), nullable=False),
+        sa.Column("game_pk", sa.Integer(), nullable=False),
+        sa.Column("game_date", sa.Date(), nullable=False),
+        sa.Column("game_year", sa.Integer(), nullable=False),
+        *[sa.Column(name, sa.Integer()) for name in [
+            "outs", "batters_faced", "hits", "home_runs", "walks", "hit_by_pitch", "strikeouts",
+            "total_pitches", "strikes", "whiffs",
+        ]],
+        sa.Column("avg_velocity", sa.Float()),
+        sa.Column("pitch_mix", sa.JSON()),
+    )
+    op.create_index("ix_pitcher_games_id", "pitcher_games", ["id"])
+    op.create_index("ix_pitcher_games_pitcher_game", "pitcher_games", ["pitcher_id", "game_pk"], unique=True)
+    op.create_index("ix_pitcher_games_pitcher_date", "pitcher_games", ["pitcher_id", "game_date"])
+
+
+def downgrade():
+    op.drop_table("pitcher_games")
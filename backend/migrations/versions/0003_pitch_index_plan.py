@@ -0,0 +1,85 @@
+"""Replace per-column pitches indexes with query-shaped composites
+
+Older databases were created with an index on nearly every pitches column
+(plus ix_pitches_pitcher_year on pitcher_mlbam_id, which no route filters
+on). Index plan, derived from the queries in routes/pitchers.py,
+leaderboards.py, stats.py and the aggregation scripts:
+
+    ix_pitches_pitcher_year_type  (pitcher_id, game_year, pitch_type)
+        pitcher stats/arsenal, pitch pages, seasons list, compare,
+        max(game_year) per pitcher
+    ix_pitches_year_pitcher       (game_year, pitcher_id)
+        leaderboards, season aggregation, search volume, max(game_year),
+        distinct years
+    ix_pitches_game               (game_pk, pitch_number)
+        game log rebuilds after each load
+    ix_pitches_game_date          (game_date)
+        database stats date range
+
+On PostgreSQL the indexes are built and dropped CONCURRENTLY, outside the
+migration transaction, so the API keeps reading and writing pitches while
+this runs on a large table.
+
+Revision ID: 0003_pitch_index_plan
+Revises: 0002_pitcher_games
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_pitch_index_plan"
+down_revision = "0002_pitcher_games"
+branch_labels = None
+depends_on = None
+
+
+NEW_INDEXES = {
+    "ix_pitches_pitcher_year_type": ["pitcher_id", "game_year", "pitch_type"],
+    "ix_pitches_year_pitcher": ["game_year", "pitcher_id"],
+}
+
+DROPPED_INDEXES = {
+    "ix_pitches_id": ["id"],
+    "ix_pitches_pitcher_id": ["pitcher_id"],
+    "ix_pitches_game_pk": ["game_pk"],
+    "ix_pitches_game_year": ["game_year"],
+    "ix_pitches_pitch_type": ["pitch_type"],
+    "ix_pitches_pitcher_mlbam_id": ["pitcher_mlbam_id"],
+    "ix_pitches_batter_mlbam_id": ["batter_mlbam_id"],
+    "ix_pitches_pitcher_year": ["pitcher_mlbam_id", "game_year"],
+    "ix_pitches_type_year": ["pitch_type", "game_year"],
+}
+
+
+def _existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("pitches")}
+
+
+def _swap(create: dict, drop: dict):
+    existing = _existing_indexes()
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY can't run inside a transaction block
+        with op.get_context().autocommit_block():
+            for name, columns in create.items():
+                op.create_index(name, "pitches", columns, postgresql_concurrently=True, if_not_exists=True)
+            for name in drop:
+                op.drop_index(name, table_name="pitches", postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, columns in create.items():
+            if name not in existing:
+                op.create_index(name, "pitches", columns)
+        for name in drop:
+            if name in existing:
+                op.drop_index(name, table_name="pitches")
+
+    op.execute("ANALYZE pitches")
+
+
+def upgrade():
+    _swap(NEW_INDEXES, DROPPED_INDEXES)
+
+
+def downgrade():
+    _swap(DROPPED_INDEXES, NEW_INDEXES)
@@ -0,0 +1,141 @@
+"""Store categorical pitches columns as SmallInteger codes
+
+See app/models/codes.py. Values are mapped to their vocabulary codes; the
+upgrade refuses to run while a column holds a value missing from its
+vocabulary, since it would be lost. The vocabularies are copied here as they
+stood at this revision. Columns that are already integers are skipped.
+
+Revision ID: 0004_pitch_codes
+Revises: 0003_pitch_index_plan
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_pitch_codes"
+down_revision = "0003_pitch_index_plan"
+branch_labels = None
+depends_on = None
+
+
+# app/models/codes.py as of this revision (code = position + 1)
+PITCH_NAMES = (
+    "4-Seam Fastball", "Sinker", "Cutter", "Slider", "Sweeper", "Slurve",
+    "Curveball", "Knuckle Curve", "Slow Curve", "Changeup", "Split-Finger",
+    "Forkball", "Screwball", "Knuckleball", "Eephus", "Other", "Pitch Out",
+    "Intentional Ball", "2-Seam Fastball", "Fastball",
+)
+
+INNING_HALVES = ("Top", "Bot")
+
+DESCRIPTIONS = (
+    "ball", "blocked_ball", "called_strike", "foul", "foul_bunt", "foul_tip",
+    "foul_pitchout", "bunt_foul_tip", "hit_by_pitch", "hit_into_play",
+    "hit_into_play_no_out", "hit_into_play_score", "missed_bunt", "pitchout",
+    "swinging_pitchout", "swinging_strike", "swinging_strike_blocked",
+    "intent_ball", "automatic_ball", "automatic_strike",
+)
+
+EVENTS = (
+    "single", "double", "triple", "home_run", "field_out", "strikeout",
+    "strikeout_double_play", "walk", "intent_walk", "hit_by_pitch", "force_out",
+    "grounded_into_double_play", "double_play", "triple_play", "fielders_choice",
+    "fielders_choice_out", "field_error", "sac_fly", "sac_bunt",
+    "sac_fly_double_play", "sac_bunt_double_play", "catcher_interf",
+    "batter_interference", "fan_interference", "caught_stealing_2b",
+    "caught_stealing_3b", "caught_stealing_home", "pickoff_1b", "pickoff_2b",
+    "pickoff_3b", "pickoff_caught_stealing_2b", "pickoff_caught_stealing_3b",
+    "pickoff_caught_stealing_home", "stolen_base_2b", "stolen_base_3b",
+    "stolen_base_home", "wild_pitch", "passed_ball", "balk", "other_out",
+    "other_advance", "runner_double_play", "game_advisory", "truncated_pa",
+    "ejection",
+)
+
+BB_TYPES = ("ground_ball", "line_drive", "fly_ball", "popup")
+
+VOCABULARIES = {
+    "pitch_name": (PITCH_NAMES, 50),
+    "inning_topbot": (INNING_HALVES, 10),
+    "description": (DESCRIPTIONS, 100),
+    "events": (EVENTS, 50),
+    "bb_type": (BB_TYPES, 20),
+}
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _encode(column: str, values: tuple) -> str:
+    whens = " ".join(f"WHEN {_quote(value)} THEN {code}" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {whens} ELSE NULL END"
+
+
+def _decode(column: str, values: tuple) -> str:
+    whens = " ".join(f"WHEN {code} THEN {_quote(value)}" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {whens} ELSE NULL END"
+
+
+def _column_types() -> dict:
+    return {c["name"]: c["type"] for c in sa.inspect(op.get_bind()).get_columns("pitches")}
+
+
+def _check_vocabularies(columns: list[str]):
+    unknown = []
+    for name in columns:
+        known = ", ".join(_quote(value) for value in VOCABULARIES[name][0])
+        values = op.get_bind().execute(sa.text(
+            f"SELECT DISTINCT {name} FROM pitches WHERE {name} IS NOT NULL AND {name} NOT IN ({known})"
+        )).scalars().all()
+        if values:
+            unknown.append(f"{name}: {', '.join(sorted(map(str, values)))}")
+    if unknown:
+        raise RuntimeError(
+            f"pitches holds values missing from the code vocabularies ({'; '.join(unknown)}). "
+            "Fix or delete those rows before upgrading, then reload their games."
+        )
+
+
+def upgrade():
+    types = _column_types()
+    columns = [name for name in VOCABULARIES if not isinstance(types[name], sa.Integer)]
+    if not columns:
+        return
+    _check_vocabularies(columns)
+
+    if op.get_bind().dialect.name == "postgresql":
+        for name in columns:
+            op.alter_column(
+                "pitches", name, type_=sa.SmallInteger(),
+                postgresql_using=_encode(name, VOCABULARIES[name][0]),
+            )
+        op.execute("ANALYZE pitches")
+        return
+
+    # SQLite: store the codes in place, then rebuild the table with integer
+    # columns (the batch copy CASTs the code strings to integers)
+    for name in columns:
+        op.execute(f"UPDATE pitches SET {name} = {_encode(name, VOCABULARIES[name][0])}")
+    with op.batch_alter_table("pitches", recreate="always") as batch:
+        for name in columns:
+            batch.alter_column(name, type_=sa.SmallInteger(), existing_type=types[name])
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        for name, (values, length) in VOCABULARIES.items():
+            op.alter_column(
+                "pitches", name, type_=sa.String(length),
+                postgresql_using=_decode(name, values),
+            )
+        return
+
+    with op.batch_alter_table("pitches", recreate="always") as batch:
+        for name, (_, length) in VOCABULARIES.items():
+            batch.alter_column(name, type_=sa.String(length), existing_type=sa.SmallInteger())
+    for name, (values, _) in VOCABULARIES.items():
+        op.execute(f"UPDATE pitches SET {name} = {_decode(name, values)}")
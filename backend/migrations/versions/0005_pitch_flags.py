@@ -0,0 +1,177 @@
+"""Add pitches.flags outcome bits; rebuild game logs from them
+
+See app/models/flags.py. The column is backfilled with one UPDATE, then
+pitcher_games is rebuilt, since its whiff and batters-faced counts are read
+from the flags.
+
+Both backfills are frozen copies of the flag and game-log rules as of this
+revision, written against the coded columns from 0004 (code = vocabulary
+position + 1). Later changes to app code must not change what this revision
+does; a change in how a flag is derived ships as its own revision.
+
+Revision ID: 0005_pitch_flags
+Revises: 0004_pitch_codes
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005_pitch_flags"
+down_revision = "0004_pitch_codes"
+branch_labels = None
+depends_on = None
+
+
+# Description codes
+SWINGS = [16, 17, 4, 6, 5, 10]
+WHIFFS = [16, 17]
+CALLED_STRIKE = 3
+
+# Event codes
+NON_PA = [25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 41, 43]
+OUTS_BY_EVENT = {
+    5: 1, 6: 1, 11: 1, 16: 1, 18: 1, 19: 1, 40: 1,
+    25: 1, 26: 1, 27: 1, 28: 1, 29: 1, 30: 1, 31: 1, 32: 1, 33: 1,
+    7: 2, 12: 2, 13: 2, 20: 2, 21: 2,
+    14: 3,
+}
+HITS = [1, 2, 3, 4]
+HOME_RUN = 4
+WALKS = [8, 9]
+HIT_BY_PITCH = 10
+STRIKEOUTS = [6, 7]
+
+FASTBALL_TYPES = ["FF", "SI", "FC", "FT"]
+BREAKING_TYPES = ["SL", "CU", "KC", "SV"]
+
+pitches = sa.table(
+    "pitches",
+    sa.column("id", sa.Integer),
+    sa.column("pitcher_id", sa.Integer),
+    sa.column("game_pk", sa.Integer),
+    sa.column("game_date", sa.Date),
+    sa.column("game_year", sa.Integer),
+    sa.column("pitch_type", sa.String),
+    sa.column("release_speed", sa.Float),
+    sa.column("type", sa.String),
+    sa.column("balls", sa.Integer),
+    sa.column("strikes", sa.Integer),
+    sa.column("zone", sa.Integer),
+    sa.column("description", sa.SmallInteger),
+    sa.column("events", sa.SmallInteger),
+    sa.column("flags", sa.SmallInteger),
+)
+
+pitcher_games = sa.table(
+    "pitcher_games",
+    sa.column("pitcher_id", sa.Integer),
+    sa.column("game_pk", sa.Integer),
+    sa.column("game_date", sa.Date),
+    sa.column("game_year", sa.Integer),
+    *[sa.column(name, sa.Integer) for name in [
+        "outs", "batters_faced", "hits", "home_runs", "walks", "hit_by_pitch", "strikeouts",
+        "total_pitches", "strikes", "whiffs",
+    ]],
+    sa.column("avg_velocity", sa.Float),
+    sa.column("pitch_mix", sa.JSON),
+)
+
+COUNTERS = [
+    "strikes", "whiffs", "outs", "batters_faced", "hits",
+    "home_runs", "walks", "hit_by_pitch", "strikeouts",
+]
+
+
+def _count(condition):
+    return sa.func.sum(sa.case((condition, 1), else_=0))
+
+
+def _backfill_flags():
+    p = pitches.c
+    pa_end = p.events.isnot(None) & p.events.notin_(NON_PA)
+    bits = [
+        (1, p.description.in_(SWINGS)),
+        (2, p.description.in_(WHIFFS)),
+        (4, p.zone.between(1, 9)),
+        (8, p.description == CALLED_STRIKE),
+        (16, (p.balls == 0) & (p.strikes == 0)),
+        (32, pa_end),
+        (64, p.pitch_type.in_(FASTBALL_TYPES)),
+        (128, p.pitch_type.in_(BREAKING_TYPES)),
+        (256, p.zone.between(11, 14)),
+    ]
+    flags = sum((sa.case((condition, bit), else_=0) for bit, condition in bits), sa.literal(0))
+    op.execute(pitches.update().values(flags=flags))
+
+
+def _rebuild_pitcher_games():
+    p = pitches.c
+    outs = sa.case(*[(p.events == event, n) for event, n in OUTS_BY_EVENT.items()], else_=0)
+    query = sa.select(
+        p.pitcher_id,
+        p.game_pk,
+        sa.func.min(p.game_date).label("game_date"),
+        sa.func.min(p.game_year).label("game_year"),
+        p.pitch_type,
+        sa.func.count(p.id).label("pitches"),
+        sa.func.sum(p.release_speed).label("sum_velocity"),
+        sa.func.count(p.release_speed).label("n_velocity"),
+        _count(p.type == "S").label("strikes"),
+        _count(p.flags.op("&")(2) != 0).label("whiffs"),
+        sa.func.sum(outs).label("outs"),
+        _count(p.flags.op("&")(32) != 0).label("batters_faced"),
+        _count(p.events.in_(HITS)).label("hits"),
+        _count(p.events == HOME_RUN).label("home_runs"),
+        _count(p.events.in_(WALKS)).label("walks"),
+        _count(p.events == HIT_BY_PITCH).label("hit_by_pitch"),
+        _count(p.events.in_(STRIKEOUTS)).label("strikeouts"),
+    ).where(p.pitcher_id.isnot(None)).group_by(p.pitcher_id, p.game_pk, p.pitch_type)
+
+    lines: dict[tuple, dict] = {}
+    for row in op.get_bind().execute(query):
+        line = lines.get((row.pitcher_id, row.game_pk))
+        if line is None:
+            line = lines[(row.pitcher_id, row.game_pk)] = {
+                "pitcher_id": row.pitcher_id,
+                "game_pk": row.game_pk,
+                "game_date": row.game_date,
+                "game_year": row.game_year,
+                "total_pitches": 0,
+                "sum_velocity": 0.0,
+                "n_velocity": 0,
+                "pitch_mix": {},
+                **{name: 0 for name in COUNTERS},
+            }
+        line["total_pitches"] += row.pitches
+        line["sum_velocity"] += row.sum_velocity or 0
+        line["n_velocity"] += row.n_velocity
+        for name in COUNTERS:
+            line[name] += getattr(row, name) or 0
+        if row.pitch_type:
+            line["pitch_mix"][row.pitch_type] = row.pitches
+
+    for line in lines.values():
+        sum_velocity = line.pop("sum_velocity")
+        n_velocity = line.pop("n_velocity")
+        line["avg_velocity"] = round(sum_velocity / n_velocity, 1) if n_velocity else None
+
+    op.execute(pitcher_games.delete())
+    if lines:
+        op.bulk_insert(pitcher_games, list(lines.values()))
+
+
+def upgrade():
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("pitches")}
+    if "flags" not in columns:
+        with op.batch_alter_table("pitches") as batch:
+            batch.add_column(sa.Column("flags", sa.SmallInteger(), nullable=False, server_default="0"))
+
+    _backfill_flags()
+    _rebuild_pitcher_games()
+
+
+def downgrade():
+    with op.batch_alter_table("pitches") as batch:
+        batch.drop_column("flags")
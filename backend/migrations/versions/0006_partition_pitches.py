@@ -0,0 +1,154 @@
+"""Partition pitches by season (PostgreSQL only)
+
+See app/models/partitions.py. Converts the heap table in place; a no-op on
+SQLite and when pitches is already partitioned. Old seasons can then be
+frozen with scripts/partition_pitches.py --freeze-through YEAR.
+
+The heap is renamed aside, the partitioned table is created with a
+partition per season present (plus 2015 through next year, and DEFAULT),
+rows are copied season by season, the id sequence is carried forward and
+the heap is dropped. The table layout below is the pitches schema as of
+0005_pitch_flags, with the partition key added to the primary key.
+
+Revision ID: 0006_partition_pitches
+Revises: 0005_pitch_flags
+Create Date: 2026-10-19
+"""
+
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006_partition_pitches"
+down_revision = "0005_pitch_flags"
+branch_labels = None
+depends_on = None
+
+
+FIRST_PARTITION_YEAR = 2015
+
+COLUMNS = [
+    ("id", "SERIAL NOT NULL"),
+    ("pitcher_id", "INTEGER REFERENCES pitchers (id)"),
+    ("game_pk", "INTEGER NOT NULL"),
+    ("game_date", "DATE NOT NULL"),
+    ("game_year", "INTEGER NOT NULL"),
+    ("pitch_type", "VARCHAR(10)"),
+    ("pitch_name", "SMALLINT"),
+    ("pitcher_mlbam_id", "INTEGER"),
+    ("batter_mlbam_id", "INTEGER"),
+    ("batter_stand", "VARCHAR(1)"),
+    ("p_throws", "VARCHAR(1)"),
+    ("balls", "INTEGER"),
+    ("strikes", "INTEGER"),
+    ("outs_when_up", "INTEGER"),
+    ("inning", "INTEGER"),
+    ("inning_topbot", "SMALLINT"),
+    ("at_bat_number", "INTEGER"),
+    ("pitch_number", "INTEGER"),
+    ("release_speed", "FLOAT"),
+    ("release_spin_rate", "FLOAT"),
+    ("spin_axis", "FLOAT"),
+    ("release_pos_x", "FLOAT"),
+    ("release_pos_y", "FLOAT"),
+    ("release_pos_z", "FLOAT"),
+    ("release_extension", "FLOAT"),
+    ("pfx_x", "FLOAT"),
+    ("pfx_z", "FLOAT"),
+    ("plate_x", "FLOAT"),
+    ("plate_z", "FLOAT"),
+    ("zone", "INTEGER"),
+    ("sz_top", "FLOAT"),
+    ("sz_bot", "FLOAT"),
+    ("vx0", "FLOAT"),
+    ("vy0", "FLOAT"),
+    ("vz0", "FLOAT"),
+    ("ax", "FLOAT"),
+    ("ay", "FLOAT"),
+    ("az", "FLOAT"),
+    ("type", "VARCHAR(1)"),
+    ("description", "SMALLINT"),
+    ("events", "SMALLINT"),
+    ("flags", "SMALLINT DEFAULT '0' NOT NULL"),
+    ("launch_speed", "FLOAT"),
+    ("launch_angle", "FLOAT"),
+    ("hit_distance_sc", "FLOAT"),
+    ("bb_type", "SMALLINT"),
+    ("hc_x", "FLOAT"),
+    ("hc_y", "FLOAT"),
+    ("estimated_ba_using_speedangle", "FLOAT"),
+    ("estimated_woba_using_speedangle", "FLOAT"),
+    ("woba_value", "FLOAT"),
+    ("babip_value", "FLOAT"),
+    ("iso_value", "FLOAT"),
+    ("delta_run_exp", "FLOAT"),
+]
+
+# Created on the parent, so every partition (current and future) gets them
+INDEXES = {
+    "ix_pitches_pitcher_year_type": ["pitcher_id", "game_year", "pitch_type"],
+    "ix_pitches_year_pitcher": ["game_year", "pitcher_id"],
+    "ix_pitches_game": ["game_pk", "pitch_number"],
+    "ix_pitches_game_date": ["game_date"],
+}
+
+
+def _is_partitioned(bind) -> bool:
+    return bool(bind.execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'pitches' AND c.relnamespace = to_regnamespace(current_schema())"
+    )).scalar())
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql" or _is_partitioned(bind):
+        return
+
+    names = ", ".join(name for name, _ in COLUMNS)
+    years = {y for (y,) in bind.execute(sa.text("SELECT DISTINCT game_year FROM pitches"))}
+    years = sorted(years | set(range(FIRST_PARTITION_YEAR, date.today().year + 2)))
+
+    op.execute("ALTER TABLE pitches RENAME TO pitches_heap")
+    op.execute("ALTER TABLE pitches_heap RENAME CONSTRAINT pitches_pkey TO pitches_heap_pkey")
+    # Index names are schema-wide; free them for the partitioned table
+    for (name,) in bind.execute(sa.text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'pitches_heap' "
+        "AND indexname <> 'pitches_heap_pkey'"
+    )).fetchall():
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    definitions = ",\n    ".join(f"{name} {ddl}" for name, ddl in COLUMNS)
+    op.execute(
+        f"CREATE TABLE pitches (\n    {definitions},\n    PRIMARY KEY (id, game_year)\n) "
+        "PARTITION BY RANGE (game_year)"
+    )
+    for name, columns in INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON pitches ({', '.join(columns)})")
+    for year in years:
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS pitches_y{year} PARTITION OF pitches "
+            f"FOR VALUES FROM ({year}) TO ({year + 1})"
+        )
+    op.execute("CREATE TABLE IF NOT EXISTS pitches_default PARTITION OF pitches DEFAULT")
+
+    for year in years:
+        bind.execute(sa.text(
+            f"INSERT INTO pitches ({names}) SELECT {names} FROM pitches_heap WHERE game_year = :year"
+        ), {"year": year})
+
+    # The old sequence is owned by (and dropped with) the heap
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('pitches', 'id'), "
+        "COALESCE((SELECT max(id) FROM pitches), 0) + 1, false)"
+    )
+    op.execute("DROP TABLE pitches_heap")
+    op.execute("ANALYZE pitches")
+
+
+def downgrade():
+    # Partitioned and heap tables answer the same queries; converting back
+    # would mean copying every row again for no benefit
+    pass
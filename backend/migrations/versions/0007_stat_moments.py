@@ -0,0 +1,41 @@
+"""Add stat_moments (correlation sufficient statistics)
+
+The table starts empty and is filled the next time aggregate_season_stats.py
+or populate_season_stats.py runs; the moments are built from whichever
+SeasonStats columns the app has then, which this revision can't freeze.
+Until then moment_fits() returns None and correlations fall back to a scan.
+
+Revision ID: 0007_stat_moments
+Revises: 0006_partition_pitches
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_stat_moments"
+down_revision = "0006_partition_pitches"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stat_moments",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("is_starter", sa.Boolean()),
+        sa.Column("innings_bucket", sa.Integer()),
+        sa.Column("stat_x", sa.String(30), nullable=False),
+        sa.Column("stat_y", sa.String(30), nullable=False),
+        sa.Column("n", sa.Integer(), nullable=False),
+        *[sa.Column(name, sa.Float(), nullable=False) for name in [
+            "sum_x", "sum_y", "sum_xx", "sum_yy", "sum_xy",
+        ]],
+    )
+    op.create_index("ix_stat_moments_pair_year", "stat_moments", ["stat_x", "stat_y", "year"])
+
+
+def downgrade():
+    op.drop_table("stat_moments")
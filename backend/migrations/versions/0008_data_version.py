@@ -0,0 +1,31 @@
+"""Add data_version (the version behind the API's ETags)
+
+Replaces the backend/data_version file, which only the host running the
+loaders could see.
+
+Revision ID: 0008_data_version
+Revises: 0007_stat_moments
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_data_version"
+down_revision = "0007_stat_moments"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    table = op.create_table(
+        "data_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+    op.bulk_insert(table, [{"id": 1, "version": 0}])
+
+
+def downgrade():
+    op.drop_table("data_version")
@@ -10,14 +10,19 @@ Run this script after loading pitch data to populate the season_stats table.
 import sys
 sys.path.insert(0, "c:/Claude/Stats/backend")
 
+from typing import Optional
+
 import pandas as pd
-import numpy as np
 from sqlalchemy import func, case, distinct
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal, Base, engine
+from app.core.database import BulkSessionLocal
 from app.models import Pitcher, Pitch
+from app.models.flags import PitchFlag, count_flag, has_flag
 from app.models.season_stats import SeasonStats
+from app.core.http_cache import bump_data_version
+from app.services.analytics import Analytics, analytics_for
+from app.services.stat_moments import refresh_stat_moments
 
 
 def safe_float(val):
@@ -30,32 +35,27 @@ def safe_float(val):
         return None
 
 
-def aggregate_statcast_stats(session: Session, year: int) -> dict:
+def aggregate_statcast_stats(session: Session, year: int, analytics: Optional[Analytics] = None) -> dict:
     """
     Aggregate Statcast-derived stats from the pitches table.
 
+    The query runs on the configured analytics backend (DuckDB snapshot or
+    the session's database) unless an Analytics object is given.
+
     Returns a dictionary mapping pitcher_id to their stats.
     """
+    analytics = analytics or analytics_for(session)
     print(f"  Aggregating Statcast stats for {year}...")
 
-    # Define swing descriptions for whiff calculation
-    swing_descriptions = [
-        "swinging_strike", "swinging_strike_blocked",
-        "foul", "foul_tip", "foul_bunt", "hit_into_play"
-    ]
-    whiff_descriptions = ["swinging_strike", "swinging_strike_blocked"]
-
     # Query aggregated stats per pitcher
-    results = (
+    results = analytics.all(
         session.query(
             Pitch.pitcher_id,
             func.count(Pitch.id).label("total_pitches"),
             func.count(distinct(Pitch.game_pk)).label("games"),
 
             # Velocity (fastballs only: FF, SI, FC, FT)
-            func.avg(
-                case((Pitch.pitch_type.in_(["FF", "SI", "FC", "FT"]), Pitch.release_speed))
-            ).label("avg_velocity"),
+            func.avg(case((has_flag(PitchFlag.FASTBALL), Pitch.release_speed))).label("avg_velocity"),
             func.max(Pitch.release_speed).label("max_velocity"),
 
             # Spin rate (all pitches)
@@ -63,8 +63,8 @@ def aggregate_statcast_stats(session: Session, year: int) -> dict:
 
             # Whiff % = swinging strikes / swings
             (
-                func.sum(case((Pitch.description.in_(whiff_descriptions), 1), else_=0)) * 100.0 /
-                func.nullif(func.sum(case((Pitch.description.in_(swing_descriptions), 1), else_=0)), 0)
+                count_flag(PitchFlag.WHIFF) * 100.0 /
+                func.nullif(count_flag(PitchFlag.SWING), 0)
             ).label("whiff_pct"),
 
             # Strike % = strikes / total
@@ -75,45 +75,31 @@ def aggregate_statcast_stats(session: Session, year: int) -> dict:
 
             # Zone % = pitches in zone / total (zone 1-9 are in strike zone)
             (
-                func.sum(case((Pitch.zone.between(1, 9), 1), else_=0)) * 100.0 /
+                count_flag(PitchFlag.IN_ZONE) * 100.0 /
                 func.nullif(func.count(Pitch.id), 0)
             ).label("zone_pct"),
 
             # Chase % = swings outside zone / pitches outside zone
             (
-                func.sum(case(
-                    (Pitch.zone.in_([11, 12, 13, 14]) & Pitch.description.in_(swing_descriptions), 1),
-                    else_=0
-                )) * 100.0 /
-                func.nullif(func.sum(case((Pitch.zone.in_([11, 12, 13, 14]), 1), else_=0)), 0)
+                count_flag(PitchFlag.OUT_OF_ZONE | PitchFlag.SWING) * 100.0 /
+                func.nullif(count_flag(PitchFlag.OUT_OF_ZONE), 0)
             ).label("chase_pct"),
 
             # Horizontal movement (breaking balls: SL, CU, KC, SV)
-            func.avg(
-                case((Pitch.pitch_type.in_(["SL", "CU", "KC", "SV"]), func.abs(Pitch.pfx_x)))
-            ).label("h_movement"),
+            func.avg(case((has_flag(PitchFlag.BREAKING), func.abs(Pitch.pfx_x)))).label("h_movement"),
 
             # Vertical movement (fastballs: FF, SI, FC, FT)
-            func.avg(
-                case((Pitch.pitch_type.in_(["FF", "SI", "FC", "FT"]), Pitch.pfx_z))
-            ).label("v_movement"),
+            func.avg(case((has_flag(PitchFlag.FASTBALL), Pitch.pfx_z))).label("v_movement"),
 
             # First pitch strike % (strikes on 0-0 count)
             (
-                func.sum(case(
-                    ((Pitch.balls == 0) & (Pitch.strikes == 0) & (Pitch.type == "S"), 1),
-                    else_=0
-                )) * 100.0 /
-                func.nullif(func.sum(case(
-                    ((Pitch.balls == 0) & (Pitch.strikes == 0), 1),
-                    else_=0
-                )), 0)
+                func.sum(case((has_flag(PitchFlag.FIRST_PITCH) & (Pitch.type == "S"), 1), else_=0)) * 100.0 /
+                func.nullif(count_flag(PitchFlag.FIRST_PITCH), 0)
             ).label("first_strike_pct"),
         )
         .filter(Pitch.game_year == year)
         .filter(Pitch.pitcher_id.isnot(None))
         .group_by(Pitch.pitcher_id)
-        .all()
     )
 
     # Convert to dictionary
@@ -212,6 +198,12 @@ def aggregate_year(session: Session, year: int):
     # Get pitcher MLBAM IDs for matching
     pitchers = {p.id: p.mlbam_id for p in session.query(Pitcher).all()}
 
+    # Existing records for the year, loaded once rather than per pitcher
+    existing_stats = {
+        row.pitcher_id: row
+        for row in session.query(SeasonStats).filter(SeasonStats.year == year).all()
+    }
+
     # Combine and store
     added = 0
     updated = 0
@@ -220,12 +212,7 @@ def aggregate_year(session: Session, year: int):
         mlbam_id = pitchers.get(pitcher_id)
         fg_stats = fangraphs_stats.get(mlbam_id, {}) if mlbam_id else {}
 
-        # Check if record exists
-        existing = (
-            session.query(SeasonStats)
-            .filter_by(pitcher_id=pitcher_id, year=year)
-            .first()
-        )
+        existing = existing_stats.get(pitcher_id)
 
         if existing:
             # Update existing record
@@ -253,9 +240,6 @@ def aggregate_all_years(session: Session, start_year: int = 2015, end_year: int
     """Aggregate stats for all years in range."""
     print(f"Aggregating season stats from {start_year} to {end_year}...")
 
-    # Ensure table exists
-    Base.metadata.create_all(engine)
-
     for year in range(start_year, end_year + 1):
         aggregate_year(session, year)
 
@@ -274,12 +258,9 @@ def main():
 
     args = parser.parse_args()
 
-    session = SessionLocal()
+    session = BulkSessionLocal()
 
     try:
-        # Ensure table exists
-        Base.metadata.create_all(engine)
-
         if args.year:
             aggregate_year(session, args.year)
         elif args.all:
@@ -289,6 +270,10 @@ def main():
             print("  python aggregate_season_stats.py --year 2024       # Single year")
             print("  python aggregate_season_stats.py --all             # All years 2015-2024")
             print("  python aggregate_season_stats.py --all --start 2020 --end 2024  # Custom range")
+            return
+
+        print(f"Rebuilt {refresh_stat_moments(session)} correlation moment rows")
+        bump_data_version()
     finally:
         session.close()
 
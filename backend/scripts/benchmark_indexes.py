@@ -0,0 +1,187 @@
+"""Benchmark ingest and query timings for the legacy vs current pitches indexes.
+
+Builds two throwaway SQLite databases with the same synthetic pitches, one
+with the original per-column index set and one with the composite plan
+from the Pitch model, then times bulk inserts and the hot read queries.
+
+Usage:
+    python scripts/benchmark_indexes.py                 # 200k pitches
+    python scripts/benchmark_indexes.py --pitches 1000000
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from app.core.database import Base
+from app.models import Pitch
+
+
+# The original per-column index set, replaced by migration 0003
+LEGACY_INDEXES = {
+    "ix_pitches_id": ["id"],
+    "ix_pitches_pitcher_id": ["pitcher_id"],
+    "ix_pitches_game_pk": ["game_pk"],
+    "ix_pitches_game_year": ["game_year"],
+    "ix_pitches_pitch_type": ["pitch_type"],
+    "ix_pitches_pitcher_mlbam_id": ["pitcher_mlbam_id"],
+    "ix_pitches_batter_mlbam_id": ["batter_mlbam_id"],
+    "ix_pitches_pitcher_year": ["pitcher_mlbam_id", "game_year"],
+    "ix_pitches_type_year": ["pitch_type", "game_year"],
+    "ix_pitches_game": ["game_pk", "pitch_number"],
+    "ix_pitches_game_date": ["game_date"],
+}
+
+PITCH_TYPES = ["FF", "SI", "FC", "SL", "CU", "CH", "ST", "FS"]
+DESCRIPTIONS = [
+    "ball", "called_strike", "swinging_strike", "foul",
+    "hit_into_play", "swinging_strike_blocked", "foul_tip",
+]
+
+# Representative read queries, mirroring the routes and aggregation scripts
+QUERIES = {
+    "pitcher_arsenal": """
+        SELECT pitch_type, count(id), avg(release_speed), avg(release_spin_rate)
+        FROM pitches WHERE pitcher_id = :pitcher_id AND game_year = :year
+        AND pitch_type IS NOT NULL GROUP BY pitch_type
+    """,
+    "pitcher_pitch_page": """
+        SELECT * FROM pitches WHERE pitcher_id = :pitcher_id AND game_year = :year
+        ORDER BY game_date DESC, game_pk, pitch_number LIMIT 100
+    """,
+    "pitcher_latest_year": """
+        SELECT max(game_year) FROM pitches WHERE pitcher_id = :pitcher_id
+    """,
+    "pitcher_seasons": """
+        SELECT DISTINCT game_year FROM pitches WHERE pitcher_id = :pitcher_id
+        ORDER BY game_year DESC
+    """,
+    "leaderboard_velocity": """
+        SELECT pitcher_id, count(id), avg(release_speed) FROM pitches
+        WHERE game_year = :year AND pitch_type IN ('FF', 'FT', 'SI', 'FC')
+        GROUP BY pitcher_id HAVING count(id) >= 100
+        ORDER BY avg(release_speed) DESC LIMIT 25
+    """,
+    "season_aggregation": """
+        SELECT pitcher_id, count(id), count(DISTINCT game_pk), avg(release_speed)
+        FROM pitches WHERE game_year = :year AND pitcher_id IS NOT NULL
+        GROUP BY pitcher_id
+    """,
+    "latest_year": "SELECT max(game_year) FROM pitches",
+    "game_log_refresh": """
+        SELECT pitcher_id, game_pk, pitch_type, count(id) FROM pitches
+        WHERE game_pk IN (:g1, :g2, :g3) GROUP BY pitcher_id, game_pk, pitch_type
+    """,
+}
+
+
+def generate_rows(n_pitches: int, seed: int = 42) -> list[dict]:
+    """Generate simple synthetic pitch rows spread over several seasons."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_pitches):
+        year = 2021 + i % 4
+        game_pk = 100000 + i // 300
+        rows.append({
+            "pitcher_id": rng.randint(1, 800),
+            "game_pk": game_pk,
+            "game_date": date(year, 4, 1) + timedelta(days=(game_pk % 180)),
+            "game_year": year,
+            "pitch_type": rng.choice(PITCH_TYPES),
+            "pitcher_mlbam_id": rng.randint(400000, 700000),
+            "batter_mlbam_id": rng.randint(400000, 700000),
+            "release_speed": rng.gauss(90, 5),
+            "release_spin_rate": rng.gauss(2300, 250),
+            "pitch_number": i % 6 + 1,
+            "description": rng.choice(DESCRIPTIONS),
+            "zone": rng.randint(1, 14),
+        })
+    return rows
+
+
+def build_database(path: Path, profile: str, rows: list[dict]) -> tuple:
+    """Create a database with the given index profile; return (engine, insert_seconds)."""
+    engine = create_engine(f"sqlite:///{path.as_posix()}")
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        # Start from a bare table, then add the profile's indexes
+        for index in Pitch.__table__.indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+        if profile == "legacy":
+            for name, columns in LEGACY_INDEXES.items():
+                conn.execute(text(f"CREATE INDEX {name} ON pitches ({', '.join(columns)})"))
+        else:
+            for index in Pitch.__table__.indexes:
+                index.create(conn)
+
+    insert = Pitch.__table__.insert()
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, len(rows), 5000):
+            conn.execute(insert, rows[offset:offset + 5000])
+    insert_seconds = time.perf_counter() - start
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    return engine, insert_seconds
+
+
+def time_queries(engine, repeats: int = 20) -> dict:
+    """Median milliseconds per query."""
+    params = {"pitcher_id": 17, "year": 2023, "g1": 100010, "g2": 100020, "g3": 100030}
+    timings = {}
+    with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                samples.append((time.perf_counter() - start) * 1000)
+            timings[name] = statistics.median(samples)
+    return timings
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark pitches index plans")
+    parser.add_argument("--pitches", type=int, default=200_000, help="Synthetic pitches to load")
+    parser.add_argument("--repeats", type=int, default=20, help="Runs per query")
+    args = parser.parse_args()
+
+    print(f"Generating {args.pitches:,} synthetic pitches...")
+    rows = generate_rows(args.pitches)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in ["legacy", "current"]:
+            print(f"Loading {profile} index profile...")
+            engine, insert_seconds = build_database(Path(tmp) / f"{profile}.db", profile, rows)
+            results[profile] = {"insert": insert_seconds, "queries": time_queries(engine, args.repeats)}
+            engine.dispose()
+
+    legacy, current = results["legacy"], results["current"]
+    print("\n" + "=" * 64)
+    print(f"  {'':<24}{'legacy':>12}{'current':>12}{'speedup':>12}")
+    print("=" * 64)
+    print(f"  {'ingest (s)':<24}{legacy['insert']:>12.2f}{current['insert']:>12.2f}"
+          f"{legacy['insert'] / current['insert']:>11.1f}x")
+    for name in QUERIES:
+        before, after = legacy["queries"][name], current["queries"][name]
+        print(f"  {name + ' (ms)':<24}{before:>12.2f}{after:>12.2f}{before / after:>11.1f}x")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark response serialization per 1,000 rows, model path vs. fast path.
+
+"model" is what the pitch list and scatter plot routes used to do: build a
+Pydantic model per row, let FastAPI validate the result against
+response_model, and serialize it (Pydantic's dump_json on current FastAPI;
+jsonable_encoder + json.dumps on older releases, shown as "legacy").
+"fast" is what they do now: select the columns, turn the rows into dicts and
+render them with FastJSONResponse (orjson).
+
+Pitch timings include fetching the page from an in-memory SQLite database,
+since the fast path also changes the query (column tuples instead of ORM
+objects).
+
+Usage:
+    python scripts/benchmark_serialization.py
+    python scripts/benchmark_serialization.py --rows 500 --repeat 50
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import json
+import random
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.api.routes.pitchers import PITCH_COLUMNS
+from app.core.database import Base
+from app.core.responses import FastJSONResponse
+from app.models import Pitch, Pitcher
+from app.schemas.discover import CorrelationResponse, RegressionLine, ScatterPoint
+from app.schemas.pitcher import PaginatedResponse, PitchBase
+from scripts.benchmark_indexes import generate_rows
+
+
+def timed(func, repeat: int) -> float:
+    """Median seconds per call."""
+    func()  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def pitch_benchmarks(session: Session, n_rows: int) -> dict:
+    adapter = TypeAdapter(PaginatedResponse)
+
+    def page(query):
+        return query.filter(Pitch.pitcher_id == 1).order_by(Pitch.id).limit(n_rows).all()
+
+    def model_payload():
+        items = [PitchBase.model_validate(p) for p in page(session.query(Pitch))]
+        session.expunge_all()
+        return PaginatedResponse(items=items, total=n_rows, page=1, page_size=n_rows, total_pages=1)
+
+    def model():
+        adapter.dump_json(adapter.validate_python(model_payload()))
+
+    def legacy():
+        payload = adapter.validate_python(model_payload())
+        json.dumps(jsonable_encoder(payload)).encode()
+
+    def fast():
+        rows = page(session.query(*PITCH_COLUMNS))
+        FastJSONResponse({
+            "items": [row._asdict() for row in rows],
+            "total": n_rows, "page": 1, "page_size": n_rows, "total_pages": 1,
+        })
+
+    return {"model": model, "legacy": legacy, "fast": fast}
+
+
+def scatter_benchmarks(n_rows: int) -> dict:
+    rng = random.Random(3)
+    points = [
+        {"pitcher_id": i, "name": f"Pitcher {i}", "team": "NYY",
+         "x": round(rng.gauss(94, 2), 3), "y": round(rng.gauss(4, 1), 3)}
+        for i in range(n_rows)
+    ]
+    fields = {
+        "stat_x": "avg_velocity", "stat_x_name": "Avg Fastball Velocity",
+        "stat_y": "era", "stat_y_name": "ERA", "year": None, "is_starter": None,
+        "min_innings": 50.0, "correlation_r": -0.31, "r_squared": 0.0961,
+        "p_value": 0.00012, "sample_size": n_rows,
+    }
+    regression = {"slope": -0.2, "intercept": 22.8, "equation": "y = -0.200x + 22.80"}
+    adapter = TypeAdapter(CorrelationResponse)
+
+    def model_payload():
+        return CorrelationResponse(
+            **fields,
+            regression=RegressionLine(**regression),
+            scatter_data=[ScatterPoint(**point) for point in points],
+        )
+
+    def model():
+        adapter.dump_json(adapter.validate_python(model_payload()))
+
+    def legacy():
+        json.dumps(jsonable_encoder(adapter.validate_python(model_payload()))).encode()
+
+    def fast():
+        FastJSONResponse({**fields, "regression": regression, "scatter_data": points})
+
+    return {"model": model, "legacy": legacy, "fast": fast}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark response serialization")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per case")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rows = generate_rows(args.rows)
+    for row in rows:
+        row["pitcher_id"] = 1
+    with engine.begin() as conn:
+        conn.execute(Pitcher.__table__.insert(), [{"id": 1, "mlbam_id": 1, "name": "Pitcher 1"}])
+        conn.execute(Pitch.__table__.insert(), rows)
+
+    per_1k = 1000 / args.rows
+    with Session(engine) as session:
+        cases = {
+            "pitches (query + serialize)": pitch_benchmarks(session, args.rows),
+            "scatter points": scatter_benchmarks(args.rows),
+        }
+
+        print(f"Median ms per 1,000 rows ({args.rows} rows x {args.repeat} runs)")
+        print("\n" + "=" * 74)
+        print(f"  {'':<30}{'legacy':>10}{'model':>10}{'fast':>10}{'vs model':>12}")
+        print("=" * 74)
+        for label, funcs in cases.items():
+            ms = {name: timed(func, args.repeat) * 1000 * per_1k for name, func in funcs.items()}
+            print(
+                f"  {label:<30}{ms['legacy']:>10.2f}{ms['model']:>10.2f}{ms['fast']:>10.2f}"
+                f"{ms['model'] / ms['fast']:>11.1f}x"
+            )
+        print("=" * 74)
+
+
+if __name__ == "__main__":
+    main()
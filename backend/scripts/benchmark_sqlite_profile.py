@@ -0,0 +1,140 @@
+"""Benchmark API read latency while a loader is writing, per SQLite profile.
+
+Compares a plain SQLite engine (rollback journal, synchronous=FULL, default
+cache) with the tuned profile from app.core.database. A background thread
+inserts pitches in 5,000-row transactions, the way load_statcast does, while
+the main thread runs a pitcher stats query and records its latency.
+
+Usage:
+    python scripts/benchmark_sqlite_profile.py
+    python scripts/benchmark_sqlite_profile.py --seed-pitches 500000 --seconds 20
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import Base, create_db_engine
+from app.models import Pitch
+from scripts.benchmark_indexes import generate_rows
+
+
+READ_QUERY = text("""
+    SELECT pitch_type, count(id), avg(release_speed), avg(release_spin_rate)
+    FROM pitches WHERE pitcher_id = :pitcher_id AND game_year = 2023
+    GROUP BY pitch_type
+""")
+
+
+def make_engines(path: Path, profile: str) -> tuple:
+    """Create (writer, reader) engines for a profile."""
+    url = f"sqlite:///{path.as_posix()}"
+    if profile == "plain":
+        # What core/database.py used to create: only check_same_thread
+        args = {"check_same_thread": False}
+        return create_engine(url, connect_args=args), create_engine(url, connect_args=args)
+    return create_db_engine(url, profile="bulk"), create_db_engine(url)
+
+
+def run_profile(path: Path, profile: str, seed_rows: list, load_rows: list, seconds: float) -> dict:
+    writer, reader = make_engines(path, profile)
+    Base.metadata.create_all(writer)
+
+    insert = Pitch.__table__.insert()
+    with writer.begin() as conn:
+        for offset in range(0, len(seed_rows), 5000):
+            conn.execute(insert, seed_rows[offset:offset + 5000])
+
+    stop = threading.Event()
+    written = [0]
+
+    def load():
+        offset = 0
+        while not stop.is_set():
+            batch = load_rows[offset:offset + 5000] or load_rows[:5000]
+            offset = offset + 5000 if offset + 5000 < len(load_rows) else 0
+            with writer.begin() as conn:
+                conn.execute(insert, batch)
+            written[0] += len(batch)
+
+    latencies = []
+    errors = 0
+    loader = threading.Thread(target=load)
+    loader.start()
+    deadline = time.perf_counter() + seconds
+    pitcher_id = 1
+    try:
+        with reader.connect() as conn:
+            while time.perf_counter() < deadline:
+                pitcher_id = pitcher_id % 800 + 1
+                start = time.perf_counter()
+                try:
+                    conn.execute(READ_QUERY, {"pitcher_id": pitcher_id}).fetchall()
+                    latencies.append((time.perf_counter() - start) * 1000)
+                except OperationalError:
+                    errors += 1
+                conn.rollback()
+    finally:
+        stop.set()
+        loader.join()
+        writer.dispose()
+        reader.dispose()
+
+    latencies.sort()
+    return {
+        "reads": len(latencies),
+        "errors": errors,
+        "p50": statistics.median(latencies) if latencies else float("nan"),
+        "p95": latencies[int(len(latencies) * 0.95)] if latencies else float("nan"),
+        "max": latencies[-1] if latencies else float("nan"),
+        "rows_written": written[0],
+    }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark SQLite profiles under concurrent load")
+    parser.add_argument("--seed-pitches", type=int, default=200_000, help="Pitches loaded before timing")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration of the concurrent phase")
+    args = parser.parse_args()
+
+    print(f"Generating {args.seed_pitches:,} seed pitches...")
+    seed_rows = generate_rows(args.seed_pitches)
+    load_rows = generate_rows(100_000, seed=7)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in ["plain", "tuned"]:
+            print(f"Running {profile} profile for {args.seconds:.0f}s...")
+            results[profile] = run_profile(
+                Path(tmp) / f"{profile}.db", profile, seed_rows, load_rows, args.seconds
+            )
+
+    print("\n" + "=" * 56)
+    print(f"  {'':<20}{'plain':>16}{'tuned':>16}")
+    print("=" * 56)
+    for key, label in [
+        ("reads", "reads completed"),
+        ("errors", "reads failed"),
+        ("p50", "read p50 (ms)"),
+        ("p95", "read p95 (ms)"),
+        ("max", "read max (ms)"),
+        ("rows_written", "rows loaded"),
+    ]:
+        plain, tuned = results["plain"][key], results["tuned"][key]
+        fmt = "{:>16,.2f}" if isinstance(plain, float) else "{:>16,}"
+        print(f"  {label:<20}" + fmt.format(plain) + fmt.format(tuned))
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    main()
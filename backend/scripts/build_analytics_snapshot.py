@@ -0,0 +1,32 @@
+"""Build the DuckDB analytics snapshot (see app/services/analytics.py).
+
+Loaders rebuild the snapshot automatically when ANALYTICS_BACKEND=duckdb;
+run this once after switching the backend on, or to refresh it by hand.
+
+Usage:
+    python scripts/build_analytics_snapshot.py
+    python scripts/build_analytics_snapshot.py --path /data/analytics.duckdb
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import time
+
+from app.core.database import read_engine
+from app.core.http_cache import bump_data_version
+from app.services.analytics import build_snapshot, snapshot_path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the DuckDB analytics snapshot")
+    parser.add_argument("--path", type=str, help=f"Snapshot file (default: {snapshot_path()})")
+    args = parser.parse_args()
+
+    print("Copying pitches and pitchers into DuckDB...")
+    start = time.perf_counter()
+    count = build_snapshot(read_engine, args.path)
+    bump_data_version()
+    print(f"\nDone! Copied {count} pitches in {time.perf_counter() - start:.1f}s.")
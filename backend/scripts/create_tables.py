@@ -1,15 +1,15 @@
-"""Create database tables."""
+"""Create or upgrade database tables (runs the Alembic migrations)."""
 
 import sys
 sys.path.insert(0, "c:/Claude/Stats/backend")
 
-from app.core.database import engine, Base
+from app.core.database import Base, run_migrations
 from app.models import Pitcher, Game, Pitch
 
 def create_tables():
-    """Create all database tables."""
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    """Create all database tables, or upgrade an existing database."""
+    print("Upgrading database schema...")
+    run_migrations()
     print("Done! Tables created:")
     for table in Base.metadata.tables:
         print(f"  - {table}")
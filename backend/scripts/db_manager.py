@@ -5,7 +5,7 @@ sys.path.insert(0, "c:/Claude/Stats/backend")
 
 import argparse
 from datetime import date
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, BulkSessionLocal
 from app.models import Pitcher, Pitch, Game
 
 
@@ -46,15 +46,21 @@ def show_status():
 
 
 def load_data(start_date: str, end_date: str):
-    """Load data for a date range."""
-    from scripts.load_statcast import load_statcast_range
+    """Load data for a date range.
+
+    Ranges of two weeks or more (months, full seasons) use bulk load mode:
+    pitches indexes are dropped during the load and rebuilt afterwards.
+    """
+    from scripts.load_statcast import load_range, is_bulk_load
 
     print(f"\nLoading data from {start_date} to {end_date}...")
     print("This may take a while. Progress will be shown below.\n")
+    if is_bulk_load(start_date, end_date):
+        print("Large load: using bulk load mode (indexes rebuilt at the end).\n")
 
-    db = SessionLocal()
+    db = BulkSessionLocal()
     try:
-        pitches = load_statcast_range(start_date, end_date, db)
+        pitches = load_range(start_date, end_date, db)
         print(f"\nDone! Loaded {pitches:,} pitches.")
     finally:
         db.close()
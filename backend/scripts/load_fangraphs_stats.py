@@ -4,11 +4,17 @@ This script pulls ERA, FIP, xFIP, SIERA, WHIP, K/9, BB/9, HR/9, WAR,
 GB%, FB%, LD%, Hard%, Barrel%, and Chase% from FanGraphs.
 """
 
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
 import sqlite3
 from pathlib import Path
-from pybaseball import pitching_stats
 import pandas as pd
 
+from app.core.database import BulkSessionLocal
+from app.core.http_cache import bump_data_version
+from app.services.stat_moments import refresh_stat_moments
+
 # Database path
 DB_PATH = Path(__file__).parent.parent / "baseball.db"
 
@@ -44,6 +50,8 @@ def load_fangraphs_data(start_year: int, end_year: int):
     """Load FanGraphs pitching stats for given year range."""
     print(f"Fetching FanGraphs data for {start_year}-{end_year}...")
 
+    from pybaseball import pitching_stats
+
     # Get pitching stats - qual=0 gets all pitchers
     df = pitching_stats(start_year, end_year, qual=0)
 
@@ -165,6 +173,15 @@ def main():
         print(f"  {col}: {count} rows with data")
 
     conn.close()
+
+    # Correlations are summed from stat_moments, so rebuild it from the new values
+    session = BulkSessionLocal()
+    try:
+        print(f"Rebuilt {refresh_stat_moments(session)} correlation moment rows")
+    finally:
+        session.close()
+    bump_data_version()
+
     print("\nDone!")
 
 
@@ -3,14 +3,28 @@
 import sys
 sys.path.insert(0, "c:/Claude/Stats/backend")
 
+from contextlib import contextmanager
 from datetime import date, timedelta
+from typing import Optional
 import pandas as pd
-import numpy as np
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from pybaseball import statcast
 
-from app.core.database import engine, SessionLocal
+from app.core.database import BulkSessionLocal
 from app.models import Pitcher, Game, Pitch
+from app.models.codes import UnknownCodeError
+from app.models.flags import compute_flags
+from app.models.partitions import ensure_year_partitions
+from app.core.http_cache import bump_data_version
+from app.services.analytics import refresh_snapshot
+from app.services.game_log import refresh_pitcher_games
+
+
+# Loads spanning at least this many days drop the pitches indexes first
+BULK_LOAD_MIN_DAYS = 14
+
+# Statcast columns stored as dictionary codes (see app/models/codes.py)
+CODED_COLUMNS = ["description", "events", "pitch_name", "bb_type", "inning_topbot"]
 
 
 def safe_float(val):
@@ -40,7 +54,75 @@ def safe_str(val):
     return str(val) if val else None
 
 
-def load_statcast_range(start_date: str, end_date: str, session: Session):
+@contextmanager
+def bulk_load_indexes(session: Session, enabled: bool = True):
+    """
+    Drop the non-unique pitches indexes for the duration of a bulk load.
+
+    Inserting into an unindexed table runs at raw insert speed; the indexes
+    are rebuilt once at the end (even if the load fails) followed by ANALYZE.
+    Game logs are rebuilt after the indexes are back, so the context yields a
+    set that collects the game_pks touched by the load. When disabled, yields
+    None and nothing changes.
+    """
+    if not enabled:
+        yield None
+        return
+
+    indexes = [index for index in Pitch.__table__.indexes if not index.unique]
+    bind = session.get_bind()
+
+    print(f"Bulk load: dropping {len(indexes)} pitches indexes...")
+    with bind.begin() as conn:
+        for index in indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+    deferred_games: set = set()
+    try:
+        yield deferred_games
+    finally:
+        session.rollback()  # Release the connection; loads commit their own batches
+        print("Bulk load: rebuilding pitches indexes...")
+        with bind.begin() as conn:
+            for index in indexes:
+                index.create(conn, checkfirst=True)
+            conn.execute(text("ANALYZE"))
+
+    lines = refresh_pitcher_games(session, deferred_games)
+    print(f"Updated {lines} pitcher game logs")
+
+
+def check_codes(df: pd.DataFrame):
+    """Refuse a batch with categorical values missing from the code vocabularies.
+
+    They can't be stored (see app/models/codes.py), so the load stops before
+    writing anything and lists every new value to add to the vocabularies.
+    """
+    unknown = {}
+    for column in CODED_COLUMNS:
+        if column in df.columns:
+            values = Pitch.__table__.c[column].type.unknown(df[column].dropna().astype(str))
+            if values:
+                unknown[column] = values
+    if unknown:
+        listing = "; ".join(f"{column}: {', '.join(values)}" for column, values in unknown.items())
+        raise UnknownCodeError(
+            f"Unknown Statcast values ({listing}). Append them to app/models/codes.py and reload."
+        )
+
+
+def is_bulk_load(start_date: str, end_date: str) -> bool:
+    """Whether a date range is large enough to warrant bulk load mode."""
+    days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+    return days >= BULK_LOAD_MIN_DAYS
+
+
+def load_statcast_range(
+    start_date: str,
+    end_date: str,
+    session: Session,
+    deferred_games: Optional[set] = None,
+):
     """
     Load Statcast data for a date range.
 
@@ -48,10 +130,15 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
         session: Database session
+        deferred_games: If given (bulk load mode), game logs are not rebuilt
+            here; the loaded game_pks are added to this set instead
     """
     print(f"Fetching Statcast data from {start_date} to {end_date}...")
 
-    # Fetch data from pybaseball
+    # Fetch data from pybaseball (imported here: it is slow to import and
+    # only needed when actually fetching)
+    from pybaseball import statcast
+
     df = statcast(start_dt=start_date, end_dt=end_date)
 
     if df is None or df.empty:
@@ -59,6 +146,11 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
         return 0
 
     print(f"Got {len(df)} pitches")
+    check_codes(df)
+
+    # PostgreSQL: make sure each season in the batch has its own partition
+    if 'game_year' in df:
+        ensure_year_partitions(session.get_bind(), {int(y) for y in df['game_year'].dropna().unique()})
 
     # Cache pitcher records: mlbam_id -> pitcher database ID
     pitcher_cache = {}
@@ -70,6 +162,16 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
     for p in existing_pitchers:
         pitcher_cache[p.mlbam_id] = p.id
 
+    # Games already stored in the batch's date range, looked up once rather
+    # than per game
+    dates = pd.to_datetime(df['game_date'].dropna())
+    known_games = set()
+    if not dates.empty:
+        known_games = {
+            pk for (pk,) in session.query(Game.game_pk)
+            .filter(Game.game_date.between(dates.min().date(), dates.max().date()))
+        }
+
     # Process each pitch
     for _, row in df.iterrows():
         # Add pitcher if not exists
@@ -86,20 +188,19 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
 
         # Add game if not exists
         game_pk = safe_int(row.get('game_pk'))
-        if game_pk and game_pk not in games_added:
-            existing = session.query(Game).filter_by(game_pk=game_pk).first()
-            if not existing:
-                game_date = pd.to_datetime(row.get('game_date')).date() if pd.notna(row.get('game_date')) else None
-                game = Game(
-                    game_pk=game_pk,
-                    game_date=game_date,
-                    game_year=safe_int(row.get('game_year')) or 2025,
-                    game_type=safe_str(row.get('game_type')),
-                    home_team=safe_str(row.get('home_team')),
-                    away_team=safe_str(row.get('away_team')),
-                )
-                session.add(game)
-                games_added.add(game_pk)
+        if game_pk and game_pk not in known_games:
+            game_date = pd.to_datetime(row.get('game_date')).date() if pd.notna(row.get('game_date')) else None
+            game = Game(
+                game_pk=game_pk,
+                game_date=game_date,
+                game_year=safe_int(row.get('game_year')) or 2025,
+                game_type=safe_str(row.get('game_type')),
+                home_team=safe_str(row.get('home_team')),
+                away_team=safe_str(row.get('away_team')),
+            )
+            session.add(game)
+            games_added.add(game_pk)
+            known_games.add(game_pk)
 
         # Get pitcher foreign key from cache
         pitcher_db_id = pitcher_cache.get(pitcher_mlbam) if pitcher_mlbam else None
@@ -160,6 +261,9 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
             iso_value=safe_float(row.get('iso_value')),
             delta_run_exp=safe_float(row.get('delta_run_exp')),
         )
+        pitch.flags = compute_flags(
+            pitch.description, pitch.zone, pitch.balls, pitch.strikes, pitch.events, pitch.pitch_type
+        )
         session.add(pitch)
         pitches_added += 1
 
@@ -170,12 +274,47 @@ def load_statcast_range(start_date: str, end_date: str, session: Session):
 
     session.commit()
     print(f"Loaded {pitches_added} pitches, {len(pitcher_cache)} pitchers total, {len(games_added)} games")
+
+    # Rebuild game logs for every game touched by this load
+    loaded_games = [int(pk) for pk in df['game_pk'].dropna().unique()]
+    if deferred_games is not None:
+        deferred_games.update(loaded_games)
+    else:
+        lines = refresh_pitcher_games(session, loaded_games)
+        print(f"Updated {lines} pitcher game logs")
+
     return pitches_added
 
 
+def refresh_analytics(session: Session):
+    """Publish a finished load: rebuild the DuckDB analytics snapshot (if that
+    backend is enabled) and bump the data version so API caches revalidate."""
+    copied = refresh_snapshot(session.get_bind())
+    if copied is not None:
+        print(f"Rebuilt analytics snapshot ({copied} pitches)")
+    bump_data_version()
+
+
+def load_range(start_date: str, end_date: str, session: Session, bulk: Optional[bool] = None):
+    """
+    Load a date range, using bulk load mode for large ranges.
+
+    Args:
+        bulk: Force bulk load mode on or off (default: decide from the range size)
+    """
+    if bulk is None:
+        bulk = is_bulk_load(start_date, end_date)
+
+    with bulk_load_indexes(session, enabled=bulk) as deferred_games:
+        pitches = load_statcast_range(start_date, end_date, session, deferred_games)
+
+    refresh_analytics(session)
+    return pitches
+
+
 def load_season(year: int):
     """Load an entire season of data."""
-    session = SessionLocal()
+    session = BulkSessionLocal()
 
     try:
         # MLB season roughly runs April-October
@@ -187,17 +326,20 @@ def load_season(year: int):
         end_date = date.fromisoformat(end)
 
         total_pitches = 0
-        while current < end_date:
-            chunk_end = min(current + timedelta(days=7), end_date)
-            pitches = load_statcast_range(
-                current.isoformat(),
-                chunk_end.isoformat(),
-                session
-            )
-            total_pitches += pitches
-            current = chunk_end + timedelta(days=1)
+        with bulk_load_indexes(session) as deferred_games:
+            while current < end_date:
+                chunk_end = min(current + timedelta(days=7), end_date)
+                pitches = load_statcast_range(
+                    current.isoformat(),
+                    chunk_end.isoformat(),
+                    session,
+                    deferred_games,
+                )
+                total_pitches += pitches
+                current = chunk_end + timedelta(days=1)
 
         print(f"\nTotal pitches loaded for {year}: {total_pitches}")
+        refresh_analytics(session)
 
     finally:
         session.close()
@@ -205,7 +347,7 @@ def load_season(year: int):
 
 def load_sample():
     """Load a small sample of recent data for testing."""
-    session = SessionLocal()
+    session = BulkSessionLocal()
 
     try:
         # Load last week of data for testing
@@ -213,6 +355,7 @@ def load_sample():
         start = end - timedelta(days=7)
 
         load_statcast_range(start.isoformat(), end.isoformat(), session)
+        refresh_analytics(session)
 
     finally:
         session.close()
@@ -226,6 +369,8 @@ if __name__ == "__main__":
     parser.add_argument("--sample", action="store_true", help="Load sample data (last 7 days)")
     parser.add_argument("--start", type=str, help="Start date (YYYY-MM-DD)")
     parser.add_argument("--end", type=str, help="End date (YYYY-MM-DD)")
+    parser.add_argument("--bulk", action=argparse.BooleanOptionalAction, default=None,
+                        help=f"Drop/rebuild indexes around the load (default: ranges of {BULK_LOAD_MIN_DAYS}+ days)")
 
     args = parser.parse_args()
 
@@ -234,9 +379,9 @@ if __name__ == "__main__":
     elif args.sample:
         load_sample()
     elif args.start and args.end:
-        session = SessionLocal()
+        session = BulkSessionLocal()
         try:
-            load_statcast_range(args.start, args.end, session)
+            load_range(args.start, args.end, session, bulk=args.bulk)
         finally:
             session.close()
     else:
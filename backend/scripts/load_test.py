@@ -0,0 +1,477 @@
+"""Load test the API with a traffic mix modelled on the frontend.
+
+Virtual users browse the way the pages in frontend/src call lib/api.ts:
+
+- search: the header autocomplete fires a request per keystroke from the
+  second character (no debounce), then opens a result
+- pitcher page: detail first, then stats, game log (the velocity chart and
+  the game table share it) and the 500-pitch heatmap page in parallel;
+  sometimes another season
+- pitchers index: three top-10 leaderboard cards in parallel
+- leaderboards: the stat list and a board, then stat / limit / min pitches
+  toggles, each a new request
+- discover: the correlations tab (scatter plus rankings), then switching
+  tabs and stat pickers
+- dashboard: database stats
+- compare: two to four pitchers in one request
+
+Like the browser, each user keeps ETags across visits (fetchApi revalidates
+with If-None-Match, so repeat views get 304s) and skips requests its React
+Query cache already holds within a visit. Users pause between actions (mean
+--think seconds, 0 for a closed loop at full speed).
+
+Each concurrency level runs for --duration seconds and reports p50/p95/p99
+latency, throughput and errors per endpoint. With --synthetic the script
+starts one uvicorn worker on a cached synthetic database
+(scripts/synthetic_statcast.py) and stops it afterwards; with --url it
+drives a server that is already running.
+
+Usage:
+    python scripts/load_test.py --synthetic 200k --users 10 50 100
+    python scripts/load_test.py --url http://localhost:8000 --users 25 --duration 120
+    python scripts/load_test.py --synthetic 1m --users 50 --think 0 --json results.json
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Relative frequency of each visit type
+SCENARIOS = {
+    "search": 30,
+    "pitcher_page": 20,
+    "pitchers_index": 10,
+    "leaderboards": 15,
+    "discover": 15,
+    "dashboard": 5,
+    "compare": 5,
+}
+
+LEADERBOARD_STATS = [
+    "velocity", "max_velocity", "spin_rate", "whiff_pct",
+    "strikeout_pct", "h_movement", "v_movement", "strike_pct",
+]
+DISCOVER_STATS = ["avg_velocity", "whiff_pct", "strike_pct", "zone_pct", "chase_pct", "era", "fip", "k_per_9", "bb_per_9"]
+TARGET_STATS = ["era", "fip", "xfip", "whip", "k_per_9", "war"]
+
+KEYSTROKE_SECONDS = 0.12
+REQUEST_TIMEOUT = 30.0
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class EndpointStats:
+    """Latencies and outcomes of one endpoint during a run."""
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.not_modified = 0
+        self.errors = 0
+        self.bytes = 0
+
+    def summary(self, seconds: float) -> dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            "requests": count,
+            "rps": count / seconds if seconds else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": latencies[-1] * 1000 if latencies else float("nan"),
+            "not_modified_pct": 100 * self.not_modified / count if count else 0.0,
+            "errors": self.errors,
+            "kb_per_request": self.bytes / count / 1024 if count else 0.0,
+        }
+
+
+class LoadReport:
+    """Per-endpoint stats for one concurrency level."""
+
+    def __init__(self, users: int):
+        self.users = users
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.all = EndpointStats()
+        self.seconds = 0.0
+
+    def record(self, endpoint: str, seconds: float, status: int, size: int):
+        for stats in (self.endpoints.setdefault(endpoint, EndpointStats()), self.all):
+            stats.latencies.append(seconds)
+            stats.bytes += size
+            if status == 304:
+                stats.not_modified += 1
+            elif status >= 400 or status == 0:
+                stats.errors += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "users": self.users,
+            "seconds": round(self.seconds, 1),
+            "total": self.all.summary(self.seconds),
+            "endpoints": {name: stats.summary(self.seconds) for name, stats in sorted(self.endpoints.items())},
+        }
+
+    def print(self):
+        total = self.all.summary(self.seconds)
+        width = 104
+        print("\n" + "=" * width)
+        print(
+            f"  {self.users} users, {self.seconds:.0f}s: {total['requests']:,} requests, "
+            f"{total['rps']:.1f} req/s, {total['errors']} errors"
+        )
+        print("=" * width)
+        print(
+            f"  {'endpoint':<40}{'requests':>9}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}"
+            f"{'p99 ms':>9}{'max ms':>9}{'304 %':>7}{'errors':>8}"
+        )
+        print("-" * width)
+        rows = sorted(self.endpoints.items(), key=lambda item: -len(item[1].latencies))
+        for name, stats in rows + [("all", self.all)]:
+            s = stats.summary(self.seconds)
+            if name == "all":
+                print("-" * width)
+            print(
+                f"  {name:<40}{s['requests']:>9,}{s['rps']:>8.1f}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}"
+                f"{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}{s['not_modified_pct']:>7.1f}{s['errors']:>8}"
+            )
+        print("=" * width)
+
+
+class Catalog:
+    """What users can browse: pitchers (with names to type) and seasons."""
+
+    def __init__(self, pitchers: list[dict], years: list[int]):
+        self.pitchers = pitchers
+        self.years = years
+
+    @classmethod
+    async def fetch(cls, client: httpx.AsyncClient) -> "Catalog":
+        """Read the pitchers and seasons through the API (not measured)."""
+        pitchers = []
+        page = 1
+        while page <= 20:
+            response = await client.get("/api/pitchers", params={"page": page, "page_size": 100})
+            response.raise_for_status()
+            data = response.json()
+            pitchers.extend(data["items"])
+            if page >= data["total_pages"]:
+                break
+            page += 1
+        stats = (await client.get("/api/stats/database")).json()
+        if not pitchers:
+            raise SystemExit("The API has no pitchers to browse; load data or use --synthetic")
+        return cls(pitchers, stats.get("years") or [])
+
+
+class VirtualUser:
+    """One browser: an HTTP client, its ETag cache and a visit's query cache."""
+
+    def __init__(self, base_url: str, catalog: Catalog, report: LoadReport, think: float, seed: int):
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=6),  # per-host limit of browsers
+            headers={"Accept-Encoding": accept_encoding()},
+        )
+        self.catalog = catalog
+        self.report = report
+        self.think = think
+        self.rng = random.Random(seed)
+        self.http_cache: dict[str, tuple[str, object]] = {}  # url -> (etag, body)
+        self.query_cache: dict[str, object] = {}  # React Query, cleared per visit
+
+    async def get(self, endpoint: str, path: str, params: Optional[dict] = None):
+        url = str(httpx.URL(path, params=params or {}))
+        if url in self.query_cache:
+            return self.query_cache[url]
+
+        headers = {}
+        cached = self.http_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        start = time.perf_counter()
+        try:
+            response = await self.client.get(url, headers=headers)
+            status, size = response.status_code, len(response.content)
+        except httpx.HTTPError:
+            self.report.record(endpoint, time.perf_counter() - start, 0, 0)
+            return None
+        self.report.record(endpoint, time.perf_counter() - start, status, size)
+
+        if status == 304 and cached:
+            body = cached[1]
+        elif status == 200:
+            body = response.json()
+            if "etag" in response.headers:
+                self.http_cache[url] = (response.headers["etag"], body)
+        else:
+            return None
+        self.query_cache[url] = body
+        return body
+
+    async def pause(self, scale: float = 1.0):
+        if self.think > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / (self.think * scale)))
+
+    def pick_pitcher(self) -> dict:
+        # A few stars get most of the traffic
+        index = min(int(self.rng.paretovariate(1.2)) - 1, len(self.catalog.pitchers) - 1)
+        return self.catalog.pitchers[index * 7 % len(self.catalog.pitchers)]
+
+    # Visits -------------------------------------------------------------
+
+    async def search(self):
+        pitcher = self.pick_pitcher()
+        name = pitcher["name"].split(",")[0].lower()
+        typed = name[:self.rng.randint(3, max(3, len(name)))]
+        results = None
+        for length in range(2, len(typed) + 1):
+            results = await self.get("GET /api/pitchers/search", "/api/pitchers/search", {"q": typed[:length], "limit": 10})
+            if self.think > 0:
+                await asyncio.sleep(KEYSTROKE_SECONDS)
+        await self.pause(0.5)
+        if results:
+            await self.pitcher_page(results[0]["id"])
+
+    async def pitcher_page(self, pitcher_id: Optional[int] = None):
+        pitcher_id = pitcher_id or self.pick_pitcher()["id"]
+        detail = await self.get("GET /api/pitchers/{id}", f"/api/pitchers/{pitcher_id}")
+        if not detail or not detail.get("seasons"):
+            return
+        seasons = detail["seasons"]
+        await self.season_views(pitcher_id, seasons[0])
+        if len(seasons) > 1 and self.rng.random() < 0.3:
+            await self.pause()
+            await self.season_views(pitcher_id, self.rng.choice(seasons[1:]))
+
+    async def season_views(self, pitcher_id: int, year: int):
+        await asyncio.gather(
+            self.get("GET /api/pitchers/{id}/stats", f"/api/pitchers/{pitcher_id}/stats", {"year": year}),
+            self.get("GET /api/pitchers/{id}/games", f"/api/pitchers/{pitcher_id}/games", {"year": year, "limit": 30}),
+            self.get("GET /api/pitchers/{id}/pitches", f"/api/pitchers/{pitcher_id}/pitches", {"year": year, "page_size": 500}),
+        )
+
+    async def pitchers_index(self):
+        await asyncio.gather(*[
+            self.get("GET /api/leaderboards", "/api/leaderboards", {"stat": stat, "limit": 10})
+            for stat in ("velocity", "strikeout_pct", "whiff_pct")
+        ])
+        await self.pause()
+        if self.rng.random() < 0.5:
+            await self.pitcher_page()
+
+    async def leaderboards(self):
+        params = {"stat": "velocity", "limit": 25, "min_pitches": 500}
+        await asyncio.gather(
+            self.get("GET /api/leaderboards/stats", "/api/leaderboards/stats"),
+            self.get("GET /api/leaderboards", "/api/leaderboards", params),
+        )
+        for _ in range(self.rng.randint(1, 5)):
+            await self.pause()
+            toggle = self.rng.random()
+            if toggle < 0.6:
+                params["stat"] = self.rng.choice(LEADERBOARD_STATS)
+            elif toggle < 0.8:
+                params["limit"] = self.rng.choice([10, 25, 50])
+            else:
+                params["min_pitches"] = self.rng.choice([100, 250, 500, 1000])
+            await self.get("GET /api/leaderboards", "/api/leaderboards", params)
+
+    async def discover(self):
+        min_innings = 50
+        stat_x, stat_y = "avg_velocity", "whiff_pct"
+        await asyncio.gather(
+            self.get("GET /api/discover/stats", "/api/discover/stats"),
+            self.get("GET /api/discover/correlations", "/api/discover/correlations",
+                     {"stat_x": stat_x, "stat_y": stat_y, "min_innings": min_innings}),
+            self.get("GET /api/discover/correlation-rankings", "/api/discover/correlation-rankings",
+                     {"target_stat": stat_y, "min_innings": min_innings}),
+        )
+        for _ in range(self.rng.randint(1, 4)):
+            await self.pause()
+            tab = self.rng.choice(["correlations", "stickiness", "predictive", "trends"])
+            if tab == "correlations":
+                stat_x, stat_y = self.rng.sample(DISCOVER_STATS, 2)
+                await asyncio.gather(
+                    self.get("GET /api/discover/correlations", "/api/discover/correlations",
+                             {"stat_x": stat_x, "stat_y": stat_y, "min_innings": min_innings}),
+                    self.get("GET /api/discover/correlation-rankings", "/api/discover/correlation-rankings",
+                             {"target_stat": stat_y, "min_innings": min_innings}),
+                )
+            elif tab == "stickiness":
+                await self.get("GET /api/discover/stickiness", "/api/discover/stickiness", {"min_innings": min_innings})
+            elif tab == "predictive":
+                await self.get("GET /api/discover/predictive", "/api/discover/predictive",
+                               {"target_stat": self.rng.choice(TARGET_STATS), "min_innings": min_innings})
+            else:
+                stat_x, stat_y = self.rng.sample(DISCOVER_STATS, 2)
+                await self.get("GET /api/discover/trends", "/api/discover/trends",
+                               {"stat_x": stat_x, "stat_y": stat_y, "min_innings": min_innings})
+
+    async def dashboard(self):
+        await self.get("GET /api/stats/database", "/api/stats/database")
+
+    async def compare(self):
+        ids = {self.pick_pitcher()["id"] for _ in range(self.rng.randint(2, 4))}
+        await self.get("GET /api/pitchers/compare", "/api/pitchers/compare", {"ids": ",".join(map(str, sorted(ids)))})
+
+    async def run(self, deadline: float):
+        names, weights = zip(*SCENARIOS.items())
+        try:
+            while time.perf_counter() < deadline:
+                self.query_cache.clear()  # a new visit
+                await getattr(self, self.rng.choices(names, weights)[0])()
+                await self.pause()
+        finally:
+            await self.client.aclose()
+
+
+def accept_encoding() -> str:
+    try:
+        import brotli  # noqa: F401  (httpx decodes br with it)
+        return "gzip, deflate, br"
+    except ImportError:
+        return "gzip, deflate"
+
+
+async def run_level(base_url: str, catalog: Catalog, users: int, duration: float, think: float, seed: int) -> LoadReport:
+    report = LoadReport(users)
+    start = time.perf_counter()
+    deadline = start + duration
+    # Users arrive over the first tenth of the run (at most 5s)
+    ramp = min(duration / 10, 5.0)
+
+    async def user(i: int):
+        await asyncio.sleep(ramp * i / users)
+        await VirtualUser(base_url, catalog, report, think, seed * 100_003 + i).run(deadline)
+
+    await asyncio.gather(*[user(i) for i in range(users)])
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def synthetic_server(n_pitches: int):
+    """One uvicorn worker serving a cached synthetic database."""
+    from scripts.synthetic_statcast import cached_database
+
+    print(f"Preparing a synthetic database of {n_pitches:,} pitches...")
+    db_path = cached_database(n_pitches)
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{db_path.as_posix()}",
+            "DATA_VERSION_PATH": str(Path(tmp) / "data_version"),
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+             "--port", str(port), "--workers", "1", "--log-level", "warning", "--no-access-log"],
+            cwd=BACKEND_DIR,
+            env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            wait_for_server(base_url, server)
+            yield base_url
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+
+def wait_for_server(base_url: str, server: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"uvicorn exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"Server at {base_url} did not come up within {timeout:.0f}s")
+
+
+async def run(base_url: str, levels: list[int], duration: float, think: float, seed: int) -> list[LoadReport]:
+    async with httpx.AsyncClient(base_url=base_url, timeout=REQUEST_TIMEOUT) as client:
+        catalog = await Catalog.fetch(client)
+    print(f"Browsing {len(catalog.pitchers):,} pitchers, seasons {catalog.years}")
+
+    reports = []
+    for users in levels:
+        print(f"\nRunning {users} users for {duration:.0f}s...")
+        report = await run_level(base_url, catalog, users, duration, think, seed)
+        report.print()
+        reports.append(report)
+    return reports
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load test the API with a frontend-like traffic mix")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Base URL of a running API (e.g. http://localhost:8000)")
+    target.add_argument("--synthetic", help="Serve a synthetic database of this many pitches (e.g. 200k)")
+    parser.add_argument("--users", type=int, nargs="+", default=[10], help="Concurrent users, one run per value")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds per concurrency level")
+    parser.add_argument("--think", type=float, default=1.0, help="Mean pause between actions (0 = none)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        from scripts.synthetic_statcast import parse_scale
+
+        with synthetic_server(parse_scale(args.synthetic)) as base_url:
+            reports = asyncio.run(run(base_url, args.users, args.duration, args.think, args.seed))
+    else:
+        reports = asyncio.run(run(args.url.rstrip("/"), args.users, args.duration, args.think, args.seed))
+
+    if len(reports) > 1:
+        print("\n" + "=" * 64)
+        print(f"  {'users':>6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>10}")
+        print("=" * 64)
+        for report in reports:
+            s = report.all.summary(report.seconds)
+            print(
+                f"  {report.users:>6}{s['rps']:>10.1f}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}"
+                f"{s['p99_ms']:>10.1f}{s['errors']:>10}"
+            )
+        print("=" * 64)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps([report.to_dict() for report in reports], indent=2))
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Convert a PostgreSQL pitches table to year partitions, and freeze old seasons.
+
+Databases created before app/models/partitions.py have pitches as a single
+heap. This renames it aside, creates the partitioned table (one partition per
+season found, plus DEFAULT), copies the rows across season by season,
+carries the id sequence forward and drops the old heap.
+
+Finished seasons never change, so --freeze-through runs VACUUM (FREEZE,
+ANALYZE) on their partitions once; autovacuum then leaves them alone.
+
+PostgreSQL only. Safe to re-run: an already partitioned table is left as is.
+
+Usage:
+    python scripts/partition_pitches.py
+    python scripts/partition_pitches.py --freeze-through 2024
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.database import engine
+from app.models.partitions import (
+    convert_to_partitioned,
+    existing_partition_years,
+    is_postgres,
+    partition_name,
+)
+
+
+def migrate(bind: Engine = engine):
+    """Rebuild pitches as a year-partitioned table."""
+    with bind.begin() as conn:
+        if not convert_to_partitioned(conn):
+            print("  pitches is already partitioned")
+            return
+        for year in sorted(existing_partition_years(conn)):
+            count = conn.execute(text(f"SELECT count(*) FROM {partition_name(year)}")).scalar()
+            if count:
+                print(f"    {partition_name(year)}: {count:,} pitches")
+
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE pitches"))
+
+
+def freeze_seasons(bind: Engine, through_year: int):
+    """VACUUM (FREEZE, ANALYZE) every season partition up to through_year."""
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for year in sorted(existing_partition_years(conn)):
+            if year <= through_year:
+                print(f"  Freezing {partition_name(year)}")
+                conn.execute(text(f"VACUUM (FREEZE, ANALYZE) {partition_name(year)}"))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Partition pitches by season (PostgreSQL)")
+    parser.add_argument("--freeze-through", type=int, help="Freeze partitions up to this season")
+    args = parser.parse_args()
+
+    if not is_postgres(engine):
+        print("pitches partitioning is PostgreSQL only; nothing to do.")
+        return
+
+    print("Partitioning pitches by season...")
+    migrate()
+    if args.freeze_through:
+        print(f"Freezing seasons through {args.freeze_through}...")
+        freeze_seasons(engine, args.freeze_through)
+    print("Done!")
+
+
+if __name__ == "__main__":
+    main()
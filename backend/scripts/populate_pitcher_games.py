@@ -0,0 +1,23 @@
+"""Populate the pitcher_games table (game logs) from existing pitch data.
+
+New loads keep game logs up to date automatically, and the 0005 migration
+builds them for existing databases; run this to rebuild them by hand.
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+from app.core.database import BulkSessionLocal
+from app.core.http_cache import bump_data_version
+from app.services.game_log import refresh_pitcher_games
+
+
+if __name__ == "__main__":
+    db = BulkSessionLocal()
+    try:
+        print("Building pitcher game logs from pitch data...")
+        count = refresh_pitcher_games(db)
+        bump_data_version()
+        print(f"\nDone! Wrote {count} pitcher game logs.")
+    finally:
+        db.close()
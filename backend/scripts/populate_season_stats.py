@@ -6,9 +6,12 @@ sys.path.insert(0, "c:/Claude/Stats/backend")
 from sqlalchemy import func, case, distinct
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal
+from app.core.database import BulkSessionLocal
+from app.core.http_cache import bump_data_version
 from app.models import Pitcher, Pitch
 from app.models.season_stats import SeasonStats
+from app.models.flags import PitchFlag, count_flag, has_flag
+from app.services.stat_moments import refresh_stat_moments
 
 
 def populate_season_stats(db: Session):
@@ -19,74 +22,47 @@ def populate_season_stats(db: Session):
     """
     print("Populating season stats from pitch data...")
 
-    # Get all unique pitcher-year combinations
-    pitcher_years = (
-        db.query(Pitch.pitcher_id, Pitch.game_year)
-        .filter(Pitch.pitcher_id.isnot(None))
-        .distinct()
-        .all()
-    )
+    # Aggregate every pitcher-year in one grouped pass over pitches
+    pitcher_years = db.query(
+        Pitch.pitcher_id,
+        Pitch.game_year,
+        func.count(Pitch.id).label("total_pitches"),
+        func.count(distinct(Pitch.game_pk)).label("games"),
+        # Velocity stats (fastballs only for avg, all for max)
+        func.avg(case((has_flag(PitchFlag.FASTBALL), Pitch.release_speed), else_=None)).label("avg_velocity"),
+        func.max(Pitch.release_speed).label("max_velocity"),
+        # Spin rate
+        func.avg(Pitch.release_spin_rate).label("avg_spin_rate"),
+        # Strike/ball percentages
+        func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
+        func.sum(case((Pitch.type == "B", 1), else_=0)).label("balls"),
+        # Whiff stats
+        count_flag(PitchFlag.WHIFF).label("whiffs"),
+        count_flag(PitchFlag.SWING).label("swings"),
+        # Zone stats
+        count_flag(PitchFlag.IN_ZONE).label("in_zone"),
+        # Movement
+        func.avg(case((has_flag(PitchFlag.BREAKING), Pitch.pfx_x), else_=None)).label("h_movement"),
+        func.avg(case((has_flag(PitchFlag.FASTBALL), Pitch.pfx_z), else_=None)).label("v_movement"),
+        # First pitch strike (balls=0 and strikes=0 means first pitch)
+        func.sum(case((has_flag(PitchFlag.FIRST_PITCH) & (Pitch.type == "S"), 1), else_=0)).label("first_strikes"),
+        count_flag(PitchFlag.FIRST_PITCH).label("first_pitches"),
+    ).filter(
+        Pitch.pitcher_id.isnot(None),
+        Pitch.game_year.isnot(None),
+    ).group_by(Pitch.pitcher_id, Pitch.game_year).all()
 
     print(f"Found {len(pitcher_years)} pitcher-year combinations")
 
+    # Existing rows, loaded once rather than looked up per pitcher-year
+    existing_stats = {(row.pitcher_id, row.year): row for row in db.query(SeasonStats).all()}
+
     stats_created = 0
     stats_updated = 0
 
-    for pitcher_id, year in pitcher_years:
-        if pitcher_id is None or year is None:
-            continue
-
-        # Check if entry already exists
-        existing = db.query(SeasonStats).filter_by(
-            pitcher_id=pitcher_id, year=year
-        ).first()
-
-        # Query aggregated stats for this pitcher-year
-        stats = db.query(
-            func.count(Pitch.id).label("total_pitches"),
-            func.count(distinct(Pitch.game_pk)).label("games"),
-            # Velocity stats (fastballs only for avg, all for max)
-            func.avg(
-                case(
-                    (Pitch.pitch_type.in_(["FF", "SI", "FC", "FT"]), Pitch.release_speed),
-                    else_=None
-                )
-            ).label("avg_velocity"),
-            func.max(Pitch.release_speed).label("max_velocity"),
-            # Spin rate
-            func.avg(Pitch.release_spin_rate).label("avg_spin_rate"),
-            # Strike/ball percentages
-            func.sum(case((Pitch.type == "S", 1), else_=0)).label("strikes"),
-            func.sum(case((Pitch.type == "B", 1), else_=0)).label("balls"),
-            # Whiff stats
-            func.sum(case((Pitch.description.like("%swinging_strike%"), 1), else_=0)).label("whiffs"),
-            func.sum(case((Pitch.description.in_(["swinging_strike", "swinging_strike_blocked", "foul_tip", "foul", "foul_bunt", "missed_bunt", "hit_into_play"]), 1), else_=0)).label("swings"),
-            # Zone stats
-            func.sum(case((Pitch.zone.in_([1,2,3,4,5,6,7,8,9]), 1), else_=0)).label("in_zone"),
-            # Movement
-            func.avg(
-                case(
-                    (Pitch.pitch_type.in_(["SL", "CU", "KC", "CB"]), Pitch.pfx_x),
-                    else_=None
-                )
-            ).label("h_movement"),
-            func.avg(
-                case(
-                    (Pitch.pitch_type.in_(["FF", "SI", "FC", "FT"]), Pitch.pfx_z),
-                    else_=None
-                )
-            ).label("v_movement"),
-            # First pitch strike (balls=0 and strikes=0 means first pitch)
-            func.sum(case(((Pitch.balls == 0) & (Pitch.strikes == 0) & (Pitch.type == "S"), 1), else_=0)).label("first_strikes"),
-            func.sum(case(((Pitch.balls == 0) & (Pitch.strikes == 0), 1), else_=0)).label("first_pitches"),
-        ).filter(
-            Pitch.pitcher_id == pitcher_id,
-            Pitch.game_year == year
-        ).first()
-
-        if not stats or stats.total_pitches == 0:
-            continue
-
+    for stats in pitcher_years:
+        pitcher_id, year = stats.pitcher_id, stats.game_year
+        existing = existing_stats.get((pitcher_id, year))
         total = stats.total_pitches
 
         # Calculate derived percentages
@@ -141,10 +117,12 @@ def populate_season_stats(db: Session):
 
     db.commit()
     print(f"\nDone! Created {stats_created}, updated {stats_updated} season stat records.")
+    print(f"Rebuilt {refresh_stat_moments(db)} correlation moment rows")
+    bump_data_version()
 
 
 if __name__ == "__main__":
-    db = SessionLocal()
+    db = BulkSessionLocal()
     try:
         populate_season_stats(db)
     finally:
@@ -0,0 +1,99 @@
+"""Profile a backend script the way ?profile= profiles an API request.
+
+Runs the script as __main__ with the given arguments under the stack
+sampler from app/core/profiling.py and saves a flame graph (SVG, speedscope
+JSON or folded stacks) in the profile directory, next to the request
+profiles listed by GET /api/admin/profiles. Every thread is sampled, so
+work the script hands to other threads is included.
+
+--profiler cprofile uses cProfile instead (exact call counts, main thread
+only, more overhead): it saves a .pstats file for snakeviz or pstats and
+prints the top functions by cumulative time.
+
+Arguments after -- go to the script.
+
+Usage:
+    python scripts/profile_script.py scripts/aggregate_season_stats.py -- --year 2024
+    python scripts/profile_script.py scripts/load_statcast.py --format speedscope -- --start 2024-04-01 --end 2024-04-07
+    python scripts/profile_script.py scripts/aggregate_season_stats.py --profiler cprofile -- --year 2024
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import argparse
+import cProfile
+import pstats
+import runpy
+from pathlib import Path
+
+from app.core.profiling import FORMATS, StackSampler, profile_store
+
+
+def run_script(script: Path, script_args: list[str]) -> int:
+    """Run a script as __main__; returns its exit code."""
+    sys.argv = [str(script), *script_args]
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    return 0
+
+
+def main():
+    argv = sys.argv[1:]
+    script_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, script_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description="Profile a backend script")
+    parser.add_argument("script", type=Path, help="Script to run (e.g. scripts/aggregate_season_stats.py)")
+    parser.add_argument("--profiler", choices=["sampler", "cprofile"], default="sampler")
+    parser.add_argument("--format", choices=list(FORMATS), default="svg", help="Sampler output format")
+    parser.add_argument("--interval-ms", type=float, default=1.0, help="Sampling interval")
+    parser.add_argument("--out", type=Path, help="Output file (default: the profile directory)")
+    parser.add_argument("--top", type=int, default=30, help="cProfile: functions to print")
+    args = parser.parse_args(argv)
+
+    if not args.script.is_file():
+        parser.error(f"No such script: {args.script}")
+    label = " ".join([args.script.stem, *script_args])
+
+    if args.profiler == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            code = run_script(args.script, script_args)
+        finally:
+            profiler.disable()
+        out = args.out or profile_store.directory / profile_store.new_name(label, "pstats")
+        out.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(out)
+
+        print("\n" + "=" * 70)
+        print(f"  cProfile: top {args.top} by cumulative time")
+        print("=" * 70)
+        pstats.Stats(profiler).strip_dirs().sort_stats("cumulative").print_stats(args.top)
+    else:
+        sampler = StackSampler(args.interval_ms / 1000)
+        sampler.start()
+        try:
+            code = run_script(args.script, script_args)
+        finally:
+            sampler.stop()
+        content = sampler.render(args.format, label)
+        if args.out:
+            args.out.parent.mkdir(parents=True, exist_ok=True)
+            args.out.write_text(content, encoding="utf-8")
+            out = args.out
+        else:
+            out = profile_store.save(profile_store.new_name(label, FORMATS[args.format][0]), content)
+        print(f"\n{sampler.sample_count:,} samples over {sampler.seconds:.1f}s")
+
+    print(f"Profile written to {out}")
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Run the pytest-benchmark suite in benchmarks/ and save the results.
+
+Each run is saved as JSON under benchmarks/results/<machine>/, numbered and
+tagged with the commit, so runs from different commits can be compared:
+
+    pytest-benchmark --storage benchmarks/results compare 0001 0002 --group-by name
+
+Synthetic databases are built on first use per scale and cached in
+benchmarks/.data (see benchmarks/conftest.py).
+
+Usage:
+    python scripts/run_benchmarks.py                         # 20k and 200k pitches
+    python scripts/run_benchmarks.py --scales 20k 1m 10m
+    python scripts/run_benchmarks.py --suite api -k pitcher
+    python scripts/run_benchmarks.py --compare               # compare with the last saved run
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = BACKEND_DIR / "benchmarks"
+SUITES = ["ingest", "aggregation", "api"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--scales", nargs="+", default=["20k", "200k"], help="Pitch counts (e.g. 20k 1m)")
+    parser.add_argument("--suite", choices=SUITES, action="append", help="Only these suites (repeatable)")
+    parser.add_argument("-k", dest="keyword", help="Only benchmarks matching this pytest -k expression")
+    parser.add_argument("--compare", action="store_true", help="Compare against the last saved run")
+    parser.add_argument("--no-save", action="store_true", help="Don't save the results")
+    args = parser.parse_args()
+
+    os.environ["BENCH_SCALES"] = ",".join(args.scales)
+    os.chdir(BACKEND_DIR)
+
+    pytest_args = [
+        *(str(BENCH_DIR / f"bench_{suite}.py") for suite in (args.suite or SUITES)),
+        "-o", "python_files=bench_*.py",
+        "-p", "no:cacheprovider",
+        f"--benchmark-storage=file://{(BENCH_DIR / 'results').as_posix()}",
+        "--benchmark-columns=min,median,mean,stddev,rounds",
+        "--benchmark-sort=name",
+        "--benchmark-group-by=group,param:scale",
+    ]
+    if not args.no_save:
+        pytest_args.append("--benchmark-autosave")
+    if args.compare:
+        pytest_args.append("--benchmark-compare")
+    if args.keyword:
+        pytest_args += ["-k", args.keyword]
+
+    sys.exit(pytest.main(pytest_args))
+
+
+if __name__ == "__main__":
+    main()
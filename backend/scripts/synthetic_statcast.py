@@ -0,0 +1,821 @@
+"""Seeded synthetic Statcast data for benchmarks.
+
+SyntheticStatcast produces pitch rows with the columns and value conventions
+of pybaseball.statcast(), so they can go through the real loader, plus a
+FanGraphs-style pitching_stats() frame for the same pitcher-seasons:
+
+- A pitcher population with multi-season careers (debuts and retirements
+  each season), a starter/reliever role, a team per season and an aging
+  curve on velocity.
+- An arsenal per pitcher: a primary fastball and one to four secondary
+  pitches, each with its own usage, velocity, spin and movement around the
+  league-typical values for that pitch type.
+- A schedule of games from April to September. Starters work about 90
+  pitches through the rotation, relievers about 18.
+- Plate appearances simulated pitch by pitch through the count, with zone,
+  swing, whiff and contact rates per pitch type, and batted-ball data and
+  outcomes on the pitch that ends them.
+
+The pitch sequence is simulated in Python; the continuous measurements
+(velocity, spin, movement, location, release point, ...) are drawn with
+NumPy a chunk at a time.
+
+build_database() turns a scale into a complete SQLite database: pitchers,
+games, pitches with flags, game logs, season stats (populate_season_stats),
+the FanGraphs columns (update_season_stats) and the correlation moments.
+
+Usage:
+    python scripts/synthetic_statcast.py --pitches 1000000 --out synthetic.db
+    python scripts/synthetic_statcast.py --pitches 20000 --seasons 2023 2024 --csv pitches.csv
+"""
+
+import sys
+sys.path.insert(0, "c:/Claude/Stats/backend")
+
+import bisect
+import math
+import random
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+# Bumped whenever the generated data changes, so cached databases are rebuilt
+GENERATOR_VERSION = 1
+
+# Where cached_database() keeps built databases
+CACHE_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / ".data"
+
+# League-typical profile per pitch type for a right-hander: name, velocity
+# (mean, sd between pitchers), spin (mean, sd), movement pfx_x/pfx_z in feet,
+# zone rate and whiff rate per swing. Left-handers mirror pfx_x.
+PITCH_PROFILES = {
+    "FF": ("4-Seam Fastball", 94.2, 2.2, 2290, 140, -0.60, 1.30, 0.55, 0.21),
+    "SI": ("Sinker", 93.3, 2.1, 2150, 130, -1.25, 0.65, 0.56, 0.13),
+    "FC": ("Cutter", 89.0, 2.5, 2400, 150, 0.20, 0.70, 0.50, 0.22),
+    "SL": ("Slider", 85.5, 2.5, 2430, 170, 0.40, 0.15, 0.43, 0.33),
+    "ST": ("Sweeper", 82.5, 2.3, 2600, 160, 1.20, 0.05, 0.42, 0.31),
+    "CU": ("Curveball", 79.5, 2.8, 2550, 200, 0.70, -0.90, 0.40, 0.31),
+    "KC": ("Knuckle Curve", 82.0, 2.5, 2450, 180, 0.50, -0.80, 0.40, 0.33),
+    "CH": ("Changeup", 85.8, 2.6, 1780, 170, -1.20, 0.50, 0.40, 0.31),
+    "FS": ("Split-Finger", 86.0, 2.3, 1300, 200, -0.80, 0.25, 0.38, 0.35),
+}
+PITCH_TYPES = list(PITCH_PROFILES)
+SECONDARY_TYPES = ["SL", "ST", "CU", "KC", "CH", "FS", "FC"]
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BOS", "CHC", "CWS", "CIN", "CLE", "COL", "DET",
+    "HOU", "KC", "LAA", "LAD", "MIA", "MIL", "MIN", "NYM", "NYY", "OAK",
+    "PHI", "PIT", "SD", "SEA", "SF", "STL", "TB", "TEX", "TOR", "WSH",
+]
+
+FIRST_NAMES = [
+    "Aaron", "Adam", "Alex", "Andrew", "Blake", "Brandon", "Brent", "Bryan", "Caleb", "Carlos",
+    "Chase", "Chris", "Cody", "Cole", "Corbin", "Dallas", "Daniel", "David", "Dylan", "Eduardo",
+    "Eric", "Evan", "Felix", "Framber", "Gabriel", "Garrett", "George", "Hunter", "Ian", "Jack",
+    "Jacob", "Jake", "James", "Jason", "Javier", "Jesus", "Joe", "Jordan", "Jose", "Josh",
+    "Justin", "Kevin", "Kyle", "Logan", "Lucas", "Luis", "Marcus", "Mason", "Matt", "Max",
+    "Michael", "Miguel", "Mitch", "Nathan", "Nick", "Noah", "Pablo", "Ryan", "Sean", "Shane",
+    "Spencer", "Taylor", "Tyler", "Walker", "Wade", "Yusei", "Zac", "Zack",
+]
+LAST_NAMES = [
+    "Adams", "Alvarez", "Anderson", "Bailey", "Baker", "Bassitt", "Bell", "Brooks", "Burnes", "Castillo",
+    "Clark", "Cole", "Cortes", "Cruz", "Davis", "Diaz", "Duran", "Edwards", "Fried", "Flores",
+    "Garcia", "Gausman", "Gibson", "Gomez", "Gonzalez", "Gray", "Green", "Hader", "Hall", "Harris",
+    "Hendricks", "Hernandez", "Hill", "Jackson", "James", "Jimenez", "Johnson", "Jones", "Kelly", "King",
+    "Lopez", "Lynn", "Manoah", "Martinez", "Mendoza", "Miller", "Mitchell", "Montas", "Moore", "Morales",
+    "Nelson", "Nola", "Ortiz", "Perez", "Peralta", "Phillips", "Ramirez", "Reyes", "Rivera", "Robertson",
+    "Rodriguez", "Rogers", "Ruiz", "Sale", "Sanchez", "Scott", "Smith", "Snell", "Stewart", "Suarez",
+    "Taylor", "Thompson", "Torres", "Turner", "Valdez", "Walker", "Webb", "Wheeler", "White", "Williams",
+    "Wilson", "Wood", "Wright", "Young",
+]
+
+# Real MLB: about 720k pitches and 850 pitchers per season; simulated games
+# average about 270 pitches (real ones 290)
+PITCHES_PER_PITCHER = 850
+PITCHES_PER_GAME = 270
+MIN_PITCHERS = 26  # two staffs of 13
+
+# Batted-ball types: (probability, launch angle mean, sd, hit probability)
+BATTED_BALLS = {
+    "ground_ball": (0.43, -8.0, 9.0, 0.24),
+    "line_drive": (0.21, 15.0, 5.0, 0.68),
+    "fly_ball": (0.27, 34.0, 8.0, 0.21),
+    "popup": (0.09, 55.0, 8.0, 0.02),
+}
+WOBA_VALUES = {
+    "single": 0.88, "double": 1.25, "triple": 1.58, "home_run": 2.03,
+    "walk": 0.69, "hit_by_pitch": 0.72,
+}
+ISO_VALUES = {"double": 1, "triple": 2, "home_run": 3}
+
+SZ_TOP, SZ_BOT, PLATE_HALF_WIDTH = 3.4, 1.6, 0.83
+
+STATCAST_COLUMNS = [
+    "pitch_type", "game_date", "release_speed", "release_pos_x", "release_pos_z",
+    "player_name", "batter", "pitcher", "events", "description", "zone", "game_type",
+    "stand", "p_throws", "home_team", "away_team", "type", "hit_location", "bb_type",
+    "balls", "strikes", "game_year", "pfx_x", "pfx_z", "plate_x", "plate_z",
+    "outs_when_up", "inning", "inning_topbot", "hc_x", "hc_y", "vx0", "vy0", "vz0",
+    "ax", "ay", "az", "sz_top", "sz_bot", "hit_distance_sc", "launch_speed",
+    "launch_angle", "release_spin_rate", "release_extension", "game_pk",
+    "release_pos_y", "estimated_ba_using_speedangle", "estimated_woba_using_speedangle",
+    "woba_value", "babip_value", "iso_value", "at_bat_number", "pitch_number",
+    "pitch_name", "spin_axis", "delta_run_exp",
+]
+
+
+def parse_scale(text: str) -> int:
+    """Pitch count from "20k", "1m", "10M" or "250000"."""
+    text = text.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * multiplier)
+
+
+class SyntheticStatcast:
+    """Deterministic synthetic Statcast seasons for a target pitch count."""
+
+    def __init__(self, n_pitches: int, seasons: Optional[list[int]] = None, seed: int = 42):
+        self.n_pitches = n_pitches
+        self.seasons = list(seasons or [2021, 2022, 2023, 2024])
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
+
+        per_season = n_pitches / len(self.seasons)
+        self.pitchers_per_season = int(min(max(per_season / PITCHES_PER_PITCHER, MIN_PITCHERS), 900))
+        self.n_teams = max(2, min(len(TEAMS), self.pitchers_per_season // 13))
+        self.pitchers: list[dict] = []
+        self._names = [(first, last) for first in FIRST_NAMES for last in LAST_NAMES]
+        self.rng.shuffle(self._names)
+        self._build_population()
+
+        # Per (pitcher index, season): outcome counters for pitching_stats()
+        self._season_lines: dict[tuple, dict] = {}
+
+    # Population ---------------------------------------------------------
+
+    def _new_pitcher(self, debut: int) -> dict:
+        rng = self.rng
+        index = len(self.pitchers)
+        first, last = self._names[index % len(self._names)]
+        if index >= len(self._names):
+            last = f"{last}-{FIRST_NAMES[(index // len(self._names)) % len(FIRST_NAMES)]}"
+        throws = "L" if rng.random() < 0.28 else "R"
+        is_starter = rng.random() < 0.42
+
+        fastballs = ["FF"] if rng.random() < 0.7 else ["SI"]
+        if rng.random() < 0.3:
+            fastballs = ["FF", "SI"]
+        n_secondary = rng.randint(2, 4) if is_starter else rng.randint(1, 2)
+        secondary = rng.sample(SECONDARY_TYPES, n_secondary)
+        fastball_share = rng.uniform(0.4, 0.6)
+        weights = [fastball_share / len(fastballs)] * len(fastballs)
+        secondary_weights = [rng.uniform(0.5, 1.5) for _ in secondary]
+        scale = (1 - fastball_share) / sum(secondary_weights)
+        weights += [w * scale for w in secondary_weights]
+
+        arsenal = []
+        for pitch_type in fastballs + secondary:
+            _, velo, velo_sd, spin, spin_sd, pfx_x, pfx_z, zone, whiff = PITCH_PROFILES[pitch_type]
+            arsenal.append({
+                "type": pitch_type,
+                "velo": rng.gauss(velo, velo_sd) + (0.8 if not is_starter else 0.0),
+                "spin": rng.gauss(spin, spin_sd),
+                "pfx_x": rng.gauss(pfx_x, 0.2) * (-1 if throws == "L" else 1),
+                "pfx_z": rng.gauss(pfx_z, 0.15),
+                "zone": min(max(rng.gauss(zone, 0.04), 0.25), 0.7),
+                "whiff": min(max(whiff * math.exp(rng.gauss(0, 0.2)), 0.05), 0.6),
+            })
+
+        cumulative = []
+        total = 0.0
+        for weight in weights:
+            total += weight
+            cumulative.append(total)
+
+        pitcher = {
+            "index": index,
+            "mlbam_id": 500000 + index,
+            "first_name": first,
+            "last_name": last,
+            "player_name": f"{last}, {first}",
+            "throws": throws,
+            "is_starter": is_starter,
+            "debut": debut,
+            "last_season": debut + rng.randint(1, 10) - 1,
+            "arsenal": arsenal,
+            "usage": [c / total for c in cumulative],
+            "teams": {},
+        }
+        self.pitchers.append(pitcher)
+        return pitcher
+
+    def _build_population(self):
+        rng = self.rng
+        first = self.seasons[0]
+        for _ in range(self.pitchers_per_season):
+            pitcher = self._new_pitcher(debut=first - rng.randint(0, 6))
+            pitcher["last_season"] = max(pitcher["last_season"], first)
+
+        teams = TEAMS[:self.n_teams]
+        for season in self.seasons:
+            active = [p for p in self.pitchers if p["debut"] <= season <= p["last_season"]]
+            while len(active) < self.pitchers_per_season:
+                active.append(self._new_pitcher(debut=season))
+
+            staff = {team: {True: 0, False: 0} for team in teams}
+            movers = []
+            for pitcher in active:
+                previous = pitcher["teams"].get(season - 1)
+                if previous is not None and rng.random() < 0.85:
+                    pitcher["teams"][season] = previous
+                    staff[previous][pitcher["is_starter"]] += 1
+                else:
+                    movers.append(pitcher)
+            for pitcher in movers:
+                role = pitcher["is_starter"]
+                team = min(teams, key=lambda t: (staff[t][role], rng.random()))
+                pitcher["teams"][season] = team
+                staff[team][role] += 1
+
+    def staffs(self, season: int) -> dict[str, dict]:
+        """Starters and relievers of each team in a season."""
+        staffs = {team: {"starters": [], "relievers": []} for team in TEAMS[:self.n_teams]}
+        for pitcher in self.pitchers:
+            team = pitcher["teams"].get(season)
+            if team is not None:
+                staffs[team]["starters" if pitcher["is_starter"] else "relievers"].append(pitcher)
+        for team, staff in staffs.items():
+            # Tiny scales can leave a team without one role; borrow from the other
+            if not staff["starters"]:
+                staff["starters"] = staff["relievers"][:1]
+            if not staff["relievers"]:
+                staff["relievers"] = staff["starters"][-1:]
+        return staffs
+
+    def pitcher_rows(self) -> list[dict]:
+        """Rows for the pitchers table (team and role as of their last season)."""
+        last_season = self.seasons[-1]
+        rows = []
+        for pitcher in self.pitchers:
+            seasons = sorted(pitcher["teams"])
+            if not seasons:
+                continue
+            rows.append({
+                "mlbam_id": pitcher["mlbam_id"],
+                "name": pitcher["player_name"],
+                "first_name": pitcher["first_name"],
+                "last_name": pitcher["last_name"],
+                "team": pitcher["teams"][seasons[-1]],
+                "throws": pitcher["throws"],
+                "is_starter": pitcher["is_starter"],
+                "is_active": seasons[-1] == last_season,
+            })
+        return rows
+
+    # Simulation ---------------------------------------------------------
+
+    def _season_line(self, pitcher: dict, season: int) -> dict:
+        key = (pitcher["index"], season)
+        line = self._season_lines.get(key)
+        if line is None:
+            line = self._season_lines[key] = {
+                "outs": 0, "k": 0, "bb": 0, "hbp": 0, "hr": 0, "hits": 0, "bip": 0,
+                "gb": 0, "fb": 0, "ld": 0, "hard": 0, "barrels": 0,
+                "o_pitches": 0, "o_swings": 0, "games": set(),
+            }
+        return line
+
+    def _batted_ball(self, pitch_type: str, outs: int) -> tuple:
+        """Outcome of a ball in play: (event, bb_type, launch_speed, launch_angle)."""
+        rng = self.rng
+        r = rng.random()
+        if pitch_type == "SI":
+            r *= 0.85  # sinkers get more grounders
+        for bb_type, (probability, angle_mean, angle_sd, hit_probability) in BATTED_BALLS.items():
+            if r < probability:
+                break
+            r -= probability
+        launch_angle = rng.gauss(angle_mean, angle_sd)
+        launch_speed = min(max(rng.gauss(88.5, 13.0), 30.0), 120.0)
+
+        hit_probability *= 0.6 + 0.5 * (launch_speed / 88.5) ** 2 / 1.25
+        if bb_type in ("fly_ball", "line_drive") and launch_speed > 95 and 20 <= launch_angle <= 40:
+            event = "home_run" if rng.random() < 0.5 else "double"
+        elif rng.random() < hit_probability:
+            r = rng.random()
+            if bb_type == "ground_ball":
+                event = "single" if r < 0.9 else "double"
+            else:
+                event = "single" if r < 0.65 else ("double" if r < 0.95 else "triple")
+        elif bb_type == "ground_ball" and outs < 2 and rng.random() < 0.1:
+            event = "grounded_into_double_play"
+        elif bb_type == "ground_ball" and rng.random() < 0.08:
+            event = "force_out"
+        elif bb_type == "fly_ball" and outs < 2 and rng.random() < 0.04:
+            event = "sac_fly"
+        else:
+            event = "field_out"
+        return event, bb_type, launch_speed, launch_angle
+
+    def _plate_appearance(self, pitcher: dict, line: dict, outs: int) -> tuple[list, Optional[str], tuple]:
+        """Simulate one PA. Returns per-pitch tuples, the event and the batted ball."""
+        rng = self.rng
+        arsenal = pitcher["arsenal"]
+        usage = pitcher["usage"]
+        balls = strikes = 0
+        pitches = []
+        while True:
+            pitch = arsenal[min(bisect.bisect_left(usage, rng.random()), len(arsenal) - 1)]
+            zone_rate = pitch["zone"] + (0.1 if balls == 3 else 0.0)
+            in_zone = rng.random() < zone_rate
+            swing = rng.random() < (0.66 if in_zone else 0.28) + (0.08 if strikes == 2 else 0.0)
+            if not in_zone:
+                line["o_pitches"] += 1
+                line["o_swings"] += swing
+            count = (balls, strikes)
+            event = None
+            batted = (None, None, None)
+
+            if not swing and not in_zone and rng.random() < 0.004:
+                description, pitch_kind, event = "hit_by_pitch", "B", "hit_by_pitch"
+            elif swing:
+                if rng.random() < pitch["whiff"] * (0.75 if in_zone else 1.3):
+                    description = "swinging_strike_blocked" if rng.random() < 0.05 else "swinging_strike"
+                    pitch_kind = "S"
+                    strikes += 1
+                elif rng.random() < 0.52:
+                    description = "foul_tip" if strikes == 2 and rng.random() < 0.06 else "foul"
+                    pitch_kind = "S"
+                    if description == "foul_tip":
+                        strikes += 1
+                    elif strikes < 2:
+                        strikes += 1
+                else:
+                    description, pitch_kind = "hit_into_play", "X"
+                    event, bb_type, launch_speed, launch_angle = self._batted_ball(pitch["type"], outs)
+                    batted = (bb_type, launch_speed, launch_angle)
+            elif in_zone:
+                description, pitch_kind = "called_strike", "S"
+                strikes += 1
+            else:
+                description = "blocked_ball" if rng.random() < 0.04 else "ball"
+                pitch_kind = "B"
+                balls += 1
+
+            if event is None and strikes == 3:
+                event = "strikeout"
+            elif event is None and balls == 4:
+                event = "walk"
+            pitches.append((pitch, count, in_zone, description, pitch_kind, event, batted))
+            if event is not None:
+                return pitches, event, batted
+
+    def _record_outcome(self, line: dict, event: str, batted: tuple, outs: int) -> int:
+        """Update a pitcher's season line; returns outs recorded on the play."""
+        bb_type, launch_speed, launch_angle = batted
+        if event == "strikeout":
+            line["k"] += 1
+        elif event == "walk":
+            line["bb"] += 1
+        elif event == "hit_by_pitch":
+            line["hbp"] += 1
+        if bb_type is not None:
+            line["bip"] += 1
+            line[{"ground_ball": "gb", "line_drive": "ld"}.get(bb_type, "fb")] += 1
+            line["hard"] += launch_speed >= 95
+            line["barrels"] += launch_speed >= 98 and 24 <= launch_angle <= 33
+        if event in ("single", "double", "triple", "home_run"):
+            line["hits"] += 1
+            line["hr"] += event == "home_run"
+            return 0
+        if event == "grounded_into_double_play":
+            return 2 if outs < 2 else 1
+        if event in ("walk", "hit_by_pitch"):
+            return 0
+        return 1
+
+    def _schedule(self) -> list[tuple]:
+        """(season, game_pk, date, home, away) for every game, in date order."""
+        rng = self.rng
+        games_per_season = math.ceil(self.n_pitches / PITCHES_PER_GAME / len(self.seasons))
+        teams = TEAMS[:self.n_teams]
+        games = []
+        for season in self.seasons:
+            opening = date(season, 4, 1)
+            days = 180
+            for i in range(games_per_season):
+                home, away = rng.sample(teams, 2)
+                game_date = opening + timedelta(days=i * days // games_per_season)
+                games.append((season, 700000 + (season % 100) * 10000 + i, game_date, home, away))
+        return games
+
+    def iter_frames(self, chunk_size: int = 200_000) -> Iterator[pd.DataFrame]:
+        """Statcast-shaped DataFrames of about chunk_size pitches, in game order."""
+        rng = self.rng
+        produced = 0
+        rotation: dict[tuple, int] = {}
+        staffs = {season: self.staffs(season) for season in self.seasons}
+        batters = {team: [600000 + t * 100 + i for i in range(13)] for t, team in enumerate(TEAMS)}
+        rows: list[tuple] = []
+
+        for season, game_pk, game_date, home, away in self._schedule():
+            date_text = game_date.isoformat()
+            # Each team's pitchers for this game: the next starter, then relievers
+            pitching = {}
+            for team in (home, away):
+                staff = staffs[season][team]
+                turn = rotation.get((season, team), 0)
+                rotation[(season, team)] = turn + 1
+                starter = staff["starters"][turn % len(staff["starters"])]
+                pitching[team] = {
+                    "pitcher": starter,
+                    "limit": int(min(max(rng.gauss(92, 12), 55), 115)),
+                    "count": 0,
+                    "relievers": staff["relievers"],
+                }
+            at_bat_number = 0
+            lineup_spot = {home: 0, away: 0}
+
+            for inning in range(1, 10):
+                for half, batting, fielding in (("Top", away, home), ("Bot", home, away)):
+                    if inning == 9 and half == "Bot" and rng.random() < 0.5:
+                        continue  # home team ahead
+                    state = pitching[fielding]
+                    outs = 0
+                    while outs < 3:
+                        if state["count"] >= state["limit"]:
+                            state["pitcher"] = rng.choice(state["relievers"])
+                            state["limit"] = int(min(max(rng.gauss(18, 6), 5), 35))
+                            state["count"] = 0
+                        pitcher = state["pitcher"]
+                        line = self._season_line(pitcher, season)
+                        line["games"].add(game_pk)
+                        at_bat_number += 1
+                        batter = batters[batting][lineup_spot[batting] % 9]
+                        lineup_spot[batting] += 1
+                        stand = "L" if batter % 3 == 0 else "R"
+
+                        pitches, event, batted = self._plate_appearance(pitcher, line, outs)
+                        for pitch_number, (pitch, count, in_zone, description, kind, pitch_event, pitch_batted) in enumerate(pitches, 1):
+                            rows.append((
+                                pitcher["index"], pitch["type"], date_text, season, game_pk, home, away,
+                                batter, stand, count[0], count[1], outs, inning, half,
+                                at_bat_number, pitch_number, in_zone, description, kind,
+                                pitch_event, *pitch_batted,
+                            ))
+                        state["count"] += len(pitches)
+                        recorded = min(self._record_outcome(line, event, batted, outs), 3 - outs)
+                        line["outs"] += recorded
+                        outs += recorded
+                        produced += len(pitches)
+
+            if len(rows) >= chunk_size:
+                yield self._frame(rows)
+                rows = []
+            if produced >= self.n_pitches:
+                break
+        if rows:
+            yield self._frame(rows)
+
+    def _frame(self, rows: list[tuple]) -> pd.DataFrame:
+        """Build a Statcast frame from simulated pitches, drawing the measurements."""
+        n = len(rows)
+        rng = self.np_rng
+        columns = list(zip(*rows)) if rows else [()] * 23
+        (pitcher_index, pitch_type, game_date, game_year, game_pk, home, away,
+         batter, stand, balls, strikes, outs, inning, half,
+         at_bat_number, pitch_number, in_zone, description, kind,
+         events, bb_type, launch_speed, launch_angle) = columns
+
+        pitcher_index = np.array(pitcher_index, dtype=np.int64)
+        in_zone = np.array(in_zone, dtype=bool)
+        type_index = np.array([PITCH_TYPES.index(t) for t in pitch_type], dtype=np.int64)
+
+        # Per-pitcher arsenal means, looked up by (pitcher, pitch type)
+        means = np.zeros((len(self.pitchers), len(PITCH_TYPES), 4))
+        for pitcher in self.pitchers:
+            for pitch in pitcher["arsenal"]:
+                means[pitcher["index"], PITCH_TYPES.index(pitch["type"])] = (
+                    pitch["velo"], pitch["spin"], pitch["pfx_x"], pitch["pfx_z"],
+                )
+        mean = means[pitcher_index, type_index]
+
+        # Aging: velocity peaks in a pitcher's third season, then fades
+        debut = np.array([p["debut"] for p in self.pitchers])[pitcher_index]
+        career_year = np.array(game_year) - debut
+        aging = -0.25 * np.abs(career_year - 2)
+        throws = np.array([p["throws"] for p in self.pitchers], dtype=object)[pitcher_index]
+        lefty = throws == "L"
+
+        release_speed = np.round(mean[:, 0] + aging + rng.normal(0, 0.9, n), 1)
+        release_spin_rate = np.round(mean[:, 1] + rng.normal(0, 55, n))
+        pfx_x = np.round(mean[:, 2] + rng.normal(0, 0.12, n), 2)
+        pfx_z = np.round(mean[:, 3] + rng.normal(0, 0.12, n), 2)
+
+        # Location: inside the zone for in-zone pitches, around it otherwise
+        plate_x = np.where(
+            in_zone,
+            rng.uniform(-PLATE_HALF_WIDTH, PLATE_HALF_WIDTH, n),
+            rng.normal(0, 0.9, n),
+        )
+        plate_z = np.where(in_zone, rng.uniform(SZ_BOT, SZ_TOP, n), rng.normal(2.5, 1.0, n))
+        outside = ~in_zone & (np.abs(plate_x) <= PLATE_HALF_WIDTH) & (plate_z >= SZ_BOT) & (plate_z <= SZ_TOP)
+        plate_x = np.where(outside, np.sign(plate_x + 1e-9) * (PLATE_HALF_WIDTH + rng.uniform(0.05, 0.6, n)), plate_x)
+        zone = self._zones(plate_x, plate_z)
+
+        release_pos_x = np.where(lefty, 1.0, -1.0) * rng.normal(1.9, 0.4, n).round(2)
+        extension = rng.normal(6.4, 0.35, n).round(1)
+        in_play = np.array([speed is not None for speed in launch_speed])
+        speed = np.array([s if s is not None else np.nan for s in launch_speed], dtype=float)
+        angle = np.array([a if a is not None else np.nan for a in launch_angle], dtype=float)
+        xba = np.clip(1 / (1 + np.exp(-(speed - 95) / 6)) * np.exp(-((angle - 15) / 22) ** 2) + 0.12, 0, 1)
+
+        frame = pd.DataFrame({
+            "pitch_type": pitch_type,
+            "game_date": pd.to_datetime(list(game_date)),
+            "release_speed": release_speed,
+            "release_pos_x": release_pos_x,
+            "release_pos_z": rng.normal(5.8, 0.3, n).round(2),
+            "player_name": np.array([p["player_name"] for p in self.pitchers], dtype=object)[pitcher_index],
+            "batter": batter,
+            "pitcher": pitcher_index + 500000,
+            "events": events,
+            "description": description,
+            "zone": zone,
+            "game_type": "R",
+            "stand": stand,
+            "p_throws": throws,
+            "home_team": home,
+            "away_team": away,
+            "type": kind,
+            "hit_location": np.where(in_play, rng.integers(1, 10, n), np.nan),
+            "bb_type": bb_type,
+            "balls": balls,
+            "strikes": strikes,
+            "game_year": game_year,
+            "pfx_x": pfx_x,
+            "pfx_z": pfx_z,
+            "plate_x": plate_x.round(2),
+            "plate_z": plate_z.round(2),
+            "outs_when_up": outs,
+            "inning": inning,
+            "inning_topbot": half,
+            "hc_x": np.where(in_play, rng.normal(125, 35, n).round(2), np.nan),
+            "hc_y": np.where(in_play, rng.normal(150, 40, n).round(2), np.nan),
+            "vx0": (rng.normal(6, 2, n) * np.where(lefty, -1, 1)).round(3),
+            "vy0": (-release_speed * 1.45).round(3),
+            "vz0": rng.normal(-5, 2, n).round(3),
+            "ax": (pfx_x * -12.0 + rng.normal(0, 1, n)).round(3),
+            "ay": rng.normal(28, 3, n).round(3),
+            "az": (pfx_z * 12.0 - 32.2 + rng.normal(0, 1, n)).round(3),
+            "sz_top": rng.normal(SZ_TOP, 0.1, n).round(2),
+            "sz_bot": rng.normal(SZ_BOT, 0.08, n).round(2),
+            "hit_distance_sc": np.where(in_play, np.clip(speed * 2.2 * np.sin(np.radians(np.clip(angle, 0, 60)) * 2) + rng.normal(0, 15, n), 0, 470).round(), np.nan),
+            "launch_speed": np.round(speed, 1),
+            "launch_angle": np.round(angle),
+            "release_spin_rate": release_spin_rate,
+            "release_extension": extension,
+            "game_pk": game_pk,
+            "release_pos_y": (60.5 - extension).round(2),
+            "estimated_ba_using_speedangle": np.where(in_play, xba.round(3), np.nan),
+            "estimated_woba_using_speedangle": np.where(in_play, (xba * 1.25).round(3), np.nan),
+            "woba_value": [WOBA_VALUES.get(e, 0.0) if e is not None else np.nan for e in events],
+            "babip_value": [
+                (1 if e in ("single", "double", "triple") else 0) if s is not None else np.nan
+                for e, s in zip(events, launch_speed)
+            ],
+            "iso_value": [ISO_VALUES.get(e, 0) if e is not None else np.nan for e in events],
+            "at_bat_number": at_bat_number,
+            "pitch_number": pitch_number,
+            "pitch_name": [PITCH_PROFILES[t][0] for t in pitch_type],
+            "spin_axis": np.round((np.degrees(np.arctan2(pfx_x, pfx_z)) + 180) % 360),
+            "delta_run_exp": rng.normal(0, 0.08, n).round(3),
+        })
+        return frame[STATCAST_COLUMNS]
+
+    @staticmethod
+    def _zones(plate_x: np.ndarray, plate_z: np.ndarray) -> np.ndarray:
+        """Statcast zone: 1-9 in the strike zone (3x3 from the top left), 11-14 outside."""
+        column = np.clip(((plate_x + PLATE_HALF_WIDTH) / (2 * PLATE_HALF_WIDTH / 3)).astype(int), 0, 2)
+        row = np.clip(((SZ_TOP - plate_z) / ((SZ_TOP - SZ_BOT) / 3)).astype(int), 0, 2)
+        inside = (np.abs(plate_x) <= PLATE_HALF_WIDTH) & (plate_z >= SZ_BOT) & (plate_z <= SZ_TOP)
+        outside = 11 + (plate_x > 0).astype(int) + 2 * (plate_z < (SZ_TOP + SZ_BOT) / 2).astype(int)
+        return np.where(inside, 1 + row * 3 + column, outside)
+
+    def statcast(self) -> pd.DataFrame:
+        """All pitches in one frame (fine up to a few million)."""
+        return pd.concat(list(self.iter_frames()), ignore_index=True)
+
+    def pitching_stats(self) -> pd.DataFrame:
+        """FanGraphs-style season lines (pybaseball.pitching_stats columns).
+
+        Only complete after iter_frames() has been consumed.
+        """
+        rng = random.Random(self.seed + 1)
+        rows = []
+        for (index, season), line in sorted(self._season_lines.items()):
+            pitcher = self.pitchers[index]
+            innings = line["outs"] / 3
+            if innings <= 0:
+                continue
+            batters_faced = line["outs"] + line["hits"] + line["bb"] + line["hbp"]
+            fly_balls = max(line["fb"], 1)
+            fip = (13 * line["hr"] + 3 * (line["bb"] + line["hbp"]) - 2 * line["k"]) / innings + 3.1
+            xfip = (13 * fly_balls * 0.105 + 3 * (line["bb"] + line["hbp"]) - 2 * line["k"]) / innings + 3.1
+            era = max(fip + rng.gauss(0, 0.9 / math.sqrt(max(innings / 50, 0.2))), 0.0)
+            k_rate = line["k"] / max(batters_faced, 1)
+            bb_rate = line["bb"] / max(batters_faced, 1)
+            bip = max(line["bip"], 1)
+            rows.append({
+                "Name": f"{pitcher['first_name']} {pitcher['last_name']}",
+                "Season": season,
+                "Team": pitcher["teams"].get(season),
+                "G": len(line["games"]),
+                "IP": round(innings, 1),
+                "ERA": round(era, 2),
+                "FIP": round(fip, 2),
+                "xFIP": round(xfip, 2),
+                "SIERA": round(5.6 - 12.0 * k_rate + 9.0 * bb_rate + rng.gauss(0, 0.15), 2),
+                "WHIP": round((line["hits"] + line["bb"]) / innings, 2),
+                "K/9": round(9 * line["k"] / innings, 2),
+                "BB/9": round(9 * line["bb"] / innings, 2),
+                "HR/9": round(9 * line["hr"] / innings, 2),
+                "WAR": round((5.0 - fip) * innings / 90, 1),
+                "GB%": round(100 * line["gb"] / bip, 1),
+                "FB%": round(100 * line["fb"] / bip, 1),
+                "LD%": round(100 * line["ld"] / bip, 1),
+                "Hard%": round(100 * line["hard"] / bip, 1),
+                "Barrel%": round(100 * line["barrels"] / bip, 1),
+                "O-Swing%": round(100 * line["o_swings"] / max(line["o_pitches"], 1), 1),
+            })
+        return pd.DataFrame(rows)
+
+
+# Database ---------------------------------------------------------------
+
+@contextmanager
+def _private_data_version(path: Path):
+    """Point bump_data_version() at a file next to the database being built."""
+    from app.core import http_cache
+
+    original = http_cache.data_version
+    http_cache.data_version = http_cache.DataVersion(path.with_suffix(".version"))
+    try:
+        yield
+    finally:
+        http_cache.data_version = original
+
+
+def build_database(path: Path, n_pitches: int, seed: int = 42, seasons: Optional[list[int]] = None,
+                   quiet: bool = True) -> dict:
+    """Create a complete SQLite database of synthetic data at path.
+
+    Returns counts of the rows written.
+    """
+    import contextlib
+    import io
+    import sqlite3
+
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.database import Base, create_db_engine
+    from app.models import Game, Pitch, Pitcher
+    from app.models.flags import refresh_pitch_flags
+    from app.services.game_log import refresh_pitcher_games
+    from app.services.stat_moments import refresh_stat_moments
+    from scripts.load_fangraphs_stats import update_season_stats
+    from scripts.populate_season_stats import populate_season_stats
+
+    path = Path(path)
+    path.unlink(missing_ok=True)
+    engine = create_db_engine(f"sqlite:///{path.as_posix()}", profile="bulk")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    generator = SyntheticStatcast(n_pitches, seasons=seasons, seed=seed)
+
+    pitcher_rows = generator.pitcher_rows()
+    with engine.begin() as conn:
+        conn.execute(Pitcher.__table__.insert(), pitcher_rows)
+    with engine.connect() as conn:
+        pitcher_ids = dict(conn.execute(Pitcher.__table__.select().with_only_columns(
+            Pitcher.__table__.c.mlbam_id, Pitcher.__table__.c.id,
+        )).all())
+
+    pitch_columns = [c.name for c in Pitch.__table__.columns if c.name not in ("id", "pitcher_id", "flags")]
+    renames = {"pitcher": "pitcher_mlbam_id", "batter": "batter_mlbam_id", "stand": "batter_stand"}
+    pitches = games = 0
+    for frame in generator.iter_frames():
+        frame = frame.rename(columns=renames)
+        game_rows = (
+            frame.drop_duplicates("game_pk")[["game_pk", "game_date", "game_year", "game_type", "home_team", "away_team"]]
+            .assign(game_date=lambda f: f["game_date"].dt.date)
+        )
+        frame = frame.assign(
+            pitcher_id=frame["pitcher_mlbam_id"].map(pitcher_ids),
+            game_date=frame["game_date"].dt.date,
+        )
+        records = frame[["pitcher_id"] + [c for c in pitch_columns if c in frame]]
+        records = records.astype(object).where(records.notna(), None).to_dict("records")
+        with engine.begin() as conn:
+            conn.execute(Game.__table__.insert(), game_rows.to_dict("records"))
+            conn.execute(Pitch.__table__.insert(), records)
+        pitches += len(records)
+        games += len(game_rows)
+
+    output = io.StringIO() if quiet else sys.stdout
+    with _private_data_version(path), contextlib.redirect_stdout(output):
+        session = Session()
+        try:
+            refresh_pitch_flags(session)
+            refresh_pitcher_games(session)
+            populate_season_stats(session)
+            conn = sqlite3.connect(path)
+            try:
+                update_season_stats(conn, generator.pitching_stats())
+            finally:
+                conn.close()
+            moments = refresh_stat_moments(session)
+        finally:
+            session.close()
+    engine.dispose()
+
+    return {"pitchers": len(pitcher_rows), "games": games, "pitches": pitches, "stat_moments": moments}
+
+
+def schema_hash() -> str:
+    """Fingerprint of the table definitions, so schema changes rebuild cached databases."""
+    import hashlib
+
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    from app.core.database import Base
+    import app.models  # noqa: F401  (registers the tables)
+
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in sorted(table.indexes, key=lambda i: i.name))
+    return hashlib.blake2b("\n".join(ddl).encode(), digest_size=6).hexdigest()
+
+
+def scale_label(n_pitches: int) -> str:
+    """Short label for a pitch count: 20k, 1m, 2500."""
+    if n_pitches >= 1_000_000 and n_pitches % 1_000_000 == 0:
+        return f"{n_pitches // 1_000_000}m"
+    if n_pitches >= 1_000 and n_pitches % 1_000 == 0:
+        return f"{n_pitches // 1_000}k"
+    return str(n_pitches)
+
+
+def cached_database(n_pitches: int, seed: int = 42, cache_dir: Path = CACHE_DIR) -> Path:
+    """Path of a synthetic database for the scale, built on first use.
+
+    Cached by scale, seed, generator version and schema, so a schema change
+    or a new generator version builds a fresh one. Treat it as read-only.
+    """
+    path = Path(cache_dir) / f"synthetic-{scale_label(n_pitches)}-s{seed}-v{GENERATOR_VERSION}-{schema_hash()}.db"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        building = path.with_suffix(".building")
+        build_database(building, n_pitches, seed=seed)
+        building.replace(path)
+        building.with_suffix(".version").unlink(missing_ok=True)
+    return path
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Generate synthetic Statcast data")
+    parser.add_argument("--pitches", default="200k", help="Number of pitches (e.g. 20k, 1m, 10m)")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[2021, 2022, 2023, 2024])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="Write a complete SQLite database here")
+    parser.add_argument("--csv", help="Write the Statcast rows to this CSV instead")
+    args = parser.parse_args()
+
+    n_pitches = parse_scale(args.pitches)
+    start = time.perf_counter()
+    if args.csv:
+        generator = SyntheticStatcast(n_pitches, seasons=args.seasons, seed=args.seed)
+        for i, frame in enumerate(generator.iter_frames()):
+            frame.to_csv(args.csv, mode="a" if i else "w", header=not i, index=False)
+        print(f"Wrote {n_pitches:,} pitches to {args.csv}")
+    elif args.out:
+        counts = build_database(Path(args.out), n_pitches, seed=args.seed, seasons=args.seasons, quiet=False)
+        print(", ".join(f"{count:,} {name}" for name, count in counts.items()))
+    else:
+        parser.error("one of --out or --csv is required")
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
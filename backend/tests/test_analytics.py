@@ -0,0 +1,176 @@
+"""Parity tests for the DuckDB analytics backend against the SQLAlchemy path."""
+
+import random
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core.config import settings
+from app.core.database import Base, get_db, get_read_db
+from app.models.flags import compute_flags
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+from app.services import analytics
+from scripts.aggregate_season_stats import aggregate_statcast_stats
+
+duckdb = pytest.importorskip("duckdb")
+
+PITCH_TYPES = ["FF", "SI", "FC", "SL", "CU", "CH", "KC", None]
+DESCRIPTIONS = [
+    "ball", "called_strike", "swinging_strike", "swinging_strike_blocked",
+    "foul", "foul_tip", "hit_into_play", "blocked_ball", None,
+]
+EVENTS = ["strikeout", "single", "walk", "home_run", "field_out", "wild_pitch"]
+
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory):
+    """A file-backed SQLite database with random pitches, and its DuckDB snapshot."""
+    tmp = tmp_path_factory.mktemp("analytics")
+    engine = create_engine(f"sqlite:///{(tmp / 'test.db').as_posix()}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    rng = random.Random(7)
+    db = SessionLocal()
+    for pitcher_id in range(1, 9):
+        db.add(Pitcher(
+            id=pitcher_id, mlbam_id=600000 + pitcher_id, name=f"Pitcher {pitcher_id}",
+            team="NYY", throws="R", is_starter=pitcher_id % 2 == 0, is_active=True,
+        ))
+    for i in range(8000):
+        values = {
+            "description": rng.choice(DESCRIPTIONS),
+            "zone": rng.choice([None, *range(1, 10), 11, 12, 13, 14]),
+            "balls": rng.randint(0, 3),
+            "strikes": rng.randint(0, 2),
+            "events": rng.choice(EVENTS) if rng.random() < 0.25 else None,
+            "pitch_type": rng.choice(PITCH_TYPES),
+        }
+        db.add(Pitch(
+            pitcher_id=rng.randint(1, 8),
+            game_pk=7000 + i // 300,
+            game_date=date(2023 + i % 2, 5, 1 + (i // 300) % 28),
+            game_year=2023 + i % 2,
+            release_speed=rng.choice([None, rng.gauss(92, 4)]),
+            release_spin_rate=rng.gauss(2300, 200),
+            pfx_x=rng.gauss(0, 8),
+            pfx_z=rng.gauss(8, 6),
+            type=rng.choice(["S", "B", "X"]),
+            pitch_name="Slider",
+            at_bat_number=1 + i // 4,
+            pitch_number=1 + i % 4,
+            flags=compute_flags(**values),
+            **values,
+        ))
+    db.commit()
+    db.close()
+
+    snapshot = analytics.DuckDBSnapshot(tmp / "analytics.duckdb")
+    assert analytics.build_snapshot(engine, snapshot.path) == 8000
+
+    yield SessionLocal, snapshot
+
+    snapshot.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def fetch(backends, monkeypatch):
+    """GET an endpoint on both backends, returning (sqlalchemy, duckdb) JSON."""
+    SessionLocal, snapshot = backends
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    monkeypatch.setattr(analytics, "duckdb_snapshot", snapshot)
+    client = TestClient(app)
+
+    def _fetch(url):
+        results = []
+        for backend in ["sqlalchemy", "duckdb"]:
+            monkeypatch.setattr(settings, "analytics_backend", backend)
+            response = client.get(url)
+            assert response.status_code == 200, response.text
+            results.append(response.json())
+        return results
+
+    yield _fetch
+    app.dependency_overrides.clear()
+
+
+def assert_same(left, right):
+    """Compare JSON payloads, allowing float rounding differences."""
+    if isinstance(left, dict):
+        assert left.keys() == right.keys()
+        for key in left:
+            assert_same(left[key], right[key])
+    elif isinstance(left, list):
+        assert len(left) == len(right)
+        for a, b in zip(left, right):
+            assert_same(a, b)
+    elif isinstance(left, float) or isinstance(right, float):
+        assert left == pytest.approx(right, abs=0.11)
+    else:
+        assert left == right
+
+
+class TestAnalyticsParity:
+    """The DuckDB snapshot must return what the SQLAlchemy path returns."""
+
+    # strikeout_pct uses concat(), which SQLite only has from 3.44
+    @pytest.mark.parametrize("stat", [
+        "velocity", "max_velocity", "spin_rate", "whiff_pct",
+        "h_movement", "v_movement", "strike_pct",
+    ])
+    @pytest.mark.parametrize("query", ["", "&is_starter=true", "&year=2023"])
+    def test_leaderboards(self, fetch, stat, query):
+        sql, duck = fetch(f"/api/leaderboards?stat={stat}&min_pitches=100&limit=10{query}")
+        assert sql["entries"]
+        # Tied pitchers can swap ranks, so compare the ranked values, then entries by pitcher
+        assert_same([e["value"] for e in sql["entries"]], [e["value"] for e in duck["entries"]])
+
+        def by_id(payload):
+            entries = [{k: v for k, v in e.items() if k != "rank"} for e in payload["entries"]]
+            return {**payload, "entries": sorted(entries, key=lambda e: e["pitcher_id"])}
+
+        assert_same(by_id(sql), by_id(duck))
+
+    @pytest.mark.parametrize("pitcher_id", [1, 4, 8])
+    @pytest.mark.parametrize("year", ["", "?year=2023"])
+    def test_pitcher_stats(self, fetch, pitcher_id, year):
+        sql, duck = fetch(f"/api/pitchers/{pitcher_id}/stats{year}")
+        assert_same(sql, duck)
+
+    @pytest.mark.parametrize("year", [2023, 2024])
+    def test_season_aggregation(self, backends, year):
+        SessionLocal, snapshot = backends
+        db = SessionLocal()
+        try:
+            sql = aggregate_statcast_stats(db, year, analytics.Analytics(db))
+            duck = aggregate_statcast_stats(db, year, analytics.Analytics(db, snapshot))
+        finally:
+            db.close()
+        assert sql.keys() == duck.keys()
+        for pitcher_id in sql:
+            for key, value in sql[pitcher_id].items():
+                assert duck[pitcher_id][key] == pytest.approx(value), key
+
+    def test_falls_back_without_snapshot(self, tmp_path, backends):
+        SessionLocal, _ = backends
+        db = SessionLocal()
+        try:
+            missing = analytics.DuckDBSnapshot(tmp_path / "missing.duckdb")
+            assert analytics.Analytics(db, missing).backend == "sqlalchemy"
+        finally:
+            db.close()
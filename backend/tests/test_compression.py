@@ -0,0 +1,142 @@
+"""Tests for br/gzip response compression."""
+
+import gzip
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core import compression, http_cache
+from app.core.compression import CompressedBodyCache, CompressionMiddleware, negotiate_encoding
+from app.core.database import Base, get_db, get_read_db
+from app.core.http_cache import DataVersion
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client with one pitcher and a page of pitches."""
+    monkeypatch.setattr(http_cache, "data_version", DataVersion(tmp_path / "data_version"))
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Pitcher(id=1, mlbam_id=543037, name="Gerrit Cole", team="NYY", throws="R", is_starter=True, is_active=True))
+    for i in range(100):
+        db.add(Pitch(
+            pitcher_id=1, game_pk=7000, game_date=date(2024, 6, 1), game_year=2024,
+            pitch_type="FF" if i % 2 else "SL", pitch_name="4-Seam Fastball" if i % 2 else "Slider",
+            release_speed=95.0, description="swinging_strike", pitch_number=1 + i % 3,
+        ))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+def raw_get(client, url, accept_encoding, **headers):
+    """GET without letting the client decode the body."""
+    with client.stream("GET", url, headers={"Accept-Encoding": accept_encoding, **headers}) as response:
+        response.raw_body = b"".join(response.iter_raw())
+    return response
+
+
+class TestNegotiation:
+    def test_prefers_brotli(self):
+        assert negotiate_encoding("gzip, deflate, br") == ("br" if compression.brotli else "gzip")
+
+    def test_quality_values(self):
+        assert negotiate_encoding("br;q=0, gzip") == "gzip"
+        assert negotiate_encoding("gzip;q=0") is None
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding(None) is None
+
+
+class TestCompressedBodyCache:
+    def test_evicts_least_recently_used(self):
+        cache = CompressedBodyCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.size == 8
+
+
+class TestMiddleware:
+    def test_large_json_is_compressed(self, client):
+        plain = raw_get(client, "/api/pitchers/1/pitches", "identity")
+        response = raw_get(client, "/api/pitchers/1/pitches", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert int(response.headers["content-length"]) == len(response.raw_body)
+        assert gzip.decompress(response.raw_body) == plain.raw_body
+        assert len(response.raw_body) * 5 < len(plain.raw_body)
+
+    def test_small_bodies_are_not_compressed(self, client):
+        response = raw_get(client, "/health", "gzip")
+        assert "content-encoding" not in response.headers
+        assert response.raw_body == b'{"status":"healthy","service":"vibe-coded-baseball-api"}'
+
+    def test_identity_keeps_strong_etag(self, client):
+        response = raw_get(client, "/api/pitchers/1/pitches", "identity")
+        assert "content-encoding" not in response.headers
+        assert response.headers["etag"].startswith('"')
+        assert "accept-encoding" in response.headers["vary"].lower()
+
+    def test_weak_etag_revalidates(self, client):
+        etag = raw_get(client, "/api/pitchers/1/pitches", "gzip").headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = raw_get(client, "/api/pitchers/1/pitches", "gzip", **{"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_cached_responses_are_compressed_once(self, monkeypatch):
+        """Bodies with an ETag are compressed at the high level, once."""
+        calls = []
+        original = compression.compress
+
+        def counting_compress(*args):
+            calls.append(args[1:])
+            return original(*args)
+
+        monkeypatch.setattr(compression, "compress", counting_compress)
+        rows = [{"pitch_type": "FF", "description": "ball"}] * 200
+        inner = FastAPI()
+        inner.get("/cached")(lambda: JSONResponse(rows, headers={"etag": '"1"'}))
+        inner.get("/uncached")(lambda: JSONResponse(rows))
+        client = TestClient(CompressionMiddleware(inner))
+
+        first = raw_get(client, "/cached", "gzip").raw_body
+        assert raw_get(client, "/cached", "gzip").raw_body == first
+        raw_get(client, "/uncached", "gzip")
+        raw_get(client, "/uncached", "gzip")
+
+        fast, cached = compression.LEVELS["gzip"]
+        assert calls == [("gzip", cached), ("gzip", fast), ("gzip", fast)]
@@ -0,0 +1,87 @@
+"""A slow request must not hold up the rest of the worker.
+
+Route handlers that do blocking database or NumPy work are plain `def`
+functions, which FastAPI runs in its threadpool; only handlers that never
+block stay `async def` on the event loop.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core import http_cache
+from app.core.database import Base, get_db, get_read_db
+from app.core.http_cache import DataVersion
+from app.models.pitcher import Pitcher
+from app.services.correlation_service import CorrelationService
+
+SLOW_SECONDS = 1.0
+
+
+@pytest.fixture
+def slow_discover(tmp_path, monkeypatch):
+    """App whose /discover/predictive takes SLOW_SECONDS of blocking work."""
+    monkeypatch.setattr(http_cache, "data_version", DataVersion(tmp_path / "data_version"))
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Pitcher(id=1, mlbam_id=543037, name="Gerrit Cole", team="NYY", throws="R", is_starter=True, is_active=True))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def slow_rankings(self, *args, **kwargs):
+        time.sleep(SLOW_SECONDS)
+        return []
+
+    monkeypatch.setattr(CorrelationService, "get_all_predictive_rankings", slow_rankings)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    yield app
+
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+def test_slow_discover_does_not_stall_other_routes(slow_discover):
+    async def finished_at(client, url, delay=0.0):
+        await asyncio.sleep(delay)
+        response = await client.get(url)
+        return response.status_code, time.perf_counter() - start
+
+    async def run():
+        transport = httpx.ASGITransport(app=slow_discover)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Fire the fast requests while the slow one is in progress
+            return await asyncio.gather(
+                finished_at(client, "/api/discover/predictive"),
+                finished_at(client, "/health", delay=0.1),
+                finished_at(client, "/api/leaderboards?stat=velocity", delay=0.1),
+                finished_at(client, "/api/pitchers/1", delay=0.1),
+            )
+
+    start = time.perf_counter()
+    (slow_status, slow_done), *fast = asyncio.run(run())
+
+    assert slow_status == 200
+    assert slow_done >= SLOW_SECONDS
+    for status, done in fast:
+        assert status == 200
+        assert done < SLOW_SECONDS / 2
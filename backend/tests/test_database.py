@@ -0,0 +1,237 @@
+"""Tests for database engine configuration and pitch storage (profiles, codes, flags)."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.core import http_cache
+from app.core.database import Base, create_db_engine, create_tables, read_only_url
+from app.models.codes import (
+    CodedString, UnknownCodeError, DESCRIPTIONS, EVENTS, NON_PA_EVENTS, SWING_DESCRIPTIONS, WHIFF_DESCRIPTIONS,
+)
+from app.models.flags import PitchFlag, compute_flags, count_flag, refresh_pitch_flags
+from app.models.partitions import ensure_year_partitions, partition_ddl, partitioned_pitches_table
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+from app.models.season_stats import SeasonStats
+from app.services import game_log
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    """URL of a fresh file-backed SQLite database with one table."""
+    url = f"sqlite:///{(tmp_path / 'test.db').as_posix()}"
+    writer = create_db_engine(url)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+    yield url
+    writer.dispose()
+
+
+class TestSqliteProfiles:
+    """Test PRAGMAs applied to new SQLite connections."""
+
+    def test_default_profile(self, sqlite_url):
+        """API connections should use WAL with relaxed fsyncs."""
+        engine = create_db_engine(sqlite_url)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        engine.dispose()
+
+    def test_bulk_profile(self, sqlite_url):
+        """Loader connections should skip fsyncs and use a bigger cache."""
+        engine = create_db_engine(sqlite_url, profile="bulk")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 0  # OFF
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -512 * 1024
+        engine.dispose()
+
+
+class TestReadOnlyEngine:
+    """Test the read-only engine used by GET routes."""
+
+    def test_read_only_url(self):
+        """File SQLite URLs become mode=ro URIs; others are unchanged."""
+        assert read_only_url("sqlite:////data/baseball.db") == (
+            "sqlite:///file:/data/baseball.db?mode=ro&uri=true"
+        )
+        assert read_only_url("sqlite:///:memory:") == "sqlite:///:memory:"
+        assert read_only_url("postgresql://u:p@db/x") == "postgresql://u:p@db/x"
+
+    def test_reads_allowed_writes_rejected(self, sqlite_url):
+        """Read engine should see data but refuse to modify it."""
+        engine = create_db_engine(read_only_url(sqlite_url), profile="read")
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO t VALUES (2)"))
+        engine.dispose()
+
+
+class TestPitchCodes:
+    """Test dictionary encoding of categorical pitch columns."""
+
+    def test_round_trip(self):
+        """Known values encode to codes and decode back."""
+        coded = CodedString(DESCRIPTIONS)
+        for value in DESCRIPTIONS:
+            assert coded.decode(coded.encode(value)) == value
+        assert coded.encode(None) is None
+
+    def test_unknown_values(self):
+        """Unknown values can't be written; out-of-range codes read as None."""
+        coded = CodedString(DESCRIPTIONS)
+        with pytest.raises(UnknownCodeError):
+            coded.encode("not_a_description")
+        assert coded.unknown(["ball", None, "not_a_description"]) == ["not_a_description"]
+        assert coded.decode(len(DESCRIPTIONS) + 1) is None
+
+    def test_loader_refuses_unknown_values(self):
+        """A batch with new values fails before anything is written."""
+        import pandas as pd
+
+        from scripts.load_statcast import check_codes
+
+        check_codes(pd.DataFrame({"description": ["ball", None], "events": [None, "single"]}))
+        with pytest.raises(UnknownCodeError, match="events: robo_out"):
+            check_codes(pd.DataFrame({"description": ["ball", "ball"], "events": ["robo_out", None]}))
+
+    def test_aggregation_values_are_encodable(self):
+        """Every value used in an aggregation predicate must be in a vocabulary."""
+        assert set(WHIFF_DESCRIPTIONS) <= set(SWING_DESCRIPTIONS) <= set(DESCRIPTIONS)
+        used_events = (
+            set(game_log.OUTS_BY_EVENT) | set(game_log.HIT_EVENTS) | set(game_log.WALK_EVENTS)
+            | set(game_log.STRIKEOUT_EVENTS) | set(NON_PA_EVENTS) | {"hit_by_pitch"}
+        )
+        assert used_events <= set(EVENTS)
+
+
+class TestPitchFlags:
+    """Test outcome flags derived at ingest."""
+
+    SAMPLES = [
+        # description, zone, balls, strikes, events, pitch_type
+        ("swinging_strike", 5, 0, 0, None, "FF"),
+        ("swinging_strike_blocked", 13, 1, 2, "strikeout", "SL"),
+        ("called_strike", 1, 0, 0, None, "SI"),
+        ("foul", 12, 2, 1, None, "CU"),
+        ("hit_into_play", 9, 3, 2, "single", "CH"),
+        ("ball", 11, 3, 1, "walk", None),
+        ("ball", None, None, None, "wild_pitch", "KC"),
+    ]
+
+    def test_compute_flags(self):
+        """Flags should follow the description, zone, count and event rules."""
+        whiff = compute_flags("swinging_strike_blocked", 13, 1, 2, "strikeout", "SL")
+        assert whiff == PitchFlag.SWING | PitchFlag.WHIFF | PitchFlag.OUT_OF_ZONE | PitchFlag.PA_END | PitchFlag.BREAKING
+
+        called = compute_flags("called_strike", 1, 0, 0, None, "SI")
+        assert called == PitchFlag.CALLED_STRIKE | PitchFlag.IN_ZONE | PitchFlag.FIRST_PITCH | PitchFlag.FASTBALL
+
+        # Swings are the leaderboard's whiff% denominator: no bunt attempts
+        # other than foul bunts, and in-play descriptions only as hit_into_play
+        for description in ["bunt_foul_tip", "missed_bunt", "hit_into_play_no_out", "hit_into_play_score"]:
+            assert not compute_flags(description, 5, 1, 1, None, "FF") & PitchFlag.SWING
+
+        # Runner events don't end the plate appearance
+        assert not compute_flags("ball", None, None, None, "wild_pitch", "KC") & PitchFlag.PA_END
+
+    def test_sql_backfill_matches_loader(self):
+        """refresh_pitch_flags must produce the same bits as compute_flags."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            for i, sample in enumerate(self.SAMPLES):
+                description, zone, balls, strikes, events, pitch_type = sample
+                db.add(Pitch(
+                    game_pk=1, game_date=date(2024, 4, 1), game_year=2024, pitch_number=i,
+                    description=description, zone=zone, balls=balls, strikes=strikes,
+                    events=events, pitch_type=pitch_type,
+                ))
+            db.commit()
+
+            assert refresh_pitch_flags(db) == len(self.SAMPLES)
+            stored = [flags for (flags,) in db.query(Pitch.flags).order_by(Pitch.pitch_number)]
+            assert stored == [compute_flags(*sample) for sample in self.SAMPLES]
+
+            csw = db.query(count_flag(PitchFlag.CALLED_STRIKE | PitchFlag.WHIFF, any_bit=True)).scalar()
+            chases = db.query(count_flag(PitchFlag.SWING | PitchFlag.OUT_OF_ZONE)).scalar()
+            assert (csw, chases) == (3, 2)
+        engine.dispose()
+
+    def test_h_movement_breaking_types(self, tmp_path, monkeypatch):
+        """h_movement averages SL, CU, KC and SV; other types are ignored."""
+        from scripts.populate_season_stats import populate_season_stats
+
+        monkeypatch.setattr(http_cache, "data_version", http_cache.DataVersion(tmp_path / "data_version"))
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add(Pitcher(id=1, mlbam_id=543037, name="Cole, Gerrit", is_active=True))
+            for i, (pitch_type, pfx_x) in enumerate([
+                ("SL", 1.0), ("CU", 2.0), ("KC", 3.0), ("SV", 6.0), ("CB", 50.0), ("ST", 50.0), ("FF", 50.0),
+            ]):
+                db.add(Pitch(
+                    pitcher_id=1, game_pk=1, game_date=date(2024, 4, 1), game_year=2024, pitch_number=i,
+                    pitch_type=pitch_type, pfx_x=pfx_x, flags=compute_flags(None, None, 1, 1, None, pitch_type),
+                ))
+            db.commit()
+
+            populate_season_stats(db)
+            assert db.query(SeasonStats.h_movement).scalar() == 3.0
+        engine.dispose()
+
+
+class TestPitchesPartitioning:
+    """Test the PostgreSQL year-partitioned pitches layout."""
+
+    def test_postgres_ddl(self):
+        """The parent table is range-partitioned with game_year in the primary key."""
+        ddl = str(CreateTable(partitioned_pitches_table()).compile(dialect=postgresql.dialect()))
+        assert "PARTITION BY RANGE (game_year)" in ddl
+        assert "PRIMARY KEY (id, game_year)" in ddl
+        assert "id SERIAL" in ddl
+        # The ORM model itself is untouched
+        assert list(Pitch.__table__.primary_key.columns.keys()) == ["id"]
+
+    def test_partition_ddl(self):
+        assert partition_ddl(2024) == (
+            "CREATE TABLE IF NOT EXISTS pitches_y2024 PARTITION OF pitches "
+            "FOR VALUES FROM (2024) TO (2025)"
+        )
+
+    def test_sqlite_keeps_single_table(self):
+        """SQLite gets the plain table and indexes; partition upkeep is a no-op."""
+        engine = create_engine("sqlite://")
+        create_tables(engine)
+        inspector = inspect(engine)
+        assert {"pitchers", "pitches", "pitcher_games"} <= set(inspector.get_table_names())
+        indexes = {index["name"] for index in inspector.get_indexes("pitches")}
+        assert {index.name for index in Pitch.__table__.indexes} <= indexes
+        ensure_year_partitions(engine, [2024])
+        engine.dispose()
+
+
+def test_pool_metrics_endpoint():
+    """Should report metrics for both the read and write pools."""
+    response = TestClient(app).get("/api/stats/pools")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert set(data) == {"read", "write"}
+    assert {"pool", "connects", "checkouts", "checkins"} <= set(data["read"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
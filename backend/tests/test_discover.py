@@ -1,5 +1,7 @@
 """Tests for discover (statistical analysis) endpoints using SQLite and mock data."""
 
+import random
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -7,9 +9,12 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_read_db
 from app.models.pitcher import Pitcher
 from app.models.season_stats import SeasonStats
+from app.models.stat_moments import StatMoments
+from app.services.correlation_service import CorrelationService
+from app.services.stat_moments import MOMENT_STATS, moment_fits, refresh_stat_moments
 
 
 @pytest.fixture(scope="function")
@@ -32,6 +37,7 @@ def client():
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     # Create tables
     Base.metadata.create_all(bind=engine)
@@ -213,6 +219,18 @@ class TestCorrelations:
         # We have 3 starters in mock data
         assert data["sample_size"] <= 6  # 3 starters * 2 years max
 
+    def test_without_scatter_data(self, client):
+        """Should compute the fit without returning scatter points."""
+        response = client.get(
+            "/api/discover/correlations?stat_x=k_per_9&stat_y=era&min_innings=50&include_scatter=false"
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["scatter_data"] == []
+        assert data["sample_size"] > 0
+        assert "y = " in data["regression"]["equation"]
+
     def test_filter_by_year(self, client):
         """Should filter to specific year."""
         response = client.get(
@@ -333,5 +351,93 @@ class TestTrends:
         assert data["trend_direction"] in ["increasing", "decreasing", "stable"]
 
 
+@pytest.fixture(scope="module")
+def moments_db():
+    """Session on random season stats (some missing) for 120 pitchers, with stat_moments built."""
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    rng = random.Random(40)
+    for pitcher_id in range(1, 121):
+        db.add(Pitcher(
+            id=pitcher_id, mlbam_id=100000 + pitcher_id, name=f"Pitcher {pitcher_id}",
+            is_starter=[True, False, None][pitcher_id % 3], is_active=True,
+        ))
+        for year in range(2022, 2025):
+            values = {stat: rng.gauss(50, 15) for stat in MOMENT_STATS if rng.random() > 0.1}
+            values["innings_pitched"] = rng.choice([None, rng.uniform(5, 220)])
+            db.add(SeasonStats(pitcher_id=pitcher_id, year=year, **values))
+    db.commit()
+    refresh_stat_moments(db)
+
+    yield db
+
+    db.close()
+    engine.dispose()
+
+
+class TestStatMoments:
+    """Correlations summed from stat_moments must match a scan of season_stats."""
+
+    @pytest.mark.parametrize("year", [None, 2023])
+    @pytest.mark.parametrize("is_starter", [None, True, False])
+    @pytest.mark.parametrize("min_innings", [0, 50, 120])
+    def test_correlation_matches_scan(self, moments_db, year, is_starter, min_innings):
+        service = CorrelationService(moments_db)
+        scan = service.compute_correlation("whiff_pct", "era", year, is_starter, min_innings)
+        moments = service.compute_correlation(
+            "whiff_pct", "era", year, is_starter, min_innings, include_scatter=False
+        )
+        assert moments["scatter_data"] == []
+        assert {**moments, "scatter_data": None} == pytest.approx({**scan, "scatter_data": None}, abs=1e-4)
+
+    def test_swapped_pair(self, moments_db):
+        service = CorrelationService(moments_db)
+        scan = service.compute_correlation("era", "avg_velocity")
+        moments = service.compute_correlation("era", "avg_velocity", include_scatter=False)
+        assert (moments["slope"], moments["intercept"]) == pytest.approx((scan["slope"], scan["intercept"]), abs=1e-4)
+
+    def test_trend_and_rankings_match_scan(self, moments_db):
+        service = CorrelationService(moments_db)
+        trend = service.compute_trend("k_per_9", "whip", min_innings=20, start_year=2021, end_year=2024)
+        assert [point["year"] for point in trend] == [2022, 2023, 2024]
+        for point in trend:
+            scan = service.compute_correlation("k_per_9", "whip", point["year"], min_innings=20)
+            assert (point["correlation_r"], point["sample_size"]) == (scan["correlation_r"], scan["sample_size"])
+
+        rankings = service.get_correlation_rankings("era", is_starter=True)
+        assert len(rankings) == len(MOMENT_STATS) - 1
+        for entry in rankings:
+            scan = service.compute_correlation(entry["stat"], "era", is_starter=True)
+            assert entry["correlation_r"] == pytest.approx(scan["correlation_r"], abs=1e-4)
+
+    def test_only_bucketed_filters_use_moments(self, moments_db):
+        """min_innings between bucket boundaries can't be answered from moments."""
+        service = CorrelationService(moments_db)
+        # Zero the cross products so answers from moments are recognisable
+        moments_db.query(StatMoments).update({StatMoments.sum_xy: 0.0})
+        try:
+            for min_innings in [50, 55]:
+                scan = service.compute_correlation("whiff_pct", "era", min_innings=min_innings)
+                moments = service.compute_correlation(
+                    "whiff_pct", "era", min_innings=min_innings, include_scatter=False
+                )
+                assert (moments == {**scan, "scatter_data": []}) == (min_innings == 55)
+        finally:
+            moments_db.rollback()
+
+    def test_empty_moments_fall_back_to_scan(self, moments_db):
+        """Migration 0007 leaves stat_moments empty until the stats scripts run."""
+        service = CorrelationService(moments_db)
+        scan = service.compute_correlation("whiff_pct", "era")
+        moments_db.query(StatMoments).delete()
+        try:
+            assert moment_fits(moments_db, [("whiff_pct", "era")]) is None
+            fallback = service.compute_correlation("whiff_pct", "era", include_scatter=False)
+            assert {**fallback, "scatter_data": None} == {**scan, "scatter_data": None}
+        finally:
+            moments_db.rollback()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+"""Tests for ETag / Cache-Control handling keyed on the data version."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core import http_cache
+from app.core.database import Base, get_db, get_read_db
+from app.core.http_cache import DatabaseDataVersion, DataVersion, compute_etag, etag_matches
+from app.models.pitcher import Pitcher
+
+
+@pytest.fixture
+def version(tmp_path, monkeypatch):
+    version = DataVersion(tmp_path / "data_version")
+    monkeypatch.setattr(http_cache, "data_version", version)
+    return version
+
+
+@pytest.fixture
+def client(version):
+    """Test client whose database sessions are counted."""
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Pitcher(id=1, mlbam_id=543037, name="Gerrit Cole", team="NYY", throws="R", is_starter=True, is_active=True))
+    db.commit()
+    db.close()
+
+    sessions = []
+
+    def override_get_db():
+        sessions.append(1)
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    client = TestClient(app)
+    client.sessions = sessions
+
+    yield client
+
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+class TestDataVersion:
+    def test_missing_file_is_version_zero(self, version):
+        assert version.current() == 0
+
+    def test_bump_changes_version(self, version):
+        first = version.bump()
+        assert version.current() == first
+        second = version.bump()
+        assert second > first
+        assert version.current() == second
+
+    def test_other_process_bump_is_seen(self, version):
+        """Workers notice bumps written by a loader's own DataVersion."""
+        version.current()
+        bumped = DataVersion(version.path).bump()
+        assert version.current() == bumped
+
+
+class TestDatabaseDataVersion:
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine(
+            "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+
+    def test_bump_is_seen_by_other_workers(self, engine):
+        """A loader's bump reaches an API worker through the database."""
+        worker = DatabaseDataVersion(engine, check_seconds=0)
+        assert worker.current() == 0
+
+        bumped = DatabaseDataVersion(engine).bump()
+        assert bumped > 0
+        assert worker.current() == bumped
+        assert DatabaseDataVersion(engine).bump() > bumped
+
+    def test_reads_are_throttled(self, engine):
+        worker = DatabaseDataVersion(engine, check_seconds=3600)
+        assert worker.current() == 0 and worker.is_fresh()
+
+        DatabaseDataVersion(engine).bump()
+        assert worker.current() == 0
+
+    def test_unmigrated_database_is_version_zero(self):
+        engine = create_engine("sqlite:///:memory:")
+        assert DatabaseDataVersion(engine, check_seconds=0).current() == 0
+        engine.dispose()
+
+
+class TestETags:
+    def test_query_order_does_not_matter(self):
+        assert compute_etag(1, "/api/x", "a=1&b=2") == compute_etag(1, "/api/x", "b=2&a=1")
+        assert compute_etag(1, "/api/x", "a=1") != compute_etag(1, "/api/x", "a=2")
+        assert compute_etag(1, "/api/x", "a=1") != compute_etag(2, "/api/x", "a=1")
+
+    def test_build_changes_etag(self):
+        """A deploy that may change response shapes must not answer 304 to old bodies."""
+        assert compute_etag(1, "/api/x", "a=1", "build1") != compute_etag(1, "/api/x", "a=1", "build2")
+
+    def test_if_none_match_parsing(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+
+
+class TestMiddleware:
+    def test_sets_etag_and_cache_control(self, client):
+        response = client.get("/api/pitchers/1")
+        assert response.status_code == 200
+        assert response.headers["etag"].removeprefix("W/").startswith('"')
+        assert "stale-while-revalidate" in response.headers["cache-control"]
+
+    def test_per_router_policy(self, client):
+        leaderboard = client.get("/api/leaderboards/stats").headers["cache-control"]
+        discover = client.get("/api/discover/stats").headers["cache-control"]
+        search = client.get("/api/pitchers/search?q=cole").headers["cache-control"]
+        assert "max-age=300" in leaderboard
+        assert "max-age=3600" in discover
+        assert "max-age=60," in search
+
+    def test_not_modified_skips_database(self, client):
+        etag = client.get("/api/pitchers/1").headers["etag"]
+        assert len(client.sessions) == 1
+
+        response = client.get("/api/pitchers/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert len(client.sessions) == 1
+
+    def test_bump_invalidates(self, client, version):
+        etag = client.get("/api/pitchers/1").headers["etag"]
+        version.bump()
+
+        response = client.get("/api/pitchers/1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_errors_and_uncached_paths_have_no_etag(self, client):
+        assert "etag" not in client.get("/api/pitchers/999").headers
+        assert "etag" not in client.get("/health").headers
+        assert "etag" not in client.get("/api/stats/pools").headers
@@ -8,9 +8,10 @@ from sqlalchemy.pool import StaticPool
 from datetime import date
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_read_db
 from app.models.pitcher import Pitcher
 from app.models.pitch import Pitch
+from app.models.flags import refresh_pitch_flags
 
 
 @pytest.fixture(scope="function")
@@ -33,6 +34,7 @@ def client():
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     # Create tables
     Base.metadata.create_all(bind=engine)
@@ -100,6 +102,7 @@ def client():
             db.add(pitch)
 
     db.commit()
+    refresh_pitch_flags(db)
     db.close()
 
     yield TestClient(app)
@@ -220,6 +223,16 @@ class TestLeaderboardRankings:
         assert data["stat"] == "h_movement"
         assert data["unit"] == "in"
 
+    def test_strikeout_pct(self, client):
+        """Should count plate appearances by game and at-bat (portable SQL)."""
+        response = client.get("/api/leaderboards?stat=strikeout_pct&limit=10&min_pitches=100")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["stat"] == "strikeout_pct"
+        assert len(data["entries"]) == 5
+        assert all(entry["value"] == 0 for entry in data["entries"])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,146 @@
+"""Tests for per-request metrics, Server-Timing and /metrics."""
+
+import re
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core import http_cache, metrics
+from app.core.database import Base, get_db, get_read_db
+from app.core.http_cache import DataVersion
+from app.core.metrics import Histogram, RequestStats, record_query, registry
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client with one pitcher and 30 pitches."""
+    monkeypatch.setattr(http_cache, "data_version", DataVersion(tmp_path / "data_version"))
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Pitcher(id=1, mlbam_id=543037, name="Gerrit Cole", team="NYY", throws="R", is_starter=True, is_active=True))
+    for i in range(30):
+        db.add(Pitch(
+            pitcher_id=1, game_pk=7000, game_date=date(2024, 6, 1), game_year=2024,
+            pitch_type="FF", release_speed=95.0, description="ball", pitch_number=1 + i % 3,
+        ))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    registry.reset()
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+    registry.reset()
+    engine.dispose()
+
+
+def parse_server_timing(header: str) -> dict:
+    timing = re.match(r'app;dur=([\d.]+), db;dur=([\d.]+);desc="(\d+) queries, (\d+) rows"', header)
+    assert timing, header
+    app_ms, db_ms, queries, rows = timing.groups()
+    return {"app": float(app_ms), "db": float(db_ms), "queries": int(queries), "rows": int(rows)}
+
+
+class TestServerTiming:
+    def test_counts_queries_and_rows(self, client):
+        response = client.get("/api/pitchers/1/pitches?page_size=100")
+        timing = parse_server_timing(response.headers["server-timing"])
+
+        assert response.json()["total"] == 30
+        assert timing["queries"] >= 2  # count + page
+        assert timing["rows"] >= 30
+        assert 0 < timing["db"] <= timing["app"]
+
+    def test_not_modified_does_no_database_work(self, client):
+        etag = client.get("/api/pitchers/1").headers["etag"]
+        response = client.get("/api/pitchers/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        timing = parse_server_timing(response.headers["server-timing"])
+        assert timing["queries"] == 0 and timing["rows"] == 0
+
+    def test_requests_are_counted_separately(self, client):
+        first = parse_server_timing(client.get("/api/pitchers/1").headers["server-timing"])
+        second = parse_server_timing(client.get("/api/pitchers/1?x=1").headers["server-timing"])
+        assert first["queries"] == second["queries"]
+
+
+class TestRowCounting:
+    @pytest.fixture
+    def stats(self):
+        stats = RequestStats()
+        token = metrics._current.set(stats)
+        yield stats
+        metrics._current.reset(token)
+
+    def test_counts_rows_as_fetched(self, stats):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add_all(Pitcher(id=i, mlbam_id=i, name=f"Pitcher {i}") for i in range(1, 26))
+            db.commit()
+            stats.rows = 0
+
+            assert len(db.scalars(select(Pitcher)).all()) == 25
+            assert stats.rows == 25
+
+            # Streamed and partially read results count what was fetched
+            assert sum(1 for _ in db.execute(select(Pitcher).execution_options(yield_per=10))) == 25
+            assert stats.rows == 50
+            assert db.execute(text("SELECT id FROM pitchers")).first() is not None
+            assert stats.rows == 51
+        engine.dispose()
+
+
+class TestMetricsEndpoint:
+    def test_histograms_by_route_template(self, client):
+        client.get("/api/pitchers/1")
+        client.get("/api/pitchers/2")  # 404, same route
+
+        text = client.get("/metrics").text
+        assert "# TYPE api_request_duration_seconds histogram" in text
+        assert 'api_db_statements_count{method="GET",route="/api/pitchers/{pitcher_id}",status="200"} 1' in text
+        assert 'api_db_statements_count{method="GET",route="/api/pitchers/{pitcher_id}",status="404"} 1' in text
+
+    def test_record_query_outside_request_is_ignored(self):
+        record_query(0.5, rows=10)  # no request in progress
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        histogram = Histogram("h", "Test.", (1, 5))
+        for value in [0, 1, 3, 9]:
+            histogram.observe(("GET",), value)
+
+        lines = histogram.render(("method",))
+        assert 'h_bucket{method="GET",le="1"} 2' in lines
+        assert 'h_bucket{method="GET",le="5"} 3' in lines
+        assert 'h_bucket{method="GET",le="+Inf"} 4' in lines
+        assert 'h_sum{method="GET"} 13.0' in lines
+        assert 'h_count{method="GET"} 4' in lines
+
+    def test_request_stats_start_empty(self):
+        stats = RequestStats()
+        assert (stats.statements, stats.db_seconds, stats.rows) == (0, 0.0, 0)
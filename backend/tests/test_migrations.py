@@ -0,0 +1,101 @@
+"""Tests for the Alembic migrations (fresh databases and pre-Alembic upgrades)."""
+
+from datetime import date
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, run_migrations
+from app.models.flags import PitchFlag, compute_flags
+from app.models.pitch import Pitch
+from app.models.pitcher_game import PitcherGame
+from app.services.game_log import build_game_lines
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{(tmp_path / 'migrate.db').as_posix()}")
+    yield engine
+    engine.dispose()
+
+
+def test_fresh_database_matches_models(engine):
+    """upgrade head on an empty database builds exactly the model schema."""
+    run_migrations(bind=engine)
+    with engine.connect() as conn:
+        diffs = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    assert diffs == []
+
+
+def test_upgrades_pre_migration_database(engine):
+    """A database built by the old create_all() is upgraded in place, with its data."""
+    run_migrations("0001_baseline", bind=engine)
+    with engine.begin() as conn:
+        # Old databases have the tables but no version stamp
+        conn.execute(text("DROP TABLE alembic_version"))
+        conn.execute(text(
+            "INSERT INTO pitchers (id, mlbam_id, name, is_starter, is_active) "
+            "VALUES (1, 543037, 'Cole, Gerrit', 1, 1)"
+        ))
+        for number, (description, events) in enumerate([
+            ("called_strike", None), ("swinging_strike", None), ("swinging_strike", "strikeout"),
+        ], start=1):
+            conn.execute(text(
+                "INSERT INTO pitches (pitcher_id, game_pk, game_date, game_year, pitch_type, "
+                "pitch_name, balls, strikes, zone, description, events, pitch_number, type) "
+                "VALUES (1, 700001, '2024-04-01', 2024, 'FF', '4-Seam Fastball', 0, :strikes, 5, "
+                ":description, :events, :number, 'S')"
+            ), {"strikes": number - 1, "description": description, "events": events, "number": number})
+
+    run_migrations(bind=engine)
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("pitches")}
+    assert {index.name for index in Pitch.__table__.indexes} <= indexes
+    assert "ix_pitches_pitcher_mlbam_id" not in indexes
+
+    with Session(engine) as db:
+        pitches = db.query(Pitch).order_by(Pitch.pitch_number).all()
+        assert [p.description for p in pitches] == ["called_strike", "swinging_strike", "swinging_strike"]
+        assert pitches[0].pitch_name == "4-Seam Fastball"
+        assert pitches[0].flags & PitchFlag.FIRST_PITCH
+        assert pitches[2].flags & PitchFlag.WHIFF and pitches[2].flags & PitchFlag.PA_END
+
+        game = db.query(PitcherGame).one()
+        assert (game.game_date, game.total_pitches, game.whiffs, game.strikeouts) == (date(2024, 4, 1), 3, 2, 1)
+
+        # The revision's frozen backfills still agree with the live rules
+        assert [p.flags for p in pitches] == [
+            compute_flags(p.description, p.zone, p.balls, p.strikes, p.events, p.pitch_type) for p in pitches
+        ]
+        [line] = build_game_lines(db)
+        assert {name: getattr(game, name) for name in line} == line
+
+    with engine.connect() as conn:
+        assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+
+
+def test_code_upgrade_refuses_unknown_values(engine):
+    """Values missing from a vocabulary stop the upgrade instead of becoming NULL."""
+    run_migrations("0003_pitch_index_plan", bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO pitches (game_pk, game_date, game_year, description, pitch_number) "
+            "VALUES (700001, '2024-04-01', 2024, 'robo_strike', 1)"
+        ))
+
+    with pytest.raises(RuntimeError, match="description: robo_strike"):
+        run_migrations(bind=engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT description FROM pitches")).scalar() == "robo_strike"
+
+
+def test_upgrade_is_repeatable(engine):
+    """Running upgrade head again is a no-op."""
+    run_migrations(bind=engine)
+    run_migrations(bind=engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT version_num FROM alembic_version")).scalar() == "0008_data_version"
@@ -0,0 +1,344 @@
+"""Tests for pitcher endpoints using SQLite and mock data."""
+
+import json
+import sys
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from datetime import date
+
+from app.main import app
+from app.core.config import settings
+from app.core.database import Base, get_db, get_read_db
+from app.core.responses import FastJSONResponse
+from app.models.pitcher import Pitcher
+from app.models.pitch import Pitch
+from app.models.flags import refresh_pitch_flags
+from app.schemas.pitcher import PitchBase, PitcherBase
+from app.services.game_log import refresh_pitcher_games
+from app.services.search_index import search_index
+
+
+@pytest.fixture(scope="function")
+def client():
+    """Create test client with mock data."""
+    # Create SQLite test database
+    SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    # Create tables
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+
+    # Create test pitchers ("Last, First" like Statcast player_name)
+    pitchers = [
+        Pitcher(id=1, mlbam_id=660271, name="Ohtani, Shohei", team="LAD", throws="R", is_starter=True, is_active=True),
+        Pitcher(id=2, mlbam_id=662253, name="Muñoz, Andrés", team="SEA", throws="R", is_starter=False, is_active=True),
+        Pitcher(id=3, mlbam_id=543037, name="Cole, Gerrit", team="NYY", throws="R", is_starter=True, is_active=True),
+        Pitcher(id=4, mlbam_id=605400, name="Nola, Aaron", team="PHI", throws="R", is_starter=True, is_active=True),
+        Pitcher(id=5, mlbam_id=668678, name="Gallen, Zac", team="ARI", throws="R", is_starter=True, is_active=True),
+        Pitcher(id=6, mlbam_id=570632, name="Gallegos, Giovanny", team="STL", throws="R", is_starter=False, is_active=True),
+    ]
+    for p in pitchers:
+        db.add(p)
+    db.commit()
+
+    # Each at-bat is three pitches ending in one of these events
+    at_bat_events = ["strikeout", "single", "walk", "home_run", "grounded_into_double_play", "field_out"]
+
+    # Pitch volume: Gallegos throws more than Gallen so he ranks first for "gall"
+    pitch_counts = {1: 20, 2: 10, 3: 15, 4: 5, 5: 5, 6: 30}
+    for pitcher_id, count in pitch_counts.items():
+        for i in range(count):
+            db.add(Pitch(
+                pitcher_id=pitcher_id,
+                game_pk=5000 + i // 9,
+                game_date=date(2024, 6, 1 + i // 9),
+                game_year=2024,
+                pitch_type="FF" if i % 2 == 0 else "SL",
+                pitch_name="4-Seam Fastball" if i % 2 == 0 else "Slider",
+                release_speed=95.0 + (i % 4),
+                release_spin_rate=2300 + i,
+                pfx_x=5.0,
+                pfx_z=12.0,
+                type="S" if i % 3 else "B",
+                description="swinging_strike" if i % 3 == 1 else ("called_strike" if i % 3 == 2 else "ball"),
+                inning=1 + i // 6,
+                events=at_bat_events[(i // 3) % 6] if i % 3 == 2 else None,
+                at_bat_number=1 + i // 3,
+                pitch_number=1 + i % 3,
+            ))
+    db.commit()
+
+    refresh_pitch_flags(db)
+    refresh_pitcher_games(db)
+    db.close()
+
+    search_index.invalidate()
+
+    yield TestClient(app)
+
+    # Cleanup
+    Base.metadata.drop_all(bind=engine)
+    app.dependency_overrides.clear()
+    search_index.invalidate()
+
+
+class TestPitcherSearch:
+    """Test /api/pitchers/search endpoint."""
+
+    def test_search_by_prefix(self, client):
+        """Should match the start of any name token."""
+        response = client.get("/api/pitchers/search?q=ohta")
+        assert response.status_code == 200
+
+        results = response.json()
+        assert [r["name"] for r in results] == ["Ohtani, Shohei"]
+        assert set(results[0]) == {"id", "mlbam_id", "name", "team", "throws"}
+
+    def test_search_words_any_order(self, client):
+        """Should require every word to match, in any order."""
+        response = client.get("/api/pitchers/search?q=gerrit cole")
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()] == [3]
+
+    def test_search_folds_accents(self, client):
+        """Should match accented names with plain ASCII queries."""
+        response = client.get("/api/pitchers/search?q=andres munoz")
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()] == [2]
+
+    def test_search_tolerates_typos(self, client):
+        """Should fall back to trigram similarity when no prefix matches."""
+        response = client.get("/api/pitchers/search?q=otani")
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()] == [1]
+
+    def test_search_ranks_by_pitch_volume(self, client):
+        """Equally good matches should be ordered by recent pitch volume."""
+        response = client.get("/api/pitchers/search?q=gall")
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()] == [6, 5]
+
+    def test_search_exact_beats_prefix(self, client):
+        """An exact token match should outrank a prefix match."""
+        response = client.get("/api/pitchers/search?q=nola")
+        assert response.status_code == 200
+        assert response.json()[0]["id"] == 4
+
+    def test_search_respects_limit(self, client):
+        """Should return at most `limit` results."""
+        response = client.get("/api/pitchers/search?q=ra&limit=1")
+        assert response.status_code == 200
+        assert len(response.json()) <= 1
+
+    def test_search_sees_new_pitchers(self, client, monkeypatch):
+        """Index should pick up pitchers added after it was built."""
+        monkeypatch.setattr(settings, "search_index_refresh_seconds", 0)
+        assert client.get("/api/pitchers/search?q=skenes").json() == []
+
+        db = next(app.dependency_overrides[get_db]())
+        db.add(Pitcher(id=7, mlbam_id=694973, name="Skenes, Paul", team="PIT", throws="R"))
+        db.commit()
+        db.close()
+
+        results = client.get("/api/pitchers/search?q=skenes").json()
+        assert [r["id"] for r in results] == [7]
+
+    def test_search_sees_renames(self, client, monkeypatch):
+        """A rename or trade doesn't change the row count but must rebuild."""
+        monkeypatch.setattr(settings, "search_index_refresh_seconds", 0)
+        assert client.get("/api/pitchers/search?q=skenes").json() == []
+
+        db = next(app.dependency_overrides[get_db]())
+        pitcher = db.get(Pitcher, 6)
+        pitcher.name, pitcher.team = "Skenes, Paul", "PIT"
+        db.commit()
+        db.close()
+
+        results = client.get("/api/pitchers/search?q=skenes").json()
+        assert [(r["id"], r["team"]) for r in results] == [(6, "PIT")]
+
+    def test_search_during_rebuild(self, client):
+        """Searches racing a rebuild see a complete index, old or new."""
+        client.get("/api/pitchers/search?q=gall")
+        db = next(app.dependency_overrides[get_db]())
+        errors = []
+        done = threading.Event()
+
+        def search_repeatedly():
+            try:
+                while not done.is_set():
+                    assert len(search_index.search("gall")) == 2
+            except Exception as exc:  # noqa: BLE001 - reported below
+                errors.append(exc)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+        searcher = threading.Thread(target=search_repeatedly)
+        searcher.start()
+        try:
+            for _ in range(20):
+                search_index.rebuild(db)
+        finally:
+            done.set()
+            searcher.join()
+            sys.setswitchinterval(interval)
+            db.close()
+
+        assert errors == []
+
+
+class TestPitcherCompare:
+    """Test /api/pitchers/compare endpoint."""
+
+    def test_compare_returns_pitchers_in_request_order(self, client):
+        """Should return one entry per requested pitcher, in order."""
+        response = client.get("/api/pitchers/compare?ids=3,1,6")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [c["pitcher"]["id"] for c in data["pitchers"]] == [3, 1, 6]
+        assert data["year"] is None
+
+    def test_compare_matches_single_pitcher_stats(self, client):
+        """Each summary should equal the single-pitcher /stats response."""
+        data = client.get("/api/pitchers/compare?ids=1,2&year=2024").json()
+
+        for comparison in data["pitchers"]:
+            pitcher_id = comparison["pitcher"]["id"]
+            single = client.get(f"/api/pitchers/{pitcher_id}/stats?year=2024").json()
+            assert comparison["stats"] == single
+
+    def test_compare_year_without_data(self, client):
+        """Pitchers with no pitches in the season should have null stats."""
+        response = client.get("/api/pitchers/compare?ids=1,2&year=2019")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["year"] == 2019
+        assert all(c["stats"] is None for c in data["pitchers"])
+
+    def test_compare_unknown_pitcher(self, client):
+        """Should 404 when any pitcher does not exist."""
+        response = client.get("/api/pitchers/compare?ids=1,999")
+        assert response.status_code == 404
+
+    def test_compare_invalid_ids(self, client):
+        """Should reject malformed or too many IDs."""
+        assert client.get("/api/pitchers/compare?ids=1,abc").status_code == 400
+        assert client.get("/api/pitchers/compare?ids=1,2,3,4,5").status_code == 400
+
+
+class TestPitcherPitches:
+    """Test /api/pitchers/{id}/pitches endpoint."""
+
+    def test_pitches_decode_categorical_columns(self, client):
+        """Coded columns should come back as their Statcast strings."""
+        response = client.get("/api/pitchers/4/pitches")
+        assert response.status_code == 200
+
+        items = response.json()["items"]
+        assert {p["description"] for p in items} == {"ball", "swinging_strike", "called_strike"}
+        assert {p["pitch_name"] for p in items} == {"4-Seam Fastball", "Slider"}
+        assert {p["events"] for p in items} == {None, "strikeout"}
+
+    def test_pitches_filter_by_type(self, client):
+        """Should filter by pitch type."""
+        data = client.get("/api/pitchers/3/pitches?pitch_type=sl").json()
+        assert data["total"] == 7
+        assert all(p["pitch_type"] == "SL" for p in data["items"])
+
+    def test_pitches_match_schema(self, client):
+        """Rows are serialized directly but carry exactly the PitchBase fields."""
+        item = client.get("/api/pitchers/4/pitches").json()["items"][0]
+        assert set(item) == set(PitchBase.model_fields)
+        assert date.fromisoformat(item["game_date"])
+
+
+class TestFastJSONResponse:
+    def test_renders_dates_numpy_and_nan(self):
+        import numpy as np
+
+        body = FastJSONResponse({
+            "day": date(2024, 4, 1),
+            "values": np.array([1.5, 2.0]),
+            "n": np.int64(3),
+            "missing": float("nan"),
+        }).body
+        assert json.loads(body) == {"day": "2024-04-01", "values": [1.5, 2.0], "n": 3, "missing": None}
+
+    def test_falls_back_for_models(self):
+        body = FastJSONResponse({"pitcher": PitcherBase(mlbam_id=1, name="A")}).body
+        assert json.loads(body)["pitcher"]["name"] == "A"
+
+
+class TestPitcherGames:
+    """Test /api/pitchers/{id}/games endpoint."""
+
+    def test_game_log_lines(self, client):
+        """Should return a full pitching line per game, most recent first."""
+        response = client.get("/api/pitchers/3/games")
+        assert response.status_code == 200
+
+        games = response.json()
+        assert [g["game_pk"] for g in games] == [5001, 5000]
+
+        latest, first = games
+        # Game 5000: strikeout, single, walk
+        assert first["total_pitches"] == 9
+        assert first["outs"] == 1
+        assert first["innings_pitched"] == 0.1
+        assert first["batters_faced"] == 3
+        assert first["hits"] == 1
+        assert first["walks"] == 1
+        assert first["strikeouts"] == 1
+        assert first["home_runs"] == 0
+
+        # Game 5001: home run, double play
+        assert latest["total_pitches"] == 6
+        assert latest["outs"] == 2
+        assert latest["innings_pitched"] == 0.2
+        assert latest["hits"] == 1
+        assert latest["home_runs"] == 1
+        assert latest["batters_faced"] == 2
+
+    def test_game_log_pitch_mix(self, client):
+        """Pitch mix should account for every pitch in the game."""
+        games = client.get("/api/pitchers/3/games").json()
+        for game in games:
+            assert sum(game["pitch_mix"].values()) == game["total_pitches"]
+        assert games[1]["pitch_mix"] == {"FF": 5, "SL": 4}
+
+    def test_game_log_filters(self, client):
+        """Should respect year and limit filters."""
+        assert len(client.get("/api/pitchers/6/games?limit=2").json()) == 2
+        assert client.get("/api/pitchers/3/games?year=2023").json() == []
+
+    def test_game_log_unknown_pitcher(self, client):
+        """Should 404 for a missing pitcher."""
+        assert client.get("/api/pitchers/999/games").status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
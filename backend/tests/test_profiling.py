@@ -0,0 +1,172 @@
+"""Tests for on-demand request profiling and the admin profile routes."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.core.profiling import ProfileStore, ProfilingMiddleware, StackSampler
+
+TESTS_DIR = str(Path(__file__).resolve().parent)
+
+
+def spin_for_profile(seconds: float):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(tmp_path / "profiles")
+
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture(autouse=True)
+def admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+
+@pytest.fixture
+def profiled_client(store):
+    """A sync route (run in the threadpool) behind the profiling middleware."""
+    api = FastAPI()
+
+    @api.get("/busy")
+    def busy():
+        spin_for_profile(0.05)
+        return {"done": True}
+
+    # Keep stacks from this file, as the app keeps stacks from app/
+    return TestClient(ProfilingMiddleware(api, store=store, interval_ms=0.5, include=TESTS_DIR), headers=ADMIN)
+
+
+class TestStackSampler:
+    def test_samples_other_threads(self):
+        worker = threading.Thread(target=spin_for_profile, args=(0.1,), name="busy-worker")
+        with StackSampler(0.001) as sampler:
+            worker.start()
+            worker.join()
+
+        folded = sampler.to_folded()
+        assert sampler.sample_count > 10
+        lines = [line for line in folded.splitlines() if "spin_for_profile" in line]
+        assert lines
+        assert all(line.startswith("busy-worker;") for line in lines)
+
+    def test_include_filters_stacks(self):
+        with StackSampler(0.001, include="/nonexistent/") as sampler:
+            spin_for_profile(0.02)
+
+        assert sampler.samples == {}
+
+    def test_formats(self):
+        with StackSampler(0.001) as sampler:
+            spin_for_profile(0.05)
+
+        svg = sampler.to_svg("busy")
+        assert svg.startswith("<svg") and svg.endswith("</svg>")
+        assert "spin_for_profile (tests/test_profiling.py:" in svg
+
+        speedscope = json.loads(sampler.to_speedscope("busy"))
+        profile = speedscope["profiles"][0]
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        frame_names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+        assert {"MainThread", "spin_for_profile"} <= frame_names
+
+
+class TestProfilingMiddleware:
+    def test_not_profiled_by_default(self, profiled_client, store):
+        response = profiled_client.get("/busy")
+
+        assert response.status_code == 200
+        assert "x-profile" not in response.headers
+        assert store.list() == []
+
+    def test_query_param_saves_flame_graph(self, profiled_client, store):
+        response = profiled_client.get("/busy?profile=svg")
+
+        assert response.json() == {"done": True}
+        name = response.headers["x-profile"]
+        assert name.endswith(".svg")
+        assert response.headers["cache-control"] == "no-store"
+        # The handler ran in a threadpool worker and still shows up
+        assert "spin_for_profile" in store.path(name).read_text()
+
+    def test_view_returns_flame_graph(self, profiled_client, store):
+        response = profiled_client.get("/busy", headers={"X-Profile": "view"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert response.text.startswith("<svg")
+        assert store.path(response.headers["x-profile"]) is not None
+
+    def test_speedscope_and_folded(self, profiled_client, store):
+        speedscope = profiled_client.get("/busy?profile=speedscope").headers["x-profile"]
+        folded = profiled_client.get("/busy?profile=folded").headers["x-profile"]
+
+        assert json.loads(store.path(speedscope).read_text())["profiles"]
+        assert "spin_for_profile" in store.path(folded).read_text()
+
+    def test_unknown_format_is_ignored(self, profiled_client, store):
+        response = profiled_client.get("/busy?profile=pdf")
+
+        assert "x-profile" not in response.headers
+        assert store.list() == []
+
+    def test_requires_admin_token(self, profiled_client):
+        response = profiled_client.get("/busy?profile=svg", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code == 403
+
+    def test_ignored_without_admin_token(self, profiled_client, store, monkeypatch):
+        """Fail closed: with no configured token the switch does nothing."""
+        monkeypatch.setattr(settings, "admin_token", "")
+
+        response = profiled_client.get("/busy?profile=view")
+        assert response.json() == {"done": True}
+        assert "x-profile" not in response.headers
+        assert store.list() == []
+
+    def test_keeps_newest_profiles(self, tmp_path):
+        store = ProfileStore(tmp_path, keep=2)
+        for i in range(3):
+            store.save(f"2024010{i}T000000000-GET-x.svg", "<svg/>")
+
+        assert [entry["name"] for entry in store.list()] == [
+            "20240102T000000000-GET-x.svg",
+            "20240101T000000000-GET-x.svg",
+        ]
+
+
+class TestProfileRoutes:
+    @pytest.fixture
+    def client(self, store, monkeypatch):
+        monkeypatch.setattr("app.api.routes.admin.profile_store", store)
+        return TestClient(app, headers=ADMIN)
+
+    def test_list_and_get(self, client, store):
+        store.save("20240101T000000000-GET-api-pitchers.svg", "<svg/>")
+
+        listing = client.get("/api/admin/profiles").json()
+        assert [entry["name"] for entry in listing["profiles"]] == ["20240101T000000000-GET-api-pitchers.svg"]
+
+        response = client.get("/api/admin/profiles/20240101T000000000-GET-api-pitchers.svg")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert response.text == "<svg/>"
+
+    def test_unknown_profile(self, client):
+        assert client.get("/api/admin/profiles/missing.svg").status_code == 404
+        assert client.get("/api/admin/profiles/..%2Fdata_version").status_code == 404
+
+    def test_requires_admin_token(self, client):
+        assert client.get("/api/admin/profiles", headers={"X-Admin-Token": "wrong"}).status_code == 403
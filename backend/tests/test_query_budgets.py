@@ -0,0 +1,212 @@
+"""SQL statement budgets per API route and for the aggregation scripts.
+
+Runs against a small synthetic database (scripts/synthetic_statcast.py), so
+every route has real data to work on. A route going over its budget almost
+always means a per-row query crept in; the failure message lists the
+statements it ran.
+"""
+
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core import http_cache
+from app.core.database import create_db_engine, get_db, get_read_db
+from app.models import Pitcher
+from app.services.search_index import search_index
+from scripts.synthetic_statcast import SyntheticStatcast, build_database
+
+SYNTHETIC_PITCHES = 4000
+
+# route -> (URL, statement budget). {pitcher_id} and {ids} are filled in
+# from the synthetic data.
+ROUTE_BUDGETS = {
+    "health": ("/health", 0),
+    "pitchers_list": ("/api/pitchers?is_active=true", 2),
+    "pitchers_search": ("/api/pitchers/search?q=cole", 1),
+    "pitchers_compare": ("/api/pitchers/compare?ids={ids}", 4),
+    "pitcher_detail": ("/api/pitchers/{pitcher_id}", 2),
+    "pitcher_pitches": ("/api/pitchers/{pitcher_id}/pitches", 3),
+    "pitcher_stats": ("/api/pitchers/{pitcher_id}/stats", 2),
+    "pitcher_games": ("/api/pitchers/{pitcher_id}/games", 2),
+    "leaderboard": ("/api/leaderboards?stat=velocity&min_pitches=100", 2),
+    "leaderboard_strikeouts": ("/api/leaderboards?stat=strikeout_pct&min_pitches=100", 2),
+    "leaderboard_stats": ("/api/leaderboards/stats", 0),
+    "discover_stats": ("/api/discover/stats", 0),
+    "discover_correlations": ("/api/discover/correlations?stat_x=avg_velocity&stat_y=era&min_innings=0", 1),
+    "discover_correlation_rankings": ("/api/discover/correlation-rankings?target_stat=era&min_innings=0", 2),
+    "discover_stickiness": ("/api/discover/stickiness?min_innings=0", 1),
+    "discover_predictive": ("/api/discover/predictive?min_innings=0", 1),
+    "discover_trends": ("/api/discover/trends?stat_x=whiff_pct&stat_y=k_per_9&min_innings=0", 2),
+    "stats_database": ("/api/stats/database", 6),
+}
+
+
+class StatementCounter:
+    """Collect the SQL statements an engine executes inside a with block."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "after_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "after_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def selects(self, table: str = "") -> list[str]:
+        return [
+            s for s in self.statements
+            if s.lstrip().upper().startswith(("SELECT", "WITH")) and f"FROM {table}" in s
+        ]
+
+    def report(self) -> str:
+        return "\n\n".join(f"[{i}] {s.strip()}" for i, s in enumerate(self.statements, 1))
+
+
+@pytest.fixture(scope="module")
+def synthetic_db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("synthetic") / "synthetic.db"
+    build_database(path, SYNTHETIC_PITCHES, seed=7)
+    return path
+
+
+@pytest.fixture(scope="module")
+def engine(synthetic_db):
+    engine = create_db_engine(f"sqlite:///{synthetic_db.as_posix()}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "data_version", http_cache.DataVersion(tmp_path / "data_version"))
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    search_index.invalidate()
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+    search_index.invalidate()
+
+
+@pytest.fixture(scope="module")
+def url_params(engine):
+    db = sessionmaker(bind=engine)()
+    starters = db.query(Pitcher.id).filter(Pitcher.is_starter.is_(True)).order_by(Pitcher.id).limit(4).all()
+    db.close()
+    return {"pitcher_id": starters[0].id, "ids": ",".join(str(row.id) for row in starters)}
+
+
+class TestRouteBudgets:
+    @pytest.mark.parametrize("route", list(ROUTE_BUDGETS))
+    def test_route_within_budget(self, client, engine, url_params, route):
+        url, budget = ROUTE_BUDGETS[route]
+        url = url.format(**url_params)
+        if route == "pitchers_search":
+            client.get(url)  # the first search builds the in-memory index
+
+        with StatementCounter(engine) as counter:
+            response = client.get(url)
+
+        assert response.status_code == 200, response.text
+        assert counter.count <= budget, (
+            f"{url} ran {counter.count} statements (budget {budget}):\n\n{counter.report()}"
+        )
+
+    def test_compare_does_not_grow_with_pitchers(self, client, engine, url_params):
+        first_id = url_params["ids"].split(",")[0]
+        counts = []
+        for ids in (first_id, url_params["ids"]):
+            with StatementCounter(engine) as counter:
+                assert client.get(f"/api/pitchers/compare?ids={ids}").status_code == 200
+            counts.append(counter.count)
+
+        assert counts[0] == counts[1]
+
+    def test_revalidation_runs_no_statements(self, client, engine, url_params):
+        url = f"/api/pitchers/{url_params['pitcher_id']}/stats"
+        etag = client.get(url).headers["etag"]
+
+        with StatementCounter(engine) as counter:
+            response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert counter.count == 0
+
+
+class TestScriptBudgets:
+    """Script queries must not scale with the number of pitchers or games."""
+
+    @pytest.fixture
+    def work_engine(self, synthetic_db, tmp_path, monkeypatch):
+        monkeypatch.setattr(http_cache, "data_version", http_cache.DataVersion(tmp_path / "data_version"))
+        path = tmp_path / "work.db"
+        shutil.copyfile(synthetic_db, path)
+        engine = create_db_engine(f"sqlite:///{path.as_posix()}")
+        yield engine
+        engine.dispose()
+
+    def test_populate_season_stats(self, work_engine):
+        from app.models.season_stats import SeasonStats
+        from scripts.populate_season_stats import populate_season_stats
+
+        session = sessionmaker(bind=work_engine)()
+        pitcher_years = session.query(SeasonStats).count()
+        with StatementCounter(work_engine) as counter:
+            populate_season_stats(session)
+        session.close()
+
+        assert pitcher_years > 50
+        # The grouped aggregate, the existing rows, and the moments rebuild
+        assert len(counter.selects()) <= 3, counter.report()
+
+    def test_aggregate_year(self, work_engine, monkeypatch):
+        from scripts import aggregate_season_stats
+
+        monkeypatch.setattr(aggregate_season_stats, "fetch_fangraphs_stats", lambda year: {})
+        session = sessionmaker(bind=work_engine)()
+        with StatementCounter(work_engine) as counter:
+            aggregate_season_stats.aggregate_year(session, 2024)
+        session.close()
+
+        assert len(counter.selects("season_stats")) == 1, counter.report()
+
+    def test_loader_looks_up_games_once(self, work_engine, monkeypatch):
+        import pybaseball
+
+        from scripts.load_statcast import load_statcast_range
+
+        frame = SyntheticStatcast(2000, seasons=[2025], seed=3).statcast()
+        monkeypatch.setattr(pybaseball, "statcast", lambda start_dt, end_dt: frame)
+        session = sessionmaker(bind=work_engine)()
+        with StatementCounter(work_engine) as counter:
+            loaded = load_statcast_range("2025-04-01", "2025-09-30", session)
+        session.close()
+
+        assert loaded == len(frame)
+        assert frame["game_pk"].nunique() > 5
+        assert len(counter.selects("games")) == 1, counter.report()
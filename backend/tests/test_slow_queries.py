@@ -0,0 +1,127 @@
+"""Tests for the slow-query log and its admin endpoint."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.config import settings
+from app.core.database import Base, get_db, get_read_db
+from app.core.slow_queries import explain_prefix, slow_query_log
+from app.models.pitch import Pitch
+from app.models.pitcher import Pitcher
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def record_everything(monkeypatch):
+    """Treat every statement as slow."""
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 1e-6)
+    slow_query_log.clear()
+    yield slow_query_log
+    slow_query_log.clear()
+
+
+@pytest.fixture
+def client(engine):
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(Pitcher(id=1, mlbam_id=543037, name="Gerrit Cole", team="NYY", throws="R", is_starter=True, is_active=True))
+    db.add(Pitch(pitcher_id=1, game_pk=7000, game_date=date(2024, 6, 1), game_year=2024, pitch_type="FF"))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestRecorder:
+    def test_disabled_by_default(self, engine):
+        slow_query_log.clear()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert slow_query_log.threshold_ms == settings.slow_query_ms == 0
+        assert slow_query_log.entries() == []
+
+    def test_records_statement_parameters_and_plan(self, engine, record_everything):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT * FROM pitches WHERE pitcher_id = :id"), {"id": 42})
+
+        entry = record_everything.entries()[0]
+        assert entry["statement"] == "SELECT * FROM pitches WHERE pitcher_id = ?"
+        assert entry["parameters"] == "(42,)"
+        assert entry["database"] == "sqlite"
+        assert any("pitches" in line for line in entry["plan"])
+
+    def test_ring_buffer_keeps_newest(self, engine, record_everything, monkeypatch):
+        from collections import deque
+
+        monkeypatch.setattr(record_everything, "_entries", deque(maxlen=2))
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text(f"SELECT {i}"))
+
+        assert [entry["statement"] for entry in record_everything.entries()] == ["SELECT 2", "SELECT 1"]
+
+    def test_explain_prefix(self):
+        assert explain_prefix("sqlite", "SELECT 1") == "EXPLAIN QUERY PLAN "
+        assert explain_prefix("postgresql", " select 1") == "EXPLAIN (ANALYZE, BUFFERS) "
+        # Writes are never re-executed by EXPLAIN ANALYZE
+        assert explain_prefix("postgresql", "UPDATE pitchers SET team = 'NYY'") == "EXPLAIN "
+        assert explain_prefix("sqlite", "PRAGMA journal_mode") is None
+
+
+class TestAdminEndpoint:
+    ADMIN = {"X-Admin-Token": "secret"}
+
+    @pytest.fixture(autouse=True)
+    def admin_token(self, monkeypatch):
+        monkeypatch.setattr(settings, "admin_token", "secret")
+
+    def test_lists_queries_from_requests(self, client, record_everything):
+        client.get("/api/pitchers/1/pitches")
+
+        data = client.get("/api/admin/slow-queries", headers=self.ADMIN).json()
+        assert data["enabled"] is True
+        assert any("FROM pitches" in entry["statement"] for entry in data["entries"])
+
+    def test_clear(self, client, record_everything):
+        client.get("/api/pitchers/1")
+        assert client.delete("/api/admin/slow-queries", headers=self.ADMIN).status_code == 204
+        assert client.get("/api/admin/slow-queries", headers=self.ADMIN).json()["entries"] == []
+
+    def test_admin_token(self, client):
+        assert client.get("/api/admin/slow-queries").status_code == 403
+        assert client.get("/api/admin/slow-queries", headers={"X-Admin-Token": "wrong"}).status_code == 403
+        response = client.get("/api/admin/slow-queries", headers=self.ADMIN)
+        assert response.status_code == 200
+
+    def test_disabled_without_admin_token(self, client, monkeypatch):
+        """Fail closed: no configured token, no admin routes."""
+        monkeypatch.setattr(settings, "admin_token", "")
+        assert client.get("/api/admin/slow-queries").status_code == 404
+        assert client.delete("/api/admin/slow-queries").status_code == 404
+        assert client.get("/api/admin/slow-queries", headers={"X-Admin-Token": ""}).status_code == 404
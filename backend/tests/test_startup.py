@@ -0,0 +1,54 @@
+"""Keep heavy dependencies out of the API's import graph.
+
+Importing app.main must not pull in the analytics stack; those modules are
+imported on first use. This is checked structurally (which modules a fresh
+interpreter has loaded), so it doesn't depend on how fast the machine is.
+Set IMPORT_BUDGET_SECONDS to also check `python -X importtime` against a
+wall-clock budget (~0.7s locally; importing scipy.stats used to add over a
+second).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Only imported on first use, never by `import app.main`
+DEFERRED_MODULES = ["scipy", "numpy", "pandas", "pybaseball", "duckdb", "alembic"]
+
+IMPORT_BUDGET_SECONDS = os.environ.get("IMPORT_BUDGET_SECONDS")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def imported_packages():
+    """Top-level packages loaded by `import app.main` in a fresh interpreter."""
+    result = run_python("-c", "import sys, app.main; print('\\n'.join(sys.modules))")
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_heavy_module_is_deferred(imported_packages, module):
+    assert module not in imported_packages
+
+
+@pytest.mark.skipif(not IMPORT_BUDGET_SECONDS, reason="set IMPORT_BUDGET_SECONDS to time the import")
+def test_import_within_budget():
+    result = run_python("-X", "importtime", "-c", "import app.main")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    assert times["app.main"] / 1e6 < float(IMPORT_BUDGET_SECONDS)
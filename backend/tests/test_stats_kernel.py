@@ -0,0 +1,71 @@
+"""Parity tests for the NumPy statistics kernel against scipy.stats."""
+
+import numpy as np
+import pytest
+
+from app.services.stats_kernel import moments, regress, regression, t_test_p_value
+
+stats = pytest.importorskip("scipy.stats")
+
+
+def correlated(rng, n, rho, loc=2400.0, scale=150.0):
+    """x and y with correlation rho, at Statcast-like magnitudes."""
+    x = rng.normal(size=n)
+    y = rho * x + np.sqrt(1 - rho ** 2) * rng.normal(size=n)
+    return loc + scale * x, 90.0 + 3.0 * y
+
+
+@pytest.mark.parametrize("n", [3, 4, 10, 50, 400, 5000])
+@pytest.mark.parametrize("rho", [0.0, 0.2, -0.6, 0.95, 0.9999])
+def test_regress_matches_linregress(n, rho):
+    x, y = correlated(np.random.default_rng(n), n, rho)
+    fit = regress(x, y)
+    expected = stats.linregress(x, y)
+
+    assert fit["n"] == n
+    assert fit["r"] == pytest.approx(expected.rvalue, rel=1e-7, abs=1e-10)
+    assert fit["r_squared"] == pytest.approx(expected.rvalue ** 2, rel=1e-7, abs=1e-10)
+    assert fit["slope"] == pytest.approx(expected.slope, rel=1e-7, abs=1e-10)
+    assert fit["intercept"] == pytest.approx(expected.intercept, rel=1e-7)
+    assert fit["stderr"] == pytest.approx(expected.stderr, rel=1e-7)
+    assert fit["intercept_stderr"] == pytest.approx(expected.intercept_stderr, rel=1e-7)
+    assert fit["p_value"] == pytest.approx(expected.pvalue, rel=1e-6, abs=1e-300)
+    assert fit["p_value"] == pytest.approx(stats.pearsonr(x, y)[1], rel=1e-6, abs=1e-300)
+
+
+def test_many_columns_match_pairwise():
+    """Each column is fit on its own complete rows, as separate scipy calls would."""
+    rng = np.random.default_rng(11)
+    target = rng.normal(4.0, 1.0, 300)
+    columns = np.column_stack([target * k + rng.normal(size=300) for k in (0.1, -2.0, 0.0, 5.0)])
+    columns[rng.random(columns.shape) < 0.15] = np.nan
+    target[rng.random(300) < 0.05] = np.nan
+
+    fit = regression(moments(columns, target))
+
+    for i in range(columns.shape[1]):
+        valid = ~(np.isnan(columns[:, i]) | np.isnan(target))
+        r, p_value = stats.pearsonr(columns[valid, i], target[valid])
+        assert fit["n"][i] == valid.sum()
+        assert fit["r"][i] == pytest.approx(r, rel=1e-9)
+        assert fit["p_value"][i] == pytest.approx(p_value, rel=1e-6, abs=1e-300)
+
+
+def test_none_is_missing():
+    fit = regress([1.0, 2.0, None, 4.0, 5.0], [2.1, 3.9, 6.0, None, 10.2])
+    expected = stats.linregress([1.0, 2.0, 5.0], [2.1, 3.9, 10.2])
+    assert fit["n"] == 3
+    assert fit["slope"] == pytest.approx(expected.slope)
+
+
+def test_degenerate_inputs():
+    assert regress([1, 2, 3], [2, 4, 6])["r"] == pytest.approx(1.0)
+    assert regress([1, 2, 3], [2, 4, 6])["p_value"] == 0.0
+    assert np.isnan(regress([5, 5, 5], [1, 2, 3])["r"])
+    assert np.isnan(regress([1], [2])["p_value"])
+
+
+@pytest.mark.parametrize("df", [1, 2, 5, 30, 1000])
+def test_t_test_p_value(df):
+    t = np.array([0.0, 0.5, 1.96, -3.0, 12.0])
+    assert t_test_p_value(t, df) == pytest.approx(2 * stats.t.sf(np.abs(t), df), rel=1e-9, abs=1e-300)
@@ -44,6 +44,8 @@ export function GameLogTable({ pitcherId, year, limit = 30 }: GameLogProps) {
             <th className="text-left py-3 px-2 text-gray-400 font-medium">Date</th>
             <th className="text-right py-3 px-2 text-gray-400 font-medium">Pitches</th>
             <th className="text-right py-3 px-2 text-gray-400 font-medium">IP</th>
+            <th className="text-right py-3 px-2 text-gray-400 font-medium">H</th>
+            <th className="text-right py-3 px-2 text-gray-400 font-medium">HR</th>
             <th className="text-right py-3 px-2 text-gray-400 font-medium">Velo</th>
             <th className="text-right py-3 px-2 text-gray-400 font-medium">K</th>
             <th className="text-right py-3 px-2 text-gray-400 font-medium">BB</th>
@@ -65,6 +67,12 @@ export function GameLogTable({ pitcherId, year, limit = 30 }: GameLogProps) {
               <td className="py-2 px-2 text-right text-gray-300">
                 {game.innings_pitched}
               </td>
+              <td className="py-2 px-2 text-right text-gray-300">
+                {game.hits}
+              </td>
+              <td className="py-2 px-2 text-right text-gray-300">
+                {game.home_runs}
+              </td>
               <td className="py-2 px-2 text-right text-gray-300">
                 {game.avg_velocity ? `${game.avg_velocity}` : "—"}
               </td>
@@ -48,6 +48,18 @@ export function usePitcher(id: number | null) {
   });
 }
 
+/**
+ * Hook to compare several pitchers side by side.
+ */
+export function usePitcherComparison(ids: number[], year?: number) {
+  return useQuery({
+    queryKey: ["pitchers", "compare", ids, year],
+    queryFn: () => pitchersApi.compare(ids, year),
+    enabled: ids.length > 0,
+    staleTime: 1000 * 60 * 5, // 5 minutes
+  });
+}
+
 /**
  * Hook to get pitcher stats.
  */
@@ -7,6 +7,7 @@ import type {
   PitcherSearchResult,
   PitcherDetail,
   PitcherSeasonStats,
+  PitcherCompareResponse,
   Pitch,
   GameLog,
   PaginatedResponse,
@@ -23,14 +24,19 @@ const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
 /**
  * Generic fetch wrapper with error handling.
+ *
+ * GETs always revalidate with the browser's cached ETag: the API answers
+ * with an empty 304 until new data is loaded. Only requests with a body
+ * send a Content-Type, so plain GETs skip the CORS preflight.
  */
 async function fetchApi<T>(endpoint: string, options?: RequestInit): Promise<T> {
   const url = `${API_BASE}${endpoint}`;
 
   const response = await fetch(url, {
+    cache: "no-cache",
     ...options,
     headers: {
-      "Content-Type": "application/json",
+      ...(options?.body ? { "Content-Type": "application/json" } : {}),
       ...options?.headers,
     },
   });
@@ -75,6 +81,17 @@ export const pitchersApi = {
     return fetchApi(`/api/pitchers/search?q=${encodeURIComponent(query)}&limit=${limit}`);
   },
 
+  /**
+   * Get season summaries for several pitchers in one request (Compare page).
+   */
+  compare: (ids: number[], year?: number): Promise<PitcherCompareResponse> => {
+    const searchParams = new URLSearchParams();
+    searchParams.set("ids", ids.join(","));
+    if (year) searchParams.set("year", year.toString());
+
+    return fetchApi(`/api/pitchers/compare?${searchParams}`);
+  },
+
   /**
    * Get single pitcher details.
    */
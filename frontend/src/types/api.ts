@@ -57,6 +57,16 @@ export interface PitcherSeasonStats {
   pitch_types: PitchTypeStats[];
 }
 
+export interface PitcherComparison {
+  pitcher: Pitcher;
+  stats?: PitcherSeasonStats;
+}
+
+export interface PitcherCompareResponse {
+  year?: number;
+  pitchers: PitcherComparison[];
+}
+
 export interface Pitch {
   id: number;
   game_pk: number;
@@ -87,11 +97,17 @@ export interface GameLog {
   date: string;
   total_pitches: number;
   innings_pitched: number;
+  outs: number;
+  batters_faced: number;
+  hits: number;
+  home_runs: number;
+  walks: number;
+  hit_by_pitch: number;
+  strikeouts: number;
   avg_velocity?: number;
   strikes: number;
   whiffs: number;
-  strikeouts: number;
-  walks: number;
+  pitch_mix: Record<string, number>;
 }
 
 export interface PaginatedResponse<T> {
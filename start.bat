@@ -1,8 +1,8 @@
 @echo off
 echo Starting MLB Pitch Analytics App...
 
-:: Start backend in background (hidden)
-start /B cmd /c "cd /d %~dp0backend && python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 > nul 2>&1"
+:: Upgrade the database schema, then start backend in background (hidden)
+start /B cmd /c "cd /d %~dp0backend && python -m alembic upgrade head && python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 > nul 2>&1"
 
 :: Wait a moment for backend to initialize
 timeout /t 2 /nobreak > nul